@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+"""
+Compare the import cost of Python checkers located in many folders.
+
+* `sys.path`: the folder of each checker is appended to `sys.path` and the checker is imported by name.
+* `importlib`: the checker is imported from its file by `import_checker_module`.
+
+For each number of folders the time of importing all checkers and the time of importing 20 other
+modules afterwards are printed. With `sys.path` both times grow with the number of folders, because
+every import searches all folders.
+
+Usage: python3 benchmarks/bench_checker_import.py [--folders 10 100 1000]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+from pathlib import Path
+
+
+_BENCHMARK = """
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, {root!r})
+from modules.check.check_list_py import import_checker_module
+
+paths = [Path(path) for path in {paths!r}]
+start = time.perf_counter()
+for path in paths:
+    if {mode!r} == "sys.path":
+        sys.path.append(str(path.parent))
+        __import__(path.stem)
+    else:
+        import_checker_module(path)
+checkers_time = time.perf_counter() - start
+
+sys.path.append({other_folder!r})
+start = time.perf_counter()
+for index in range(20):
+    __import__(f"other_module_{{index}}")
+other_time = time.perf_counter() - start
+print(f"{{checkers_time:.4f}} {{other_time:.4f}}")
+"""
+
+
+def _create_checkers(folder: Path, count: int):
+    paths = []
+    for index in range(count):
+        checker_folder = folder / f"checkers_{index}"
+        checker_folder.mkdir()
+        path = checker_folder / f"bench_checker_{index}.py"
+        path.write_text("def get_api_version():\n    return \"0.2\"\n")
+        paths.append(str(path))
+    return paths
+
+
+def _create_other_modules(folder: Path):
+    folder.mkdir()
+    for index in range(20):
+        (folder / f"other_module_{index}.py").write_text("VALUE = 0\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the import of Python checkers.")
+    parser.add_argument("--folders", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Numbers of checker folders.")
+    args = parser.parse_args()
+
+    root = str(Path(__file__).resolve().parent.parent)
+    print(f"{'folders':>8} {'mode':>9} {'checkers, s':>12} {'20 other imports, s':>20}")
+    for count in args.folders:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = _create_checkers(Path(temp_dir), count)
+            other_folder = Path(temp_dir) / "other"
+            _create_other_modules(other_folder)
+            for mode in ["sys.path", "importlib"]:
+                code = _BENCHMARK.format(root=root, paths=paths, mode=mode, other_folder=str(other_folder))
+                output = subprocess.run(
+                    [sys.executable, "-c", code], stdout=subprocess.PIPE, check=True,
+                    encoding="utf-8", env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1")).stdout.split()
+                print(f"{count:>8} {mode:>9} {output[0]:>12} {output[1]:>20}")
+
+
+if __name__ == "__main__":
+    main()
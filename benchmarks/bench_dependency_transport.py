@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+"""
+Compare transports of the dependency data from the parent process to the worker processes.
+
+* `pickled data`: the dependency data is pickled for each dependent check, it is the transport used
+  before `ResultStore`.
+* `result store`: each result is written once to the `ResultStore` file and only `StoredResults`
+  with the offsets of the results is pickled for each dependent check.
+
+Each dependent check requires a large device dump like result and a small result, and reads only
+the large one. The number of bytes sent to all dependent checks, the CPU time the parent spends
+to send them and the CPU time a worker spends to read the data are printed.
+
+Usage: python3 benchmarks/bench_dependency_transport.py [--devices 100 1000] [--dependents 4] [--repeat 5]
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.check.result_store import ResultStore  # noqa: E402
+
+
+def create_devices_tree(devices: int) -> Dict:
+    result: Dict = {}
+    for device in range(devices):
+        properties = {
+            f"Property {index}": {
+                "CheckResult": f"Value {index} of the device {device}",
+                "CheckStatus": "INFO",
+                "Verbosity": 2
+            }
+            for index in range(50)
+        }
+        result[f"Device # {device}"] = {"CheckResult": properties, "CheckStatus": "PASS", "Verbosity": 1}
+    return {"CheckResult": {"Devices": {"CheckResult": result, "CheckStatus": "PASS"}}}
+
+
+def send_pickled_data(results: Dict, dependents: int) -> List[bytes]:
+    return [pickle.dumps(results, protocol=pickle.HIGHEST_PROTOCOL) for _ in range(dependents)]
+
+
+def send_stored_results(store: ResultStore, results: Dict, dependents: int) -> List[bytes]:
+    for name, result_tree in results.items():
+        store.put(name, result_tree)
+    return [pickle.dumps(store.view(results), protocol=pickle.HIGHEST_PROTOCOL) for _ in range(dependents)]
+
+
+def send_to_new_store(results: Dict, dependents: int) -> None:
+    with ResultStore() as store:
+        send_stored_results(store, results, dependents)
+
+
+def read_device(payload: bytes) -> None:
+    data = pickle.loads(payload)
+    data["gpu_backend_check"]["CheckResult"]["Devices"]["CheckResult"]["Device # 0"]
+    if hasattr(data, "close"):
+        data.close()
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        function()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def compare(devices: int, dependents: int, repeat: int) -> List[Tuple[str, int, float, float]]:
+    results = {
+        "gpu_backend_check": create_devices_tree(devices),
+        "base_system_check": {"CheckResult": {"CPU": {"CheckResult": "Found", "CheckStatus": "INFO"}}}
+    }
+    rows = []
+    payloads = send_pickled_data(results, dependents)
+    rows.append((
+        "pickled data",
+        sum(len(payload) for payload in payloads),
+        measure(lambda: send_pickled_data(results, dependents), repeat),
+        measure(lambda: read_device(payloads[0]), repeat)
+    ))
+    with ResultStore() as store:
+        payloads = send_stored_results(store, results, dependents)
+        parent_time = measure(lambda: send_to_new_store(results, dependents), repeat)
+        rows.append((
+            "result store",
+            os.path.getsize(store.path) + sum(len(payload) for payload in payloads),
+            parent_time,
+            measure(lambda: read_device(payloads[0]), repeat)
+        ))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare transports of the dependency data.")
+    parser.add_argument("--devices", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--dependents", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'devices':>8} {'transport':<14} {'bytes':>12} {'parent cpu':>12} {'worker cpu':>12}")
+    for devices in args.devices:
+        for name, size, parent_time, worker_time in compare(devices, args.dependents, args.repeat):
+            parent_cpu = f"{parent_time * 1000:.2f} ms"
+            worker_cpu = f"{worker_time * 1000:.2f} ms"
+            print(f"{devices:>8} {name:<14} {size:>12} {parent_cpu:>12} {worker_cpu:>12}")
+
+
+if __name__ == "__main__":
+    main()
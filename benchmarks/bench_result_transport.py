@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+"""
+Compare transports of check results from the worker process to the parent process.
+
+* `indented json`: the checker creates the summary from `json.dumps(result, indent=4)`, the text is sent
+  and the parent parses and validates it again.
+* `compact json`: the compact JSON text is sent, the parent parses and validates it.
+* `pickled tree`: the summary is pickled with its native result tree only, it is the transport
+  used by the check runner.
+
+For each size of a device dump like result tree the number of bytes sent and the CPU time the parent
+spends to decode the result are printed.
+
+Usage: python3 benchmarks/bench_result_transport.py [--devices 10 100 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from typing import Callable, Dict, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.check.check import CheckSummary  # noqa: E402
+from modules.check.check_runner import _receive_result, _send_result  # noqa: E402
+
+
+class _Connection:
+    # Keeps the sent bytes instead of writing them to a pipe
+    def __init__(self) -> None:
+        self.payload = b""
+
+    def send_bytes(self, payload: bytes) -> None:
+        self.payload = payload
+
+    def recv_bytes(self) -> bytes:
+        return self.payload
+
+
+def create_devices_tree(devices: int) -> Dict:
+    result: Dict = {}
+    for device in range(devices):
+        properties = {
+            f"Property {index}": {
+                "CheckResult": f"Value {index} of the device {device}",
+                "CheckStatus": "INFO",
+                "Verbosity": 2
+            }
+            for index in range(50)
+        }
+        result[f"Device {device}"] = {"CheckResult": properties, "CheckStatus": "PASS", "Verbosity": 1}
+    return {"CheckResult": {"Devices": {"CheckResult": result, "CheckStatus": "PASS", "Verbosity": 0}}}
+
+
+def encode_json(tree: Dict, indent: bool) -> bytes:
+    return json.dumps(tree, indent=4 if indent else None, separators=None if indent else (",", ":")).encode()
+
+
+def encode_pickle(tree: Dict) -> bytes:
+    connection = _Connection()
+    _send_result(connection, CheckSummary(result_tree=tree))
+    return connection.payload
+
+
+def decode_json(payload: bytes) -> CheckSummary:
+    return CheckSummary(result=payload.decode())
+
+
+def decode_pickle(payload: bytes) -> CheckSummary:
+    connection = _Connection()
+    connection.payload = payload
+    return _receive_result(connection)
+
+
+def measure(decode: Callable[[bytes], CheckSummary], payload: bytes, repeat: int) -> Tuple[int, str]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        decode(payload)
+        best = min(best, time.process_time() - start)
+    return len(payload), f"{best * 1000:.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare transports of check results.")
+    parser.add_argument("--devices", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'devices':>8} {'transport':<14} {'bytes':>12} {'parent cpu':>12}")
+    for devices in args.devices:
+        tree = create_devices_tree(devices)
+        transports = [
+            ("indented json", decode_json, encode_json(tree, indent=True)),
+            ("compact json", decode_json, encode_json(tree, indent=False)),
+            ("pickled tree", decode_pickle, encode_pickle(tree))
+        ]
+        for name, decode, payload in transports:
+            size, cpu_time = measure(decode, payload, args.repeat)
+            print(f"{devices:>8} {name:<14} {size:>12} {cpu_time:>12}")
+
+
+if __name__ == "__main__":
+    main()
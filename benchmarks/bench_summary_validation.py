@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+"""
+Compare the cost of validation of result trees of checks.
+
+* `recursive`: the previous recursive validator, it stops at the first violation.
+* `full`: the single-pass validator that collects all violations.
+* `trusted`: only the error code is computed, it is used for checkers shipped with the utility.
+
+Trees are `wide` (each node has 10 subnodes) or `deep` (a chain of nodes). The recursive validator
+cannot validate deep trees longer than the recursion limit.
+
+Usage: python3 benchmarks/bench_summary_validation.py [--nodes 10000 100000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from typing import Callable, Dict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from modules.check.check import _result_summary_is_correct  # noqa: E402
+
+
+def _recursive(summary_check_result: Dict, is_root: bool = False) -> int:
+    # The validator used before the single-pass one
+    result_error_code = 0
+    for _, data in summary_check_result.items():
+        subcheck_error_code = 0
+        if "CheckStatus" in data:
+            if data["CheckStatus"] not in ["PASS", "WARNING", "FAIL", "ERROR", "INFO"]:
+                raise ValueError(f"Error in subtree: {data}.")
+            elif data["CheckStatus"] == "WARNING":
+                subcheck_error_code = 1
+            elif data["CheckStatus"] == "FAIL":
+                subcheck_error_code = 2
+            elif data["CheckStatus"] == "ERROR":
+                subcheck_error_code = 3
+        else:
+            raise ValueError(f"Error in subtree: {data}. CheckStatus is required.")
+        if "Verbosity" in data:
+            if not isinstance(data["Verbosity"], int):
+                raise ValueError(f"Error in subtree: {data}. Verbosity must be an integer.")
+            if is_root and 0 < data["Verbosity"]:
+                raise ValueError(f"Error in subtree: {data}. Root verbosity level must be set to zero.")
+        if "Message" in data and not isinstance(data["Message"], str):
+            raise ValueError(f"Error in subtree: {data}. Message must be a string.")
+        if "Command" in data and not isinstance(data["Command"], str):
+            raise ValueError(f"Error in subtree: {data}. Command must be a string.")
+        if "CheckResult" in data:
+            if isinstance(data["CheckResult"], dict):
+                subcheck_error_code = max(subcheck_error_code, _recursive(data["CheckResult"]))
+        else:
+            raise ValueError(f"Error in subtree: {data}. CheckResult is required.")
+        result_error_code = max(result_error_code, subcheck_error_code)
+    return result_error_code
+
+
+def _create_node(index: int) -> Dict:
+    return {
+        "CheckResult": f"Value {index}",
+        "Verbosity": 1,
+        "Message": "",
+        "CheckStatus": "WARNING" if index % 1000 == 0 else "PASS"
+    }
+
+
+def create_wide_tree(nodes: int) -> Dict:
+    root = _create_node(0)
+    root["Verbosity"] = 0
+    queue = [root]
+    created = 1
+    while created < nodes:
+        parent = queue.pop(0)
+        parent["CheckResult"] = {}
+        for _ in range(min(10, nodes - created)):
+            node = _create_node(created)
+            parent["CheckResult"][f"Node {created}"] = node
+            queue.append(node)
+            created += 1
+    return {"CheckResult": {"Root": root}}
+
+
+def create_deep_tree(nodes: int) -> Dict:
+    node = _create_node(nodes - 1)
+    for index in range(nodes - 2, -1, -1):
+        parent = _create_node(index)
+        parent["CheckResult"] = {f"Node {index + 1}": node}
+        node = parent
+    node["Verbosity"] = 0
+    return {"CheckResult": {"Root": node}}
+
+
+def measure(function: Callable[[], int], repeat: int) -> str:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            function()
+        except RecursionError:
+            return "RecursionError"
+        best = min(best, time.perf_counter() - start)
+    return f"{best * 1000:.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare validators of result trees.")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'tree':<6} {'nodes':>8} {'recursive':>16} {'full':>16} {'trusted':>16}")
+    for shape, create_tree in [("wide", create_wide_tree), ("deep", create_deep_tree)]:
+        for nodes in args.nodes:
+            tree = create_tree(nodes)
+            times = [
+                measure(lambda: _recursive(tree["CheckResult"], is_root=True), args.repeat),
+                measure(lambda: _result_summary_is_correct(tree), args.repeat),
+                measure(lambda: _result_summary_is_correct(tree, trusted=True), args.repeat)
+            ]
+            print(f"{shape:<6} {nodes:>8} {times[0]:>16} {times[1]:>16} {times[2]:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,14 @@ parse_args() {
 	--get_api_version)
 		get_api_version
 		;;
+	--describe)
+		describe
+		;;
+	--run)
+		# Dependency data is passed on stdin, this check does not require any
+		cat >/dev/null
+		get_summary
+		;;
 	*) exit ;;
 	esac
 }
@@ -155,5 +163,15 @@ get_api_version() {
 	return 0
 }
 
+describe() {
+	# Print the version of this checker API and the metadata of all checks at once
+	cat <<-DESCRIPTION
+		{
+		  "api_version": "$(get_api_version)",
+		  "checks": [$(get_metadata)]
+		}
+	DESCRIPTION
+}
+
 # `main` entry to script
 parse_args "$@"
@@ -15,7 +15,6 @@ from modules.check import CheckSummary, CheckMetadataPy
 
 import os
 import re
-import json
 from typing import List
 from modules.files_helper import get_json_content_from_file
 
@@ -51,7 +50,7 @@ def run_oneapi_env_check(data: dict) -> CheckSummary:
     if result_json["CheckResult"]["Presence of oneAPI environment"]["CheckStatus"] == "PASS":
         result_json["CheckResult"].update(get_versions_of_oneapi_products_installed_in_env())
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
@@ -13,7 +13,6 @@ from modules.check import CheckSummary, CheckMetadataPy
 
 import os
 import re
-import json
 import platform
 import subprocess
 
@@ -250,7 +249,7 @@ def run_base_check(data: dict) -> CheckSummary:
     get_uname(result_json["CheckResult"])
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
@@ -270,6 +269,7 @@ def get_check_list() -> List[CheckMetadataPy]:
         merit=0,
         timeout=5,
         version=2,
-        run="run_base_check"
+        run="run_base_check",
+        cache_ttl=300
     )
     return [someCheck]
@@ -14,6 +14,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from modules.check import compile_result_path
+
 
 def get_card_devices() -> List[Path]:
     path_to_devices = Path("/dev/dri/")
@@ -52,16 +54,22 @@ def intel_gpus_not_found_handler(json_node: Dict) -> None:
     })
 
 
+_LZ_DRIVER_LOADED = compile_result_path(
+    "gpu_backend_check.GPU.Intel® oneAPI Level Zero Driver.Driver is loaded\\.")
+_LZ_DRIVER_INFORMATION = compile_result_path(
+    "gpu_backend_check.GPU.Intel® oneAPI Level Zero Driver.Driver information")
+
+
 def is_level_zero_initialized(data: Dict) -> Tuple[bool, str]:
     lz_driver_message = ''
-    lz_driver_loaded_check_status = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver is loaded."]["CheckStatus"]  # noqa: E501
-    if lz_driver_loaded_check_status == "ERROR":
-        lz_driver_message = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver is loaded."]["Message"]  # noqa: E501
-    else:
-        lz_driver_info_check_status = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver information"]["CheckStatus"]  # noqa: E501
-        if lz_driver_info_check_status == "ERROR":
-            lz_driver_message = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver information"]["Message"]  # noqa: E501
-
-    is_level_zero_initialized = lz_driver_loaded_check_status == "PASS" and lz_driver_info_check_status == "INFO"  # noqa: E501
+    lz_driver_loaded = _LZ_DRIVER_LOADED.get_node(data)
+    if lz_driver_loaded["CheckStatus"] == "ERROR":
+        return False, lz_driver_loaded["Message"]
+    lz_driver_info = _LZ_DRIVER_INFORMATION.get_node(data)
+    if lz_driver_info["CheckStatus"] == "ERROR":
+        lz_driver_message = lz_driver_info["Message"]
+
+    is_level_zero_initialized = \
+        lz_driver_loaded["CheckStatus"] == "PASS" and lz_driver_info["CheckStatus"] == "INFO"
 
     return is_level_zero_initialized, lz_driver_message
@@ -11,7 +11,6 @@
 
 from modules.check import CheckSummary, CheckMetadataPy
 
-import json
 import subprocess
 from typing import List, Dict
 
@@ -92,7 +91,7 @@ def run_gcc_check(data: dict) -> CheckSummary:
     gcc_check(result_json["CheckResult"])
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
@@ -112,6 +111,7 @@ def get_check_list() -> List[CheckMetadataPy]:
         merit=0,
         timeout=5,
         version=2,
-        run="run_gcc_check"
+        run="run_gcc_check",
+        cache_ttl=300
     )
     return [someCheck]
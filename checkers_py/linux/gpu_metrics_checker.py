@@ -10,9 +10,8 @@
 # *******************************************************************************/
 
 from checkers_py.linux.common.gpu_helper import is_level_zero_initialized
-from modules.check import CheckSummary, CheckMetadataPy
+from modules.check import CheckSummary, CheckMetadataPy, compile_result_path
 
-import json
 import os
 from typing import List, Dict
 
@@ -91,6 +90,21 @@ class Device:
         self.enumeration = enumeration
 
 
+_LZ_DRIVER_INFORMATION = compile_result_path(
+    "gpu_backend_check.GPU.Intel® oneAPI Level Zero Driver.Driver information")
+_INITIALIZED_DEVICES = compile_result_path("intel_gpu_detector_check.GPU information.Initialized devices")
+# Paths relative to the driver information and to the device
+_LZ_DEVICES = compile_result_path("Driver # 0.Devices.Device # *")
+_DEVICE_TYPE = compile_result_path("Device type")
+_DEVICE_NAME = compile_result_path("Device name")
+_DEVICE_ID = compile_result_path("Device ID")
+_DEVICE_MAX_FREQ = compile_result_path("Device maximum frequency, MHz")
+_DEVICE_MIN_FREQ = compile_result_path("Device minimum frequency, MHz")
+_DEVICE_CUR_FREQ = compile_result_path("Device current frequency, MHz")
+_MEMORY_BANDWIDTH = compile_result_path("Memory bandwidth, GB/s")
+_PCIE_BANDWIDTH = compile_result_path("PCIe bandwidth, GB/s")
+
+
 def parse_devices(data: Dict) -> List[Device]:
     result: List[Device] = []
 
@@ -98,35 +112,35 @@ def parse_devices(data: Dict) -> List[Device]:
     if not is_lz_initialized:
         raise Exception(lz_driver_message)
 
-    lz_slice = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver information"]["CheckResult"]  # noqa: E501
+    lz_slice = _LZ_DRIVER_INFORMATION.get(data)
     if not isinstance(lz_slice, dict):
         return result
-    driver_number = int(lz_slice["Installed driver number"]["CheckResult"])
+    initialized_devices = _INITIALIZED_DEVICES.get(data, default={})
     counter = 0
-    for i in range(driver_number):
-        devices_slice = lz_slice[f"Driver # {i}"]["CheckResult"]["Devices"]
-        device_number = int(devices_slice["CheckResult"]["Device number"]["CheckResult"])
-        for j in range(device_number):
-            device_slice = devices_slice["CheckResult"][f"Device # {j}"]["CheckResult"]
-            device_type = device_slice["Device type"]["CheckResult"]
-            if device_type != "Graphics Processing Unit":
-                continue
-            data_slice = data["intel_gpu_detector_check"]["CheckResult"]["GPU information"]["CheckResult"]["Initialized devices"]["CheckResult"]  # noqa: E501
-            type_slice = data_slice[f"Intel GPU #{j+1}"]["CheckResult"]
-            device = Device(
-                name=device_slice["Device name"]["CheckResult"],
-                id=device_slice["Device ID"]["CheckResult"],
-                max_freq=device_slice["Device maximum frequency, MHz"]["CheckResult"],
-                min_freq=device_slice["Device minimum frequency, MHz"]["CheckResult"],
-                cur_freq=device_slice["Device current frequency, MHz"]["CheckResult"],
-                mem_bandwidth=device_slice["Memory bandwidth, GB/s"]["CheckResult"],
-                pcie_bandwidth=device_slice["PCIe bandwidth, GB/s"]["CheckResult"],
-                gpu_type=type_slice["GPU type"]["CheckResult"],
-                enumeration=str(counter)
-            )
-            counter += 1
-            result.append(device)
-        return result
+    for (device_index,), device_node in _LZ_DEVICES.find(lz_slice):
+        device_slice = device_node["CheckResult"]
+        device_type = _DEVICE_TYPE.get(device_slice)
+        if device_type != "Graphics Processing Unit":
+            continue
+        gpu_type = None
+        if device_index.isdigit():
+            # The initialized devices are numbered from 1, the Level Zero devices are numbered from 0
+            gpu_type = compile_result_path(f"Intel GPU #{int(device_index) + 1}.GPU type").get(
+                initialized_devices, default=None)
+        device = Device(
+            name=_DEVICE_NAME.get(device_slice),
+            id=_DEVICE_ID.get(device_slice),
+            max_freq=_DEVICE_MAX_FREQ.get(device_slice),
+            min_freq=_DEVICE_MIN_FREQ.get(device_slice),
+            cur_freq=_DEVICE_CUR_FREQ.get(device_slice),
+            mem_bandwidth=_MEMORY_BANDWIDTH.get(device_slice),
+            pcie_bandwidth=_PCIE_BANDWIDTH.get(device_slice),
+            gpu_type=gpu_type,
+            enumeration=str(counter)
+        )
+        counter += 1
+        result.append(device)
+    return result
 
 
 def have_administrative_priviliges():
@@ -283,7 +297,7 @@ def run_gpu_metrics_check(data: Dict) -> CheckSummary:
                 "HowToFix": "Run gpu_backend_check to diagnose the problem."}})
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
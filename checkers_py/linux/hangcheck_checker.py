@@ -13,7 +13,6 @@ from modules.check import CheckSummary, CheckMetadataPy
 from checkers_py.linux.common.gpu_helper import are_intel_gpus_found, intel_gpus_not_found_handler
 
 import os
-import json
 import itertools
 import configparser
 import subprocess
@@ -151,7 +150,7 @@ def run_hangcheck_check(data: dict) -> CheckSummary:
     check_non_zero_pre_emption_timeouts(result_json["CheckResult"])
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
     return check_summary
 
@@ -14,7 +14,6 @@ from modules.check import CheckSummary, CheckMetadataPy
 import fnmatch
 import os
 import re
-import json
 import subprocess
 from typing import List, Dict
 from os.path import exists
@@ -381,7 +380,7 @@ def run_intel_gpu_detector_check(data: dict) -> CheckSummary:
     get_gpu_info(result_json["CheckResult"])
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
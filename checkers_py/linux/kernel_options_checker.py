@@ -11,7 +11,6 @@
 
 from modules.check import CheckSummary, CheckMetadataPy
 
-import json
 import subprocess
 from typing import List, Dict
 
@@ -76,7 +75,7 @@ def run_kernel_check(data: dict) -> CheckSummary:
     get_kernel_boot_options(result_json["CheckResult"])
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
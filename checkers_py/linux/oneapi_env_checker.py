@@ -14,7 +14,6 @@ from modules.check import CheckSummary, CheckMetadataPy
 
 import os
 import re
-import json
 from typing import List, Dict
 from modules.files_helper import get_json_content_from_file
 
@@ -72,7 +71,7 @@ def run_oneapi_env_check(data: dict) -> CheckSummary:
     get_oneapi_env_versions(result_json["CheckResult"])
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
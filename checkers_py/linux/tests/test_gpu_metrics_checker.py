@@ -372,6 +372,99 @@ class TestParseDevices(unittest.TestCase):
 
         self.assertEqual(expected_devices, actual_devices)
 
+    def test_parse_devices_without_gpu_type(self):
+        input = {
+            "gpu_backend_check": {
+                "CheckResult": {
+                    "GPU": {
+                        "CheckResult": {
+                            "Intel® oneAPI Level Zero Driver": {
+                                "CheckResult": {
+                                    "Driver is loaded.": {
+                                        "CheckStatus": "PASS"
+                                    },
+                                    "Driver information": {
+                                        "CheckStatus": "INFO",
+                                        "CheckResult": {
+                                            "Driver # 0": {
+                                                "CheckResult": {
+                                                    "Devices": {
+                                                        "CheckResult": {
+                                                            "Device # 0": {
+                                                                "CheckResult": {
+                                                                    "Device type": {
+                                                                        "CheckResult": "Graphics Processing Unit"  # noqa: E501
+                                                                    },
+                                                                    "Device ID": {
+                                                                        "CheckResult": "1"
+                                                                    },
+                                                                    "Device maximum frequency, MHz": {
+                                                                        "CheckResult": "1"
+                                                                    },
+                                                                    "Device minimum frequency, MHz": {
+                                                                        "CheckResult": "1"
+                                                                    },
+                                                                    "Device current frequency, MHz": {
+                                                                        "CheckResult": "1"
+                                                                    },
+                                                                    "Memory bandwidth, GB/s": {
+                                                                        "CheckResult": "1"
+                                                                    },
+                                                                    "PCIe bandwidth, GB/s": {
+                                                                        "CheckResult": "1"
+                                                                    },
+                                                                    "Device name": {
+                                                                        "CheckResult": "test_device_1"
+                                                                    }
+                                                                }
+                                                            },
+                                                            "Device # x": {
+                                                                "CheckResult": {
+                                                                    "Device type": {
+                                                                        "CheckResult": "Graphics Processing Unit"  # noqa: E501
+                                                                    },
+                                                                    "Device ID": {
+                                                                        "CheckResult": "2"
+                                                                    },
+                                                                    "Device maximum frequency, MHz": {
+                                                                        "CheckResult": "2"
+                                                                    },
+                                                                    "Device minimum frequency, MHz": {
+                                                                        "CheckResult": "2"
+                                                                    },
+                                                                    "Device current frequency, MHz": {
+                                                                        "CheckResult": "2"
+                                                                    },
+                                                                    "Memory bandwidth, GB/s": {
+                                                                        "CheckResult": "2"
+                                                                    },
+                                                                    "PCIe bandwidth, GB/s": {
+                                                                        "CheckResult": "2"
+                                                                    },
+                                                                    "Device name": {
+                                                                        "CheckResult": "test_device_2"
+                                                                    }
+                                                                }
+                                                            }
+                                                        }
+                                                    }
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+        actual_devices = gpu_metrics_checker.parse_devices(input)
+
+        self.assertEqual(["test_device_1", "test_device_2"], [device.name for device in actual_devices])
+        self.assertEqual([None, None], [device.gpu_type for device in actual_devices])
+
     @patch("checkers_py.linux.gpu_metrics_checker.is_level_zero_initialized")
     def test_parse_devices_lz_not_initialized(self, mocked_is_level_zero_initialized):
         input = []
@@ -11,7 +11,6 @@
 
 import os
 import grp
-import json
 import getpass
 from pathlib import Path
 from typing import Dict, List, FrozenSet
@@ -96,7 +95,7 @@ def run_user_group_check(data: dict) -> CheckSummary:
             check_user_in_required_groups(result_json["CheckResult"])
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
     return check_summary
 
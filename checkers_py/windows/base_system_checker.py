@@ -11,7 +11,6 @@
 
 from modules.check import CheckSummary, CheckMetadataPy
 
-import json
 import winreg
 import platform
 
@@ -272,7 +271,7 @@ def run_base_check(data: dict) -> CheckSummary:
     get_bios_information(result_json["CheckResult"])
     get_os_information(result_json["CheckResult"])
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
@@ -292,6 +291,7 @@ def get_check_list() -> List[CheckMetadataPy]:
         merit=0,
         timeout=5,
         version=2,
-        run="run_base_check"
+        run="run_base_check",
+        cache_ttl=300
     )
     return [someCheck]
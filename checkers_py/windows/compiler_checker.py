@@ -11,7 +11,6 @@
 
 from checkers_py.windows.common.termninal_helper import run_powershell_command
 from modules.check import CheckSummary, CheckMetadataPy
-import json
 import re
 from typing import List
 
@@ -40,7 +39,7 @@ def run_compiler_check(data: dict) -> CheckSummary:
     result_json["CheckResult"].update(get_msvc_compiler_info())
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
@@ -10,7 +10,7 @@
 # *******************************************************************************/
 
 from pathlib import Path
-from modules.check import CheckSummary, CheckMetadataPy
+from modules.check import CheckSummary, CheckMetadataPy, compile_result_path
 
 import sqlite3
 import json
@@ -81,20 +81,21 @@ def _is_latest_version(driver_name: str, driver_version: str, cursor) -> bool:
     return True if row[0] <= driver_version else False
 
 
+_LZ_DRIVER_VERSION = compile_result_path(
+    "gpu_backend_check.GPU.Intel® oneAPI Level Zero Driver.Driver information.Driver # 0.Driver version")
+_OPENCL_DRIVER_VERSION = compile_result_path(
+    "gpu_backend_check.GPU.OpenCL™ Driver.Driver information.Platform # 0.Devices.Device # 0."
+    "Driver version")
+
+
 def get_gpu_driver_version(data: Dict) -> Dict:
     gpu_drivers = {}
-    try:
-        level_zero_version = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver information"]["CheckResult"]["Driver # 0"]["CheckResult"]["Driver version"]["CheckResult"]  # noqa: E501
-    except Exception:
-        pass
-    else:
+    level_zero_version = _LZ_DRIVER_VERSION.get(data, default=None)
+    if level_zero_version is not None:
         gpu_drivers["Intel® oneAPI Level Zero"] = level_zero_version
 
-    try:
-        opencl_version = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["OpenCL™ Driver"]["CheckResult"]["Driver information"]["CheckResult"]["Platform # 0"]["CheckResult"]["Devices"]["CheckResult"]["Device # 0"]["CheckResult"]["Driver version"]["CheckResult"]  # noqa: E501
-    except Exception:
-        pass
-    else:
+    opencl_version = _OPENCL_DRIVER_VERSION.get(data, default=None)
+    if opencl_version is not None:
         gpu_drivers["OpenCL™"] = opencl_version
     return gpu_drivers
 
@@ -249,7 +250,7 @@ def run_driver_compatibility_check(data: Dict) -> CheckSummary:
     check_compatibilities(result_json["CheckResult"], data)
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
@@ -269,6 +270,7 @@ def get_check_list() -> List[CheckMetadataPy]:
         merit=60,
         timeout=5555,
         version=CHECK_VERSION,
-        run="run_driver_compatibility_check"
+        run="run_driver_compatibility_check",
+        cache_ttl=300
     )
     return [someCheck]
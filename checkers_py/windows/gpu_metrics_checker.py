@@ -9,10 +9,9 @@
 #
 # *******************************************************************************/
 
-from modules.check import CheckSummary, CheckMetadataPy
+from modules.check import CheckSummary, CheckMetadataPy, compile_result_path
 
-import json
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 
 known_devices: Dict[str, Dict[str, str]] = {
@@ -119,72 +118,93 @@ def run_gpu_metrics_check(data: Dict) -> CheckSummary:
                 "HowToFix": "Run gpu_backend_check to diagnose the problem."}})
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
 
 
+_LZ_DRIVER_LOADED = compile_result_path(
+    "gpu_backend_check.GPU.Intel® oneAPI Level Zero Driver.Driver is loaded\\.")
+_LZ_DRIVER_INFORMATION = compile_result_path(
+    "gpu_backend_check.GPU.Intel® oneAPI Level Zero Driver.Driver information")
+# Paths relative to the driver information and to the device
+_LZ_DEVICES = compile_result_path("Driver # *.Devices.Device # *")
+_DEVICE_TYPE = compile_result_path("Device type")
+_DEVICE_NAME = compile_result_path("Device name")
+_DEVICE_ID = compile_result_path("Device ID")
+_DEVICE_MAX_FREQ = compile_result_path("Device maximum frequency, MHz")
+_DEVICE_MIN_FREQ = compile_result_path("Device minimum frequency, MHz")
+_DEVICE_CUR_FREQ = compile_result_path("Device current frequency, MHz")
+_MEMORY_BANDWIDTH = compile_result_path("Memory bandwidth, GB/s")
+_PCIE_BANDWIDTH = compile_result_path("PCIe bandwidth, GB/s")
+_GPU_DETECTOR = compile_result_path("intel_gpu_detector_check")
+# Paths relative to the intel_gpu_detector_check result and to a GPU of the GPU information
+_GPU_DEVICES = compile_result_path("GPU information.*")
+_PCI_ID = compile_result_path("PCI ID")
+_GPU_TYPE = compile_result_path("GPU type")
+
+
 def parse_devices(data: Dict) -> List[Device]:
     result: List[Device] = []
 
     is_lz_initialized, lz_driver_message = is_level_zero_initialized(data)
     if not is_lz_initialized:
         raise Exception(lz_driver_message)
-    lz_slice = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver information"]["CheckResult"]  # noqa: E501
+    lz_slice = _LZ_DRIVER_INFORMATION.get(data)
 
     if not isinstance(lz_slice, dict):
         return result
-    driver_number = int(lz_slice["Installed driver number"]["CheckResult"])
 
+    gpu_detector_result = _GPU_DETECTOR.get(data, default={})
     counter = 0
-    for i in range(driver_number):
-        devices_slice = lz_slice[f"Driver # {i}"]["CheckResult"]["Devices"]
-        device_number = int(devices_slice["CheckResult"]["Device number"]["CheckResult"])
-        for j in range(device_number):
-            device_slice = devices_slice["CheckResult"][f"Device # {j}"]["CheckResult"]
-            device_type = device_slice["Device type"]["CheckResult"]
-            if device_type != "Graphics Processing Unit":
-                continue
-            lz_id = device_slice["Device ID"]["CheckResult"]
-            device_type = get_device_type(lz_id, data["intel_gpu_detector_check"])
-            if device_type is None:
-                continue
-            device = Device(
-                name=device_slice["Device name"]["CheckResult"],
-                id=lz_id,
-                max_freq=device_slice["Device maximum frequency, MHz"]["CheckResult"],
-                min_freq=device_slice["Device minimum frequency, MHz"]["CheckResult"],
-                cur_freq=device_slice["Device current frequency, MHz"]["CheckResult"],
-                mem_bandwidth=device_slice["Memory bandwidth, GB/s"]["CheckResult"],
-                pcie_bandwidth=device_slice["PCIe bandwidth, GB/s"]["CheckResult"],
-                gpu_type=device_type,
-                enumeration=str(counter)
-            )
-            counter += 1
-            result.append(device)
+    for _, device_node in _LZ_DEVICES.find(lz_slice):
+        device_slice = device_node["CheckResult"]
+        device_type = _DEVICE_TYPE.get(device_slice)
+        if device_type != "Graphics Processing Unit":
+            continue
+        lz_id = _DEVICE_ID.get(device_slice)
+        device_type = get_device_type(lz_id, gpu_detector_result)
+        if device_type is None:
+            continue
+        device = Device(
+            name=_DEVICE_NAME.get(device_slice),
+            id=lz_id,
+            max_freq=_DEVICE_MAX_FREQ.get(device_slice),
+            min_freq=_DEVICE_MIN_FREQ.get(device_slice),
+            cur_freq=_DEVICE_CUR_FREQ.get(device_slice),
+            mem_bandwidth=_MEMORY_BANDWIDTH.get(device_slice),
+            pcie_bandwidth=_PCIE_BANDWIDTH.get(device_slice),
+            gpu_type=device_type,
+            enumeration=str(counter)
+        )
+        counter += 1
+        result.append(device)
     return result
 
 
-def get_device_type(level_zero_id, intel_gpu_detector_data) -> str:
-    data_slice = intel_gpu_detector_data["CheckResult"]["GPU information"]["CheckResult"]  # noqa: E501
-    for key, value in data_slice.items():
-        pci_id = value["CheckResult"]["PCI ID"]["CheckResult"].lower()
-        if level_zero_id[2:] == pci_id:
-            return value["CheckResult"]["GPU type"]["CheckResult"]
+def get_device_type(level_zero_id, gpu_detector_result) -> Optional[str]:
+    if not isinstance(level_zero_id, str):
+        return None
+    for _, gpu_node in _GPU_DEVICES.find(gpu_detector_result):
+        gpu_slice = gpu_node.get("CheckResult")
+        pci_id = _PCI_ID.get(gpu_slice, default=None, value_type=str.lower)
+        if pci_id is not None and level_zero_id[2:] == pci_id:
+            return _GPU_TYPE.get(gpu_slice, default=None)
+    return None
 
 
 def is_level_zero_initialized(data: Dict) -> Tuple[bool, str]:
     lz_driver_message = ''
-    lz_driver_loaded_check_status = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver is loaded."]["CheckStatus"]  # noqa: E501
-    if lz_driver_loaded_check_status == "ERROR":
-        lz_driver_message = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver is loaded."]["Message"]  # noqa: E501
-    else:
-        lz_driver_info_check_status = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver information"]["CheckStatus"]  # noqa: E501
-        if lz_driver_info_check_status == "ERROR":
-            lz_driver_message = data["gpu_backend_check"]["CheckResult"]["GPU"]["CheckResult"]["Intel® oneAPI Level Zero Driver"]["CheckResult"]["Driver information"]["Message"]  # noqa: E501
-
-    is_level_zero_initialized = lz_driver_loaded_check_status == "PASS" and lz_driver_info_check_status == "INFO"  # noqa: E501
+    lz_driver_loaded = _LZ_DRIVER_LOADED.get_node(data)
+    if lz_driver_loaded["CheckStatus"] == "ERROR":
+        return False, lz_driver_loaded["Message"]
+    lz_driver_info = _LZ_DRIVER_INFORMATION.get_node(data)
+    if lz_driver_info["CheckStatus"] == "ERROR":
+        lz_driver_message = lz_driver_info["Message"]
+
+    is_level_zero_initialized = \
+        lz_driver_loaded["CheckStatus"] == "PASS" and lz_driver_info["CheckStatus"] == "INFO"
 
     return is_level_zero_initialized, lz_driver_message
 
@@ -13,7 +13,6 @@ from checkers_py.windows.common.termninal_helper import run_powershell_command
 from modules.check import CheckSummary, CheckMetadataPy
 
 import re
-import json
 from typing import List
 
 
@@ -41,7 +40,7 @@ def run_intel_gpu_detector_check(data: dict) -> CheckSummary:
     result_json = {"CheckResult": {}}
     result_json["CheckResult"] = get_gpu_driver_info()
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
     return check_summary
 
@@ -10,7 +10,6 @@
 # *******************************************************************************/
 
 import os
-import json
 import shutil
 import subprocess
 import tempfile
@@ -66,7 +65,7 @@ def run_oneapi_gpu_check(data: dict) -> CheckSummary:
     remove_folder(TMP_FOLDER)
 
     check_summary = CheckSummary(
-        result=json.dumps(result_json, indent=4)
+        result_tree=result_json
     )
 
     return check_summary
@@ -31,7 +31,8 @@ def get_check_list() -> List[CheckMetadataPy]:
         merit=20,
         timeout=5,
         version=2,
-        run="run_oneapi_toolkit_checker"
+        run="run_oneapi_toolkit_checker",
+        cache_ttl=300
     )
     return [someCheck]
 
@@ -42,7 +43,7 @@ def run_oneapi_toolkit_checker(data):
     check_result["CheckResult"].update(installer_cache_check())
 
     check_summary = CheckSummary(
-        result=json.dumps(check_result, indent=4)
+        result_tree=check_result
     )
     return check_summary
 
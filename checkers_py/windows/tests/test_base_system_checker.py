@@ -11,7 +11,6 @@
 # *******************************************************************************/
 
 # NOTE: workaround to import modules
-import json
 import os
 import platform
 import sys
@@ -485,11 +484,11 @@ class TestRunBaseCheck(unittest.TestCase):
         expected_json["CheckResult"].update({"Operating system information": os_information_json})
 
         expected = CheckSummary(
-            result=json.dumps(expected_json, indent=4)
+            result_tree=expected_json
         )
 
         actual = base_system_checker.run_base_check({})
-        self.assertEqual(expected.result, actual.result)
+        self.assertEqual(expected.result_tree, actual.result_tree)
 
 
 if __name__ == "__main__":
@@ -336,6 +336,79 @@ class TestParseDevices(unittest.TestCase):
 
         self.assertEqual(expected_devices, actual_devices)
 
+    def test_parse_devices_without_gpu_information(self):
+        input = {
+            "gpu_backend_check": {
+                "CheckResult": {
+                    "GPU": {
+                        "CheckResult": {
+                            "Intel® oneAPI Level Zero Driver": {
+                                "CheckResult": {
+                                    "Driver is loaded.": {
+                                        "CheckStatus": "PASS"
+                                    },
+                                    "Driver information": {
+                                        "CheckStatus": "INFO",
+                                        "CheckResult": {
+                                            "Driver # 0": {
+                                                "CheckResult": {
+                                                    "Devices": {
+                                                        "CheckResult": {
+                                                            "Device # 0": {
+                                                                "CheckResult": {
+                                                                    "Device type": {
+                                                                        "CheckResult": "Graphics Processing Unit"  # noqa: E501
+                                                                    },
+                                                                    "Device ID": {
+                                                                        "CheckResult": "0x1"
+                                                                    }
+                                                                }
+                                                            }
+                                                        }
+                                                    }
+                                                }
+                                            }
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+        self.assertEqual([], gpu_metrics_checker.parse_devices(input))
+
+    def test_get_device_type_skips_gpus_without_pci_id(self):
+        gpu_detector_result = {
+            "GPU information": {
+                "CheckResult": {
+                    "Intel GPU #1": {
+                        "CheckResult": {
+                            "GPU type": {
+                                "CheckResult": "Integrated"
+                            }
+                        }
+                    },
+                    "Intel GPU #2": {
+                        "CheckResult": {
+                            "GPU type": {
+                                "CheckResult": "Discrete"
+                            },
+                            "PCI ID": {
+                                "CheckResult": "56A0"
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+        self.assertEqual("Discrete", gpu_metrics_checker.get_device_type("0x56a0", gpu_detector_result))
+        self.assertIsNone(gpu_metrics_checker.get_device_type("0x56a1", gpu_detector_result))
+        self.assertIsNone(gpu_metrics_checker.get_device_type(None, gpu_detector_result))
+
     @patch("checkers_py.windows.gpu_metrics_checker.is_level_zero_initialized")
     def test_parse_devices_lz_not_initialized(self, mocked_is_level_zero_initialized):
         input = []
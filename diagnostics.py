@@ -11,25 +11,8 @@
 # *******************************************************************************/
 
 import sys
-import os
-import platform
-
-from pathlib import Path
-from typing import Dict, List, Optional
-
-from modules.check import BaseCheck, CheckMetadataPy,  \
-    run_checks, create_dependency_order
-from modules.check.check_loader import load_checks_from_config, load_checks_from_env, load_default_checks
-from modules.db_downloader import update_databases
-from modules.files_helper import configure_output_files, get_checks_to_run_from_config_data, \
-    read_config_data, save_json_output_file
-from modules.select import process_select, get_selected_checks
-from modules.os_helper import check_that_os_is_supported
-from modules.parse_args import create_parser
-from modules.log import configure_logger, configure_file_logging
 
-from modules.printing import print_metadata, print_summary, print_epilog
-from modules.printing.printer import print_ex, enable_stdout_printing
+from modules.parse_args import create_parser
 
 
 VERSION = "2024.2.0"
@@ -40,8 +23,32 @@ def main():
     # Parse command line arguments
     parser = create_parser(VERSION)
     args = parser.parse_args()
+
+    # Other modules are imported after the arguments are parsed, so --help and --version are fast
+    import os
+    import platform
+
+    from functools import partial
+    from pathlib import Path
+    from typing import Dict, List, Optional, TextIO
+
+    from modules.check import BaseCheck, CheckMetadataPy, CheckRegistry, \
+        run_checks, create_dependency_order
+    from modules.check.check_cache import CheckResultCache
+    from modules.check.check_loader import CheckerEntryPointsIndex, CheckerManifestCache, \
+        load_checks_from_config, load_checks_from_entry_points, load_checks_from_env, load_default_checks, \
+        materialize_checks
+    from modules.files_helper import configure_output_files, get_checks_to_run_from_config_data, \
+        read_config_data, save_json_output_file, write_json_stream_record
+    from modules.select import process_select, get_selected_checks
+    from modules.os_helper import check_that_os_is_supported
+    from modules.log import configure_logger, configure_file_logging
+
+    from modules.printing import print_metadata, print_summary, print_epilog
+    from modules.printing.printer import print_ex, enable_stdout_printing
+
     # Disable printing to STDOUT
-    if args.json:
+    if args.json or args.ndjson == "-":
         enable_stdout_printing(False)
     # Check that OS is supported
     if not args.force:
@@ -67,31 +74,35 @@ def main():
     if txt_output_file is not None:
         configure_file_logging(args.verbosity, txt_output_file)
 
-    # Load checks from default storage, environment and config
+    # Load checks from default storage, installed packages, environment and config
+    # Metadata of checks is got without loading checker files where it is possible
     loaded_checks_map: Dict[Path, CheckMetadataPy] = {}
     loaded_checks: List[BaseCheck] = []
 
-    loaded_checks.extend(load_default_checks(API_VERSION, loaded_checks_map))
-    loaded_checks.extend(load_checks_from_env(API_VERSION, loaded_checks_map))
+    read_cache = not (args.no_cache or args.refresh)
+    manifest_cache = CheckerManifestCache(read=read_cache, write=not args.no_cache)
+    entry_points_index = CheckerEntryPointsIndex(read=read_cache, write=not args.no_cache)
+
+    loaded_checks.extend(load_default_checks(API_VERSION, loaded_checks_map, manifest_cache))
+    loaded_checks.extend(load_checks_from_entry_points(
+        API_VERSION, loaded_checks_map, manifest_cache, entry_points_index))
+    loaded_checks.extend(load_checks_from_env(API_VERSION, loaded_checks_map, manifest_cache))
     if args.config:  # Load checks from config
-        loaded_checks.extend(load_checks_from_config(args.config, API_VERSION, loaded_checks_map))
-
-    checks_paths = list(loaded_checks_map.keys())
-    checks_metadate = list(loaded_checks_map.values())
-    for index, metadata in enumerate(checks_metadate):
-        the_same_name_checks_metadate = [
-            checks_metadate[i]
-            for i in range(index+1, len(checks_metadate))
-            if checks_metadate[i].name == metadata.name
-        ]
-        if len(the_same_name_checks_metadate) > 0:
-            print_ex(f"Several checks of the same {metadata.name} name was loaded:", txt_output_file)
-            print_ex(f"on path {checks_paths[checks_metadate.index(metadata)]} with version  \
-                     {metadata.version}", txt_output_file)
-            for m in the_same_name_checks_metadate:
-                print_ex(f"on path {checks_paths[checks_metadate.index(m)]} with version {m.version}",
-                         txt_output_file)
-            exit(1)
+        loaded_checks.extend(load_checks_from_config(
+            args.config, API_VERSION, loaded_checks_map, manifest_cache))
+    manifest_cache.save()
+    entry_points_index.save()
+
+    checks_registry = CheckRegistry(loaded_checks)
+    if len(checks_registry.duplicates) != 0:
+        checks_paths = {id(metadata): path for path, metadata in loaded_checks_map.items()}
+        for name, the_same_name_checks in checks_registry.duplicates.items():
+            print_ex(f"Several checks of the same {name} name was loaded:", txt_output_file)
+            for check in the_same_name_checks:
+                metadata = check.get_metadata()
+                checker_path = checks_paths.get(id(metadata), "unknown")
+                print_ex(f"on path {checker_path} with version {metadata.version}", txt_output_file)
+        exit(1)
 
     # If checks we not specified, tool should say that it runs with limited set pf checks
     is_select_not_initialized = len(args.select) == 1 and args.select[0] == "not_initialized"
@@ -103,8 +114,8 @@ def main():
     # --list argument processing
     if args.list:
         # Get checks to print
-        checks_to_print: List[BaseCheck] = get_selected_checks(loaded_checks, args.select) \
-            if not is_select_not_initialized else loaded_checks
+        checks_to_print: List[BaseCheck] = checks_registry.select(args.select) \
+            if not is_select_not_initialized else list(checks_registry)
         # Print checks metadata
         print_metadata(checks_to_print, txt_output_file)
         print_epilog(txt_output_file, None, VERSION)
@@ -112,8 +123,9 @@ def main():
 
     # Check DB updates
     if args.update:
+        from modules.db_downloader import update_databases
         print_ex("Updating of compatibility database...", txt_output_file)
-        update_databases(loaded_checks)
+        update_databases(checks_registry)
         print_ex("Updating of compatibility database completed.", txt_output_file)
 
     # Select processing: Run all checks from config or set default selection if it is not initialized
@@ -125,7 +137,7 @@ def main():
         select = process_select(args.select)
 
     # Select the checks to run in right order
-    checks_to_print, checks_to_run = create_dependency_order(loaded_checks, select)
+    checks_to_print, checks_to_run = create_dependency_order(checks_registry, select)
     if len(checks_to_print) != len(checks_to_run):
         checks_to_run_without_print = " ".join(
             set([check.get_metadata().name for check in checks_to_run]) - set(checks_to_print))
@@ -134,8 +146,25 @@ def main():
                  txt_output_file)
         print_ex("", txt_output_file)
 
-    # Run selected checks
-    run_checks(checks_to_run)
+    # Load checker files of the selected checks and their dependencies only, then run checks
+    try:
+        materialize_checks(checks_to_run)
+    except Exception as error:
+        print_ex(str(error), txt_output_file)
+        exit(1)
+    result_cache = CheckResultCache(
+        API_VERSION, read=not (args.no_cache or args.refresh), write=not args.no_cache)
+    json_stream: Optional[TextIO] = None
+    if args.ndjson:
+        json_stream = sys.stdout if args.ndjson == "-" else open(args.ndjson, "w", encoding="utf-8")
+    try:
+        run_checks(
+            checks_to_run, args.jobs, args.worker_pool, result_cache,
+            partial(write_json_stream_record, stream=json_stream) if json_stream else None,
+            args.budget, args.fail_fast)
+    finally:
+        if json_stream is not None and json_stream is not sys.stdout:
+            json_stream.close()
 
     # Print results to user
     print_summary(get_selected_checks(checks_to_run, checks_to_print), args.verbosity, txt_output_file)
@@ -0,0 +1,229 @@
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+"""
+Access to files of the utility packed into a zipapp bundle.
+
+The bundle is a zip archive that contains the installed utility with precompiled bytecode.
+Paths of files inside the bundle look like `/path/to/diagnostics.pyz/checkers_py/gcc_checker.py`.
+If the utility is run from a bundle, the archive is opened once, files are listed and read from it.
+Files that have to be on the filesystem, like native checkers and data files of checkers,
+are extracted to the cache folder on first use.
+"""
+
+import importlib.abc
+import importlib.util
+import marshal
+import os
+import platform
+import shutil
+import tempfile
+import threading
+import zipfile
+
+from hashlib import sha256
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Dict, List, Optional, Tuple
+
+
+DEFAULT_EXTRACT_FOLDER = Path.home() / "intel" / "diagnostics" / "cache"
+# Files that are never extracted, Python code is imported directly from the archive
+_NOT_EXTRACTED_SUFFIXES = {".py", ".pyc"}
+
+
+class _Bundle:
+
+    def __init__(self, archive_path: Path, extract_folder: Path) -> None:
+        self.archive_path = archive_path
+        self.archive = zipfile.ZipFile(archive_path)
+        self.members: Dict[str, zipfile.ZipInfo] = {info.filename: info for info in self.archive.infolist()}
+        stat = archive_path.stat()
+        digest = sha256(f"{archive_path}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8")).hexdigest()[:16]
+        self.extract_folder = extract_folder / platform.node() / "bundle" / digest
+        self._lock = threading.Lock()
+        self._is_extracted = False
+
+    def get_member_name(self, path: Path) -> Optional[str]:
+        relative_path = os.path.relpath(os.path.normpath(path), self.archive_path)
+        if relative_path == ".." or relative_path.startswith(f"..{os.sep}"):
+            return None
+        return "" if relative_path == "." else Path(relative_path).as_posix()
+
+    def extract_resources(self) -> Path:
+        """Extract all files except Python code, the folder is reused by next runs of the same bundle."""
+        with self._lock:
+            if self._is_extracted:
+                return self.extract_folder
+            marker = self.extract_folder / ".extracted"
+            if not marker.exists():
+                self._extract_to_folder()
+            self._is_extracted = True
+        return self.extract_folder
+
+    def _extract_to_folder(self) -> None:
+        # Files are extracted to a temporary sibling folder that is renamed to the extract folder, so
+        # other processes never see partially written files and do not overwrite files in use
+        self.extract_folder.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temporary_folder = Path(
+            tempfile.mkdtemp(prefix=f".{self.extract_folder.name}.", dir=self.extract_folder.parent))
+        try:
+            for name, info in self.members.items():
+                if info.is_dir() or Path(name).suffix in _NOT_EXTRACTED_SUFFIXES:
+                    continue
+                extracted_path = Path(self.archive.extract(info, temporary_folder))
+                # The mode of the file is kept in the high bits of the external attributes
+                mode = (info.external_attr >> 16) & 0o777
+                if mode != 0:
+                    extracted_path.chmod(mode)
+            (temporary_folder / ".extracted").touch()
+            if self.extract_folder.exists() and not (self.extract_folder / ".extracted").exists():
+                # The folder was left incomplete by an interrupted extraction
+                shutil.rmtree(self.extract_folder, ignore_errors=True)
+            try:
+                os.replace(temporary_folder, self.extract_folder)
+            except OSError:
+                # Another process has extracted the bundle first
+                if not (self.extract_folder / ".extracted").exists():
+                    raise
+        finally:
+            shutil.rmtree(temporary_folder, ignore_errors=True)
+
+
+_bundle: Optional[_Bundle] = None
+_is_bundle_found = False
+_bundle_lock = threading.Lock()
+
+
+def _get_bundle() -> Optional[_Bundle]:
+    """Return the bundle the utility is run from, or `None` if it is run from the filesystem."""
+    global _bundle, _is_bundle_found
+    with _bundle_lock:
+        if not _is_bundle_found:
+            _is_bundle_found = True
+            module_path = Path(__file__)
+            if not module_path.exists():
+                for archive_path in module_path.parents:
+                    if archive_path.is_file() and zipfile.is_zipfile(archive_path):
+                        _bundle = _Bundle(archive_path, DEFAULT_EXTRACT_FOLDER)
+                        break
+        return _bundle
+
+
+def _find_member(path: Path) -> Optional[Tuple[_Bundle, str]]:
+    """Return the bundle and the name of the path in the archive if the path is inside the bundle."""
+    bundle = _get_bundle()
+    if bundle is None:
+        return None
+    name = bundle.get_member_name(path)
+    return (bundle, name) if name is not None else None
+
+
+def is_in_bundle(path: Path) -> bool:
+    """Return True if the path is inside the zipapp bundle the utility is run from."""
+    return _find_member(path) is not None
+
+
+def exists(path: Path) -> bool:
+    found = _find_member(path)
+    if found is None:
+        return path.exists()
+    bundle, name = found
+    return name in bundle.members or any(member.startswith(f"{name}/") for member in bundle.members)
+
+
+def is_executable(path: Path) -> bool:
+    found = _find_member(path)
+    if found is None:
+        return os.access(path, os.X_OK)
+    bundle, name = found
+    # The mode of the file is kept in the high bits of the external attributes
+    return name in bundle.members and (bundle.members[name].external_attr >> 16) & 0o111 != 0
+
+
+def list_folder(path: Path) -> List[Path]:
+    """Return files and folders in the folder of the bundle."""
+    found = _find_member(path)
+    if found is None:
+        return []
+    bundle, name = found
+    prefix = f"{name}/" if name else ""
+    children = set()
+    for member in bundle.members:
+        if member.startswith(prefix) and member != prefix:
+            children.add(member[len(prefix):].split("/")[0])
+    return [Path(os.path.normpath(path)) / child for child in sorted(children)]
+
+
+def read_bytes(path: Path) -> bytes:
+    """Read the file from the bundle or from the filesystem."""
+    found = _find_member(path)
+    if found is None:
+        return path.read_bytes()
+    bundle, name = found
+    if name not in bundle.members:
+        raise FileNotFoundError(f"No such file: {path}")
+    return bundle.archive.read(name)
+
+
+def get_archive_path(path: Path) -> Optional[Path]:
+    """Return the path of the bundle that contains the path."""
+    found = _find_member(path)
+    return found[0].archive_path if found is not None else None
+
+
+def get_filesystem_path(path: Path) -> Path:
+    """
+    Return the path of the file on the filesystem. Files of the bundle are extracted on first use,
+    for Python files the path in the folder with extracted data files is returned.
+    """
+    found = _find_member(path)
+    if found is None:
+        return path
+    bundle, name = found
+    return bundle.extract_resources() / name
+
+
+class _BundleLoader(importlib.abc.Loader):
+    """Loader of a Python file of the bundle, the precompiled bytecode is used if it is in the bundle."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return None
+
+    def get_code(self) -> CodeType:
+        try:
+            # The bytecode is stored next to the source file, the header of the .pyc file is 16 bytes
+            bytecode = read_bytes(self.path.with_suffix(".pyc"))
+        except FileNotFoundError:
+            bytecode = b""
+        # The bytecode of another Python version is not compatible, the source file is compiled then
+        if bytecode[:4] == importlib.util.MAGIC_NUMBER:
+            return marshal.loads(bytecode[16:])
+        return compile(read_bytes(self.path), str(self.path), "exec")
+
+    def exec_module(self, module: ModuleType) -> None:
+        exec(self.get_code(), module.__dict__)
+
+
+def get_module_spec(name: str, path: Path) -> ModuleSpec:
+    """
+    Return the spec of the module from the Python file of the bundle. The `__file__` of the module
+    points to the folder with extracted data files, so the module can find its data files.
+    """
+    spec = importlib.util.spec_from_loader(name, _BundleLoader(path), origin=str(get_filesystem_path(path)))
+    if spec is None:
+        raise ImportError(f"Cannot import {path}.")
+    spec.has_location = True
+    return spec
@@ -9,5 +9,39 @@
 #
 # *******************************************************************************/
 
-from .check import BaseCheck, CheckSummary, CheckMetadataPy
-from .check_runner import run_checks, create_dependency_order
+# Submodules are imported on the first access to their names, so importing a light part of the package,
+# e.g. `from modules.check import CheckSummary` in checkers, does not import the check runner.
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .check import BaseCheck, CheckSummary, CheckMetadataPy, ERROR_CODE_TO_STATUS  # noqa: F401
+    from .check_registry import CheckRegistry  # noqa: F401
+    from .result_path import ResultPath, ResultPathError, compile_result_path  # noqa: F401
+    from .result_store import ResultStore, StoredResults  # noqa: F401
+    from .check_runner import run_checks, create_dependency_order  # noqa: F401
+
+_LAZY_ATTRIBUTES = {
+    "BaseCheck": ".check",
+    "CheckSummary": ".check",
+    "CheckMetadataPy": ".check",
+    "ERROR_CODE_TO_STATUS": ".check",
+    "CheckRegistry": ".check_registry",
+    "ResultPath": ".result_path",
+    "ResultPathError": ".result_path",
+    "compile_result_path": ".result_path",
+    "ResultStore": ".result_store",
+    "StoredResults": ".result_store",
+    "run_checks": ".check_runner",
+    "create_dependency_order": ".check_runner",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -11,66 +11,163 @@
 
 import json
 import logging
+import threading
 
+from contextlib import contextmanager
 from functools import wraps
-from typing import Callable, Dict, Optional
-
-
-def _result_summary_recursive(summary_check_result: Dict, is_root: bool = False) -> int:
-    result_error_code = 0
-    for _, data in summary_check_result.items():
-        subcheck_error_code = 0
-        if "CheckStatus" in data:
-            if data["CheckStatus"] not in ["PASS", "WARNING", "FAIL", "ERROR", "INFO"]:
-                raise ValueError(
-                    f"Error in subtree: {data}. CheckStatus value can be only PASS, WARNING, FAIL, ERROR, INFO")  # noqa: E501
-            elif data["CheckStatus"] == "WARNING":
-                subcheck_error_code = 1
-            elif data["CheckStatus"] == "FAIL":
-                subcheck_error_code = 2
-            elif data["CheckStatus"] == "ERROR":
-                subcheck_error_code = 3
-        else:
-            raise ValueError(f"Error in subtree: {data}. CheckStatus is required.")
-
-        if "Verbosity" in data:
-            if not isinstance(data["Verbosity"], int):
-                raise ValueError(
-                    f"Error in subtree: {data}. Verbosity must be an integer.")
-            if is_root:
-                if 0 < data["Verbosity"]:
-                    raise ValueError(
-                        f"Error in subtree: {data}. Root verbosity level must be set to zero.")
-        if "Message" in data:
-            if not isinstance(data["Message"], str):
-                raise ValueError(
-                    f"Error in subtree: {data}. Message must be a string.")
-        if "Command" in data:
-            if not isinstance(data["Command"], str):
-                raise ValueError(
-                    f"Error in subtree: {data}. Command must be a string.")
-        if "CheckResult" in data:
-            if isinstance(data["CheckResult"], dict):
-                subcheck_error_code = max(
-                    subcheck_error_code,
-                    _result_summary_recursive(data["CheckResult"])
-                )
-        else:
-            raise ValueError(f"Error in subtree: {data}. CheckResult is required.")
-        result_error_code = max(
-            result_error_code,
-            subcheck_error_code
-        )
-    return result_error_code
-
-
-def _result_summary_is_correct(
-        summary: Dict) -> int:
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+_STATUS_TO_ERROR_CODE = {"PASS": 0, "INFO": 0, "WARNING": 1, "FAIL": 2, "ERROR": 3}
+# Optional fields of a result tree node with their types
+_OPTIONAL_FIELDS = (
+    ("Verbosity", int, "Verbosity must be an integer."),
+    ("Message", str, "Message must be a string."),
+    ("Command", str, "Command must be a string.")
+)
+_MAX_ERROR_CODE = max(_STATUS_TO_ERROR_CODE.values())
+
+
+def _get_node_path(name: str, parent: Optional[Tuple]) -> str:
+    # The parent is a chain of (name, parent) pairs, so the path is built only for nodes with errors
+    names = [name]
+    while parent is not None:
+        name, parent = parent
+        names.append(name)
+    return "/".join(reversed(names))
+
+
+def _get_error_code(check_result: Dict) -> int:
+    """Return the maximum error code of nodes of the result tree, the tree is not validated."""
+    error_code = 0
+    stack = [check_result]
+    while stack:
+        for data in stack.pop().values():
+            # A node with an unknown status is an error
+            node_error_code = _STATUS_TO_ERROR_CODE.get(data.get("CheckStatus"), _MAX_ERROR_CODE)
+            if node_error_code > error_code:
+                error_code = node_error_code
+                if error_code == _MAX_ERROR_CODE:
+                    return error_code
+            children = data.get("CheckResult")
+            if isinstance(children, dict):
+                stack.append(children)
+    return error_code
+
+
+def _get_violations(check_result: Dict) -> Tuple[int, List[str]]:
+    """Return the maximum error code of nodes of the result tree and all violations of the result format."""
+    error_code = 0
+    violations: List[str] = []
+    # The tree is walked with the stack, so the depth of the tree is not limited by the recursion limit
+    stack: List[Tuple[Dict, Optional[Tuple], bool]] = [(check_result, None, True)]
+    while stack:
+        nodes, parent, is_root = stack.pop()
+        for name, data in nodes.items():
+            if not isinstance(data, dict):
+                path = _get_node_path(name, parent)
+                violations.append(f"Error in subtree {path}: The node must be a dict.")
+                continue
+            errors = []
+            status = data.get("CheckStatus")
+            if status is None:
+                errors.append("CheckStatus is required.")
+            elif status not in _STATUS_TO_ERROR_CODE:
+                errors.append("CheckStatus value can be only PASS, WARNING, FAIL, ERROR, INFO.")
+            elif _STATUS_TO_ERROR_CODE[status] > error_code:
+                error_code = _STATUS_TO_ERROR_CODE[status]
+            for field, field_type, message in _OPTIONAL_FIELDS:
+                if field in data and not isinstance(data[field], field_type):
+                    errors.append(message)
+            if is_root and isinstance(data.get("Verbosity"), int) and data["Verbosity"] > 0:
+                errors.append("Root verbosity level must be set to zero.")
+            if "CheckResult" not in data:
+                errors.append("CheckResult is required.")
+            elif isinstance(data["CheckResult"], dict):
+                stack.append((data["CheckResult"], (name, parent), False))
+            if len(errors) != 0:
+                path = _get_node_path(name, parent)
+                violations.extend(f"Error in subtree {path}: {error}" for error in errors)
+    return error_code, violations
+
+
+_JSON_TYPES = {str, int, float, bool, type(None), list, dict}
+
+
+def _is_json_native(tree: Any) -> bool:
+    """Return whether the tree has only dicts with string keys, lists and JSON scalars of exact types."""
+    stack = [tree]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type not in _JSON_TYPES:
+            return False
+        if value_type is dict:
+            for key in value:
+                if type(key) is not str:
+                    return False
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+    return True
+
+
+def _result_summary_is_correct(summary: Dict, trusted: bool = False) -> int:
+    """
+    Return the error code of the result tree. The result format is validated in one pass and all
+    violations are reported in the raised error. In the trusted mode only the error code is computed.
+    """
     if len(summary) == 0:
         raise ValueError("CheckResult dictionary cannot be empty.")
     if "CheckResult" not in summary:
         raise ValueError("Result summary is not correct: Top level should contain CheckResult.")
-    return _result_summary_recursive(summary_check_result=summary["CheckResult"], is_root=True)
+    if not isinstance(summary["CheckResult"], dict):
+        raise ValueError("Result summary is not correct: Top level CheckResult must be a dict.")
+    if trusted:
+        return _get_error_code(summary["CheckResult"])
+    error_code, violations = _get_violations(summary["CheckResult"])
+    if len(violations) != 0:
+        raise ValueError("\n".join(violations))
+    return error_code
+
+
+_trusted_context = threading.local()
+
+
+@contextmanager
+def trusted_summaries(trusted: bool = True) -> Iterator[None]:
+    """
+    Create summaries in the trusted mode in the context: result trees are not validated, only the error
+    code is computed. It is used to run checks of checkers shipped with the utility.
+    """
+    previous = getattr(_trusted_context, "trusted", False)
+    _trusted_context.trusted = trusted
+    try:
+        yield
+    finally:
+        _trusted_context.trusted = previous
+
+
+ERROR_CODE_TO_STATUS = {0: "PASS", 1: "WARNING", 2: "FAIL", 3: "ERROR"}
+
+
+def _status_req_is_correct(metadata) -> None:
+    try:
+        status_req = json.loads(metadata.statusReq)
+    except Exception:
+        raise ValueError(
+            f"Metadata: {metadata} contains wrong 'statusReq' value. This is not a valid json file.")
+    if not isinstance(status_req, dict):
+        raise ValueError(f"Metadata: {metadata} contains wrong 'statusReq' value. It must be a JSON dict.")
+    for name, statuses in status_req.items():
+        if name not in json.loads(metadata.dataReq):
+            raise ValueError(
+                f"Metadata: {metadata} contains wrong 'statusReq' value. "
+                f"The {name} is not in 'dataReq'.")
+        if not isinstance(statuses, list) or not set(statuses).issubset(ERROR_CODE_TO_STATUS.values()):
+            raise ValueError(
+                f"Metadata: {metadata} contains wrong 'statusReq' value. "
+                f"Statuses can be only {', '.join(ERROR_CODE_TO_STATUS.values())}.")
 
 
 def _metadata_is_correct(metadata):
@@ -79,9 +176,13 @@ def _metadata_is_correct(metadata):
     except Exception:
         raise ValueError(
             f"Metadata: {metadata} contains wrong 'dataReq' value. This is not a valid json file.")
+    _status_req_is_correct(metadata)
     if " " in metadata.name:
         raise ValueError(
             f"Metadata: {metadata} contains wrong 'name' value. Remove spaces from the name.")
+    if not isinstance(metadata.cache_ttl, int) or metadata.cache_ttl < 0:
+        raise ValueError(
+            f"Metadata: {metadata} contains wrong 'cache_ttl' value. It must be a non-negative integer.")
     groups = [elem.strip() for elem in metadata.groups.split(",")]
     for group in groups:
         if " " in group:
@@ -129,6 +230,16 @@ class CheckMetadataPy:
       following declaration: `def my_func(data)` and should return `CheckSummary` object.
       If `dataReq` field is not empty, JSON dict data is used, along with data from dependencies checks.
       If `dataReq` is empty, JSON data is empty dict.
+
+    * `cache_ttl`: An optional integer value containing the time in seconds during which the check result
+      can be reused by the next runs of the utility. The cached result is used only if the check version
+      and the data from dependencies checks are not changed. By default, `0`, the result is not cached.
+
+    * `statusReq`: An optional string value in JSON format containing dict with names of dependencies
+      from `dataReq` and lists of their statuses that are required to run the check.
+      For example, if JSON string contains `{"my_check": ["PASS", "WARNING"]}` it means that the current
+      check is skipped without running if `my_check` has the FAIL or ERROR status.
+      By default, `{}`, the check is run with any statuses of dependencies.
     """
     name: str
     type: str
@@ -139,6 +250,8 @@ class CheckMetadataPy:
     timeout: int
     version: int
     run: str
+    cache_ttl: int
+    statusReq: str
 
     def __init__(
             self,
@@ -150,7 +263,9 @@ class CheckMetadataPy:
             merit: int,
             timeout: int,
             version: int,
-            run: str) -> None:
+            run: str,
+            cache_ttl: int = 0,
+            statusReq: str = "{}") -> None:
         self.name = name
         self.type = type
         self.groups = groups
@@ -160,6 +275,8 @@ class CheckMetadataPy:
         self.timeout = timeout
         self.version = version
         self.run = run
+        self.cache_ttl = cache_ttl
+        self.statusReq = statusReq
         self.__post_init__()
 
     def __post_init__(self) -> None:
@@ -180,12 +297,71 @@ class CheckMetadataPy:
 
 
 class CheckSummary:
+    """
+    Create a new `CheckSummary` object from the check result. `CheckSummary` takes one of the arguments:
+
+    * `result`: A string value in JSON format containing the result tree.
+
+    * `result_tree`: A dict containing the result tree.
+
+    * `trusted`: If `True`, the result tree is not validated, only the error code is computed.
+      Summaries created in the `trusted_summaries` context are trusted too.
+
+    The result tree is decoded and validated once, when the object is created. Consumers read the parsed
+    tree from `result_tree` and must not modify it. The JSON string in `result` is built from the tree
+    when it is requested for the first time. Only the tree is pickled when the summary is sent between
+    processes.
+    """
     error_code: int
-    result: str
+    duration: Optional[float]
+    user_time: Optional[float]
+    system_time: Optional[float]
+    max_rss: Optional[int]
+    skip_reason: Optional[str]
 
-    def __init__(self, result: str) -> None:
-        self.error_code = _result_summary_is_correct(json.loads(result))
-        self.result = result
+    def __init__(
+            self,
+            result: Optional[str] = None,
+            result_tree: Optional[Dict] = None,
+            trusted: bool = False) -> None:
+        if (result is None) == (result_tree is None):
+            raise ValueError("Either result or result_tree must be set.")
+        self._result = result
+        self._result_tree = json.loads(result) if result_tree is None else result_tree
+        trusted = trusted or getattr(_trusted_context, "trusted", False)
+        self.error_code = _result_summary_is_correct(self._result_tree, trusted)
+        self._is_validated = not trusted
+        # Resources used by the check run, they are set by the check runner:
+        # wall-clock and CPU times in seconds and peak resident set size in kilobytes
+        self.duration = None
+        self.user_time = None
+        self.system_time = None
+        self.max_rss = None
+        # Reason why the check was not run, it is set by the check runner
+        self.skip_reason = None
+
+    @property
+    def result(self) -> str:
+        if self._result is None:
+            self._result = json.dumps(self._result_tree)
+        return self._result
+
+    @property
+    def result_tree(self) -> Dict:
+        return self._result_tree
+
+    def _make_json_native(self) -> None:
+        """
+        Replace values of the result tree that are not JSON types as the JSON string of the result would,
+        e.g. tuples become lists. Raise `TypeError` or `ValueError` if the tree cannot be encoded.
+        """
+        if not _is_json_native(self._result_tree):
+            self._result_tree = json.loads(json.dumps(self._result_tree))
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state["_result"] = None
+        return state
 
     def __str__(self) -> str:
         result = f"{type(self).__name__}("
@@ -214,7 +390,10 @@ def check_correct_summary(function: Callable) -> Callable:
     @wraps(function)
     def wrapper(self, *args, **kwargs):
         ret = function(self, *args, **kwargs)
-        _result_summary_is_correct(json.loads(ret.result))
+        # A summary validated when it was created is not validated again
+        if not getattr(ret, "_is_validated", False):
+            result_tree = ret.result_tree if isinstance(ret, CheckSummary) else json.loads(ret.result)
+            _result_summary_is_correct(result_tree)
         return ret
     return wrapper
 
@@ -222,6 +401,8 @@ def check_correct_summary(function: Callable) -> Callable:
 class BaseCheck:
     metadata: Optional[CheckMetadataPy] = None
     summary: Optional[CheckSummary] = None
+    # Summaries of trusted checks are not validated, it is set for checkers shipped with the utility
+    trusted: bool = False
 
     def __init__(
             self,
@@ -43,7 +43,7 @@ class CheckC(BaseCheck):
 
     @trace(log_args=True)
     def run(self, data: Dict) -> CheckSummary:
-        run_result = self.check_list[self.index].run(json.dumps(data).encode('utf-8'))
+        run_result = self.check_list[self.index].run(json.dumps(dict(data)).encode('utf-8'))
         return CheckSummary(
             result=run_result.result.decode("utf-8")
         )
@@ -0,0 +1,138 @@
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+import json
+import logging
+import os
+import platform
+import time
+
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, Optional
+
+from modules.check.check import BaseCheck, CheckSummary
+
+
+DEFAULT_CACHE_FOLDER = Path.home() / "intel" / "diagnostics" / "cache"
+
+
+class CheckResultCache:
+    """
+    On-disk cache of check results shared between runs of the utility.
+
+    Only checks with a positive `cache_ttl` in metadata are cached. An entry is keyed by the check name,
+    the check version, the API version and a digest of the dependency data passed to the check, so
+    a cached result is invalidated as soon as the result of any upstream check changes.
+    Results with the ERROR status are never cached.
+    Durations of all checks that were run are saved as well, they are used to estimate
+    whether a check can finish in the time budget of the run.
+
+    * `read`: Use cached results if they are not expired.
+    * `write`: Save results of checks that were run.
+    """
+
+    def __init__(
+            self,
+            api_version: str,
+            folder: Path = DEFAULT_CACHE_FOLDER,
+            read: bool = True,
+            write: bool = True) -> None:
+        self.api_version = api_version
+        self.folder = folder / platform.node()
+        self.read = read
+        self.write = write
+        self._durations: Optional[Dict[str, float]] = None
+
+    def _get_key(self, check: BaseCheck, data: Dict) -> str:
+        metadata = check.get_metadata()
+        key_data = {
+            "name": metadata.name,
+            "version": metadata.version,
+            "api_version": self.api_version,
+            "data": data
+        }
+        return sha256(json.dumps(key_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _get_file(self, check: BaseCheck) -> Path:
+        return self.folder / f"{check.get_metadata().name}.json"
+
+    def get(self, check: BaseCheck, data: Dict) -> Optional[CheckSummary]:
+        metadata = check.get_metadata()
+        if not self.read or metadata.cache_ttl <= 0:
+            return None
+        cache_file = self._get_file(check)
+        if not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, mode="r", encoding="utf-8") as file:
+                entry = json.load(file)
+            if entry["key"] != self._get_key(check, data):
+                return None
+            if time.time() - entry["time"] > metadata.cache_ttl:
+                return None
+            summary = CheckSummary(result=entry["result"])
+        except Exception as error:
+            logging.warning(f"Cannot read cached result of the {metadata.name}: {error}")
+            return None
+        logging.info(f"The cached result of the {metadata.name} is used.")
+        return summary
+
+    def set(self, check: BaseCheck, data: Dict, summary: CheckSummary) -> None:
+        metadata = check.get_metadata()
+        if not self.write or metadata.cache_ttl <= 0 or summary.error_code == 3:
+            return
+        cache_file = self._get_file(check)
+        entry = {
+            "key": self._get_key(check, data),
+            "time": time.time(),
+            "result": summary.result
+        }
+        try:
+            self.folder.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temporary_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temporary_file, mode="w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(temporary_file, cache_file)
+        except Exception as error:
+            logging.warning(f"Cannot save result of the {metadata.name} to the cache: {error}")
+
+    def _get_durations(self) -> Dict[str, float]:
+        if self._durations is None:
+            self._durations = {}
+            durations_file = self.folder / "durations.json"
+            if durations_file.exists():
+                try:
+                    with open(durations_file, mode="r", encoding="utf-8") as file:
+                        self._durations = json.load(file)
+                except Exception as error:
+                    logging.warning(f"Cannot read durations of checks: {error}")
+        return self._durations
+
+    def get_duration(self, check: BaseCheck) -> Optional[float]:
+        metadata = check.get_metadata()
+        return self._get_durations().get(f"{metadata.name}:{metadata.version}")
+
+    def set_duration(self, check: BaseCheck, duration: float) -> None:
+        if not self.write:
+            return
+        metadata = check.get_metadata()
+        durations = self._get_durations()
+        durations[f"{metadata.name}:{metadata.version}"] = duration
+        durations_file = self.folder / "durations.json"
+        try:
+            self.folder.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temporary_file = durations_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temporary_file, mode="w", encoding="utf-8") as file:
+                json.dump(durations, file)
+            os.replace(temporary_file, durations_file)
+        except Exception as error:
+            logging.warning(f"Cannot save duration of the {metadata.name}: {error}")
@@ -14,50 +14,93 @@ import subprocess
 import json
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 from modules.check.check import BaseCheck, CheckSummary, CheckMetadataPy
 
 from modules.log import trace  # type: ignore
 
 
-def _run_check(path: Path, param: str) -> str:
+def _run_check(path: Path, param: str, *args: str, input: Optional[str] = None) -> str:
     process = subprocess.Popen(
-        [path, param], stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8")
-    stdout, _ = process.communicate()
+        [path, param, *args], stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8")
+    stdout, _ = process.communicate(input=input)
     if process.returncode != 0:
         raise Exception(f"Cannot run {path} with {param}")
     return stdout.strip()
 
 
+def _get_metadata(metadata_dict: Dict) -> CheckMetadataPy:
+    return CheckMetadataPy(
+        name=metadata_dict["name"],
+        type=metadata_dict["type"],
+        groups=metadata_dict["groups"],
+        descr=metadata_dict["descr"],
+        dataReq=metadata_dict["dataReq"],
+        merit=metadata_dict["merit"],
+        timeout=metadata_dict["timeout"],
+        version=metadata_dict["version"],
+        run=metadata_dict["run"],
+        cache_ttl=metadata_dict.get("cache_ttl", 0),
+        statusReq=metadata_dict.get("statusReq", "{}")
+    )
+
+
+def _describe(path: Path) -> Optional[Tuple[str, List[CheckMetadataPy]]]:
+    """
+    Return the API version and metadata of all checks of the checker got by one `--describe` call.
+    Return `None` if the checker does not support `--describe`.
+    """
+    try:
+        description = json.loads(_run_check(path, "--describe"))
+        return description["api_version"], [_get_metadata(metadata) for metadata in description["checks"]]
+    except Exception as error:
+        logging.debug(f"{path} does not support --describe: {error}")
+        return None
+
+
 class CheckExe(BaseCheck):
+    """
+    Check implemented by an executable checker.
+
+    A checker that supports `--describe` is created with the metadata and the API version from
+    the description. Such a checker is run with `--run <check name>`, the dependency data is
+    passed on stdin in JSON format. Other checkers are run with `--get_summary` and cannot
+    receive the dependency data. `is_described` is set for checks created from the checker manifest
+    cache, where the metadata of both kinds of checkers is known without running them.
+    """
 
-    def __init__(self, path: Path):
+    def __init__(
+            self,
+            path: Path,
+            metadata: Optional[CheckMetadataPy] = None,
+            api_version: Optional[str] = None,
+            is_described: Optional[bool] = None) -> None:
         self.path = path
-        metadata_dict = json.loads(_run_check(self.path, "--get_metadata"))
-        self.metadata = CheckMetadataPy(
-            name=metadata_dict["name"],
-            type=metadata_dict["type"],
-            groups=metadata_dict["groups"],
-            descr=metadata_dict["descr"],
-            dataReq=metadata_dict["dataReq"],
-            merit=metadata_dict["merit"],
-            timeout=metadata_dict["timeout"],
-            version=metadata_dict["version"],
-            run=metadata_dict["run"]
-        )
+        self.api_version = api_version
+        self.is_described = metadata is not None if is_described is None else is_described
+        if metadata is None:
+            metadata = _get_metadata(json.loads(_run_check(self.path, "--get_metadata")))
+        self.metadata = metadata
 
     def get_api_version(self) -> str:
-        return _run_check(self.path, "--get_api_version")
+        if self.api_version is None:
+            self.api_version = _run_check(self.path, "--get_api_version")
+        return self.api_version
 
     @trace(log_args=True)
     def run(self, data: Dict) -> CheckSummary:
-        if bool(data):
-            raise NotImplementedError("Unable to pass data to the exe module. Implement the exe module.")
-        get_summary = _run_check(self.path, "--get_summary").replace("\n", "")
-        summary_dict = json.loads(get_summary)
+        if self.is_described:
+            get_summary = _run_check(self.path, "--run", self.metadata.name, input=json.dumps(dict(data)))
+        elif bool(data):
+            raise NotImplementedError(
+                "Unable to pass data to the exe module. Implement the --describe option in the exe module.")
+        else:
+            get_summary = _run_check(self.path, "--get_summary")
+        summary_dict = json.loads(get_summary.replace("\n", ""))
         return CheckSummary(
-            result=json.dumps(summary_dict["result"])
+            result_tree=summary_dict["result"]
         )
 
 
@@ -66,7 +109,12 @@ def getChecksExe(checker_path: Path, version: str) -> List[BaseCheck]:
     if not checker_path.exists():
         logging.error(f"Failed to load {str(checker_path)}: File not found.")
         raise OSError(f"Failed to load {str(checker_path)}: File not found.")
-    if _run_check(checker_path, "--get_api_version") != version:
+    description = _describe(checker_path)
+    api_version = description[0] if description is not None \
+        else _run_check(checker_path, "--get_api_version")
+    if api_version != version:
         logging.error(f"Failed to load {str(checker_path)}:{str(checker_path)} is incompatible.")
         raise ValueError(f"Failed to load {str(checker_path)}:{str(checker_path)} is incompatible.")
+    if description is not None:
+        return [CheckExe(checker_path, metadata, api_version) for metadata in description[1]]
     return [CheckExe(checker_path)]
@@ -9,18 +9,117 @@
 #
 # *******************************************************************************/
 
-from typing import Sequence
+import importlib
+import importlib.util
+import sys
+import threading
+
+from functools import lru_cache
+from hashlib import sha256
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec, PathFinder
+from types import ModuleType
+from typing import Dict, Optional, Sequence
 from pathlib import Path
 
+from modules import bundle
 from modules.check.check import CheckMetadataPy
+from modules.check.check_static_py import get_static_metadata
+
+
+_import_lock = threading.Lock()
+
+
+class _CheckerFoldersFinder(MetaPathFinder):
+    """
+    Find top level modules in the folders of the imported checkers, so a checker can import its sibling
+    modules by name as it could when the checker folders were added to `sys.path`. The finder is the last
+    one in `sys.meta_path`, so it is asked only for the modules that are not found on `sys.path`.
+    """
+
+    def __init__(self) -> None:
+        # Folders in the order the checkers are imported, the dict is used as an ordered set
+        self.folders: Dict[str, None] = {}
+
+    def find_spec(self, fullname, path, target=None) -> Optional[ModuleSpec]:
+        if path is not None or len(self.folders) == 0:
+            return None
+        return PathFinder.find_spec(fullname, list(self.folders))
+
+
+_checker_folders_finder = _CheckerFoldersFinder()
+
+
+def _add_checker_folder(folder: Path) -> None:
+    if _checker_folders_finder not in sys.meta_path:
+        sys.meta_path.append(_checker_folders_finder)
+    _checker_folders_finder.folders[str(folder)] = None
+
+
+@lru_cache(maxsize=None)
+def _get_module_spec(checker_path: Path) -> ModuleSpec:
+    # The module name is unique for the path, so checkers with the same file name do not collide
+    path_digest = sha256(str(checker_path).encode("utf-8")).hexdigest()[:16]
+    module_name = f"diagnostics_checker_{path_digest}_{checker_path.stem}"
+    if bundle.is_in_bundle(checker_path):
+        return bundle.get_module_spec(module_name, checker_path)
+    spec = importlib.util.spec_from_file_location(module_name, checker_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot import {checker_path}.")
+    return spec
+
+
+# Names of the checker modules that are imported as a part of their packages, by the resolved file paths
+_checker_module_names: Dict[Path, str] = {}
+
+
+def register_checker_module(checker_path: Path, module_name: str) -> None:
+    """
+    Import the checker file by the module name, e.g. the checker registered by the entry point
+    of an installed package, so its relative imports are resolved in the package.
+    """
+    _checker_module_names[checker_path.resolve()] = module_name
+
+
+def import_checker_module(checker_path: Path) -> ModuleType:
+    """
+    Import the checker module from the file without adding its folder to `sys.path`. Modules that are
+    not found on `sys.path` are looked up in the folders of the imported checkers. A registered checker
+    module is imported by its name.
+    """
+    checker_path = checker_path.resolve()
+    module_name = _checker_module_names.get(checker_path)
+    if module_name is not None:
+        return importlib.import_module(module_name)
+    spec = _get_module_spec(checker_path)
+    with _import_lock:
+        module = sys.modules.get(spec.name)
+        if module is None:
+            if not bundle.is_in_bundle(checker_path):
+                _add_checker_folder(checker_path.parent)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = module
+            try:
+                spec.loader.exec_module(module)  # type: ignore
+            except BaseException:
+                del sys.modules[spec.name]
+                raise
+    return module
 
 
 class CheckListPy(Sequence[CheckMetadataPy]):
 
-    def __init__(self, module_name: Path):
-        # load checker module
+    def __init__(self, module_name: Path, import_name: Optional[str] = None):
         self.module_name = module_name
-        self.checker_module = __import__(self.module_name.stem)
+        self._checker_module: Optional[ModuleType] = None
+        if import_name is not None:
+            register_checker_module(module_name, import_name)
+
+        static_metadata = get_static_metadata(self.module_name)
+        if static_metadata is not None:
+            # the checker module is imported only when one of its checks is run
+            self.api_version, self.checkers = static_metadata
+            return
 
         # get version api
         self.api_version = self.checker_module.get_api_version()
@@ -28,8 +127,15 @@ class CheckListPy(Sequence[CheckMetadataPy]):
         # get checkers list
         self.checkers = self.checker_module.get_check_list()
 
+    @property
+    def checker_module(self) -> ModuleType:
+        if self._checker_module is None:
+            self._checker_module = import_checker_module(self.module_name)
+        return self._checker_module
+
     def __reduce__(self):
-        return (self.__class__, (self.module_name,))
+        # The registered module name is sent, so a spawned process imports the module in the same way
+        return (self.__class__, (self.module_name, _checker_module_names.get(self.module_name.resolve())))
 
     def __getitem__(self, key: int) -> CheckMetadataPy:
         if isinstance(key, slice):
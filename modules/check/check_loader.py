@@ -9,17 +9,27 @@
 #
 # *******************************************************************************/
 
+import json
 import logging
 import os
 import platform
+import sys
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from hashlib import sha256
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Set, Tuple
 
-from modules.check.check import BaseCheck, CheckMetadataPy
+from modules import bundle
+from modules.check.check import BaseCheck, CheckMetadataPy, CheckSummary
 from modules.check.check_c import getChecksC
-from modules.check.check_exe import getChecksExe
-from modules.check.check_py import getChecksPy
+from modules.check.check_cache import DEFAULT_CACHE_FOLDER
+from modules.check.check_exe import CheckExe, getChecksExe
+from modules.check.check_list_py import register_checker_module
+from modules.check.check_py import CheckPy, getChecksPy
+from modules.check.check_static_py import get_static_metadata
 
 from modules.files_helper import read_config_data, get_checkers_to_load_from_config_data, \
     get_files_list_from_folder
@@ -40,48 +50,400 @@ DEFAULT_CHECKERS_PATHS = [
     _FULL_PATH_TO_CURRENT_FILE / ".." / "opt" / "diagnostics" / "checkers_exe",
     _FULL_PATH_TO_CURRENT_FILE / ".." / "opt" / "diagnostics" / "checkers_py"
 ]
+# Checker files are loaded concurrently, most of the loading time is waiting for subprocesses and I/O
+MAX_LOADING_JOBS = 16
+# Installed packages register Python checker modules under this entry point group
+ENTRY_POINTS_GROUP = "diagnostics_utility.checkers"
 
 
-@trace(log_args=True)
-def load_checks_from_checker(
-        checker_path: Path, version: str, loaded_checks_map: Dict[Path, CheckMetadataPy]) -> List[BaseCheck]:
-    check_list = []
-    if not checker_path.exists():
-        logging.warning(f"Checker not found at this path: {checker_path}.")
-        return check_list
+def _get_stat(checker_path: Path) -> os.stat_result:
+    # A checker file of the zipapp bundle is changed only together with the bundle
+    archive_path = bundle.get_archive_path(checker_path)
+    return (archive_path or checker_path).stat()
+
+
+class CheckerManifestCache:
+    """
+    On-disk cache of the metadata of checks in checker files shared between runs of the utility.
+
+    An entry is keyed by the checker path and is valid while the modification time and the size of
+    the file are not changed, so loading of a checker file can be skipped until the check is run.
+
+    * `read`: Use valid entries instead of loading checker files.
+    * `write`: Save entries of loaded checker files.
+    """
+
+    def __init__(self, folder: Path = DEFAULT_CACHE_FOLDER, read: bool = True, write: bool = True) -> None:
+        self.file = folder / platform.node() / "manifest.json"
+        self.read = read
+        self.write = write
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._is_changed = False
+        # Checker files are loaded from several threads
+        self._lock = threading.Lock()
+
+    def _get_entries(self) -> Dict[str, Dict]:
+        with self._lock:
+            return self._read_entries()
+
+    def _read_entries(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.read and self.file.exists():
+                try:
+                    with open(self.file, mode="r", encoding="utf-8") as file:
+                        self._entries = json.load(file)
+                except Exception as error:
+                    logging.warning(f"Cannot read the checker manifest cache: {error}")
+        return self._entries
+
+    def get(self, checker_path: Path, version: str) -> Optional[List[CheckMetadataPy]]:
+        if not self.read:
+            return None
+        entry = self._get_entries().get(str(checker_path.resolve()))
+        if entry is None or entry["api_version"] != version:
+            return None
+        stat = _get_stat(checker_path)
+        if entry["mtime"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            return None
+        try:
+            return [CheckMetadataPy(**metadata) for metadata in entry["checks"]]
+        except Exception as error:
+            logging.warning(f"Cannot read cached metadata of {checker_path}: {error}")
+            return None
+
+    def is_described(self, checker_path: Path) -> Optional[bool]:
+        """
+        Return whether the executable checker supports `--describe`, `None` for other checkers.
+        Must be called after `get` returned the metadata of the checker.
+        """
+        entry = self._get_entries().get(str(checker_path.resolve()))
+        return entry.get("is_described") if entry is not None else None
+
+    def set(self, checker_path: Path, version: str, checks: List[BaseCheck]) -> None:
+        if not self.write:
+            return
+        stat = _get_stat(checker_path)
+        entry: Dict[str, Any] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "api_version": version,
+            "checks": [dict(check.get_metadata().__dict__) for check in checks]
+        }
+        is_described = [getattr(check, "is_described", None) for check in checks]
+        if None not in is_described:
+            # The protocol of the executable checker is not probed again when its checks are run
+            entry["is_described"] = all(is_described)
+        with self._lock:
+            self._read_entries()[str(checker_path.resolve())] = entry
+            self._is_changed = True
+
+    def save(self) -> None:
+        if not self.write or not self._is_changed:
+            return
+        entries = {path: entry for path, entry in self._get_entries().items() if bundle.exists(Path(path))}
+        try:
+            self.file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temporary_file = self.file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temporary_file, mode="w", encoding="utf-8") as file:
+                json.dump(entries, file)
+            os.replace(temporary_file, self.file)
+            self._is_changed = False
+        except Exception as error:
+            logging.warning(f"Cannot save the checker manifest cache: {error}")
+
+
+def _get_module_file(distribution: Any, module: str) -> Optional[Path]:
+    # The file is located in the distribution without importing parent packages of the module
+    relative_path = Path(*module.split(".")).with_suffix(".py")
+    checker_path = Path(distribution.locate_file(relative_path))
+    return checker_path if checker_path.is_file() else None
+
+
+def _discover_entry_points(paths: List[str]) -> List[Dict[str, str]]:
+    """Return checkers registered under the entry point group by distributions installed in the paths."""
+    try:
+        from importlib import metadata
+    except ImportError:  # Python 3.7 and older
+        logging.debug("Checkers registered by entry points are not supported by this Python version.")
+        return []
+    checkers: List[Dict[str, str]] = []
+    distribution_names = set()
+    for distribution in metadata.distributions(path=paths):
+        # Only the first distribution of the same name is used, as it is done by import
+        name = distribution.metadata["Name"]
+        if name in distribution_names:
+            continue
+        distribution_names.add(name)
+        for entry_point in distribution.entry_points:
+            if entry_point.group != ENTRY_POINTS_GROUP:
+                continue
+            module = entry_point.value.split(":")[0].strip()
+            checker_path = _get_module_file(distribution, module)
+            if checker_path is None:
+                logging.warning(
+                    f"The {module} checker module of the {name} package is not found, "
+                    f"only modules installed as files are supported.")
+                continue
+            checkers.append({
+                "name": entry_point.name, "package": name, "module": module, "path": str(checker_path)
+            })
+    return sorted(checkers, key=lambda checker: (checker["package"], checker["name"]))
+
+
+class CheckerEntryPointsIndex:
+    """
+    On-disk index of Python checkers registered by installed packages under the `ENTRY_POINTS_GROUP`
+    entry point group, for example in the `pyproject.toml` of the package:
+
+        [project.entry-points."diagnostics_utility.checkers"]
+        my_checker = "my_package.my_checker"
+
+    Reading of entry points requires scanning metadata of all installed packages, so the result is
+    cached. An index is kept for each list of import paths and is valid while the modification times
+    of the folders are not changed, which happens when packages are installed or removed.
+
+    * `read`: Use a valid index instead of scanning installed packages.
+    * `write`: Save the index of scanned packages.
+    """
+
+    def __init__(
+            self, folder: Path = DEFAULT_CACHE_FOLDER, read: bool = True, write: bool = True,
+            paths: Optional[List[str]] = None) -> None:
+        self.file = folder / platform.node() / "entry_points.json"
+        self.read = read
+        self.write = write
+        self.paths = paths if paths is not None else sys.path
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._is_changed = False
+
+    def _read_entries(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.read and self.file.exists():
+                try:
+                    with open(self.file, mode="r", encoding="utf-8") as file:
+                        self._entries = json.load(file)
+                except Exception as error:
+                    logging.warning(f"Cannot read the checker entry points index: {error}")
+        return self._entries
+
+    def _get_fingerprint(self) -> List[List]:
+        fingerprint = []
+        for path in self.paths:
+            try:
+                fingerprint.append([path, os.stat(path or ".").st_mtime_ns])
+            except OSError:
+                fingerprint.append([path, None])
+        return fingerprint
+
+    def get_checkers_modules(self) -> List[Tuple[Path, str]]:
+        """Return paths and module names of checkers of installed packages, no module is imported."""
+        key = sha256("\n".join(self.paths).encode("utf-8")).hexdigest()[:16]
+        fingerprint = self._get_fingerprint()
+        entry = self._read_entries().get(key)
+        # Indexes saved without the module names are scanned again
+        if not self.read or entry is None or entry["fingerprint"] != fingerprint or \
+           any("module" not in checker for checker in entry["checkers"]):
+            entry = {"fingerprint": fingerprint, "checkers": _discover_entry_points(list(self.paths))}
+            self._read_entries()[key] = entry
+            self._is_changed = True
+        return [(Path(checker["path"]), checker["module"]) for checker in entry["checkers"]]
+
+    def get_checkers_paths(self) -> List[Path]:
+        """Return paths of checker modules registered by installed packages, no module is imported."""
+        return [checker_path for checker_path, _ in self.get_checkers_modules()]
+
+    def save(self) -> None:
+        if not self.write or not self._is_changed:
+            return
+        try:
+            self.file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temporary_file = self.file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temporary_file, mode="w", encoding="utf-8") as file:
+                json.dump(self._read_entries(), file)
+            os.replace(temporary_file, self.file)
+            self._is_changed = False
+        except Exception as error:
+            logging.warning(f"Cannot save the checker entry points index: {error}")
+
+
+class LazyCheck(BaseCheck):
+    """
+    Check created from lightweight metadata: the checker manifest cache or the source code of
+    the Python checker. The checker file is loaded when the check is materialized, which is done
+    for the selected checks and their dependencies before they are run.
+    If `is_described` of an executable checker is known from the manifest, the check is created
+    from the metadata without running the checker.
+    """
+
+    def __init__(
+            self, checker_path: Path, version: str, metadata: CheckMetadataPy,
+            is_described: Optional[bool] = None) -> None:
+        super().__init__(metadata)
+        self.checker_path = checker_path
+        self.version = version
+        self.is_described = is_described
+        self._check: Optional[BaseCheck] = None
+
+    def materialize(self, loaded_checks: Optional[List[BaseCheck]] = None) -> BaseCheck:
+        if self._check is None:
+            if loaded_checks is None and self.is_described is not None:
+                loaded_checks = [CheckExe(
+                    bundle.get_filesystem_path(self.checker_path), self.metadata, self.version,
+                    self.is_described)]
+            if loaded_checks is None:
+                loaded_checks = _load_checker_file(self.checker_path, self.version)
+            for check in loaded_checks:
+                if check.get_metadata().name == self.metadata.name:
+                    self._check = check
+                    break
+            else:
+                raise ValueError(f"The {self.metadata.name} is not found in {self.checker_path}.")
+            # Metadata could be updated from the config, so the metadata of the proxy is used
+            self._check.metadata = self.metadata
+        return self._check
+
+    def get_api_version(self) -> str:
+        return self.version
+
+    def run(self, data: Dict) -> CheckSummary:
+        return self.materialize().run(data)
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state["_check"] = None
+        return state
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}('checker_path'='{self.checker_path}', 'metadata'='{self.metadata}')"
+
+
+def materialize_checks(checks: List[BaseCheck]) -> None:
+    """
+    Load the checker files of lazy checks, each checker file is loaded once. Python checker modules
+    of the checks are imported too, so the check processes forked later inherit them. A module that
+    cannot be imported here is imported again when its check is run and the error is reported then.
+    """
+    loaded_checkers: Dict[Path, List[BaseCheck]] = {}
+    for check in checks:
+        if isinstance(check, LazyCheck) and check.is_described is not None:
+            check = check.materialize()
+        elif isinstance(check, LazyCheck):
+            if check.checker_path not in loaded_checkers:
+                loaded_checkers[check.checker_path] = _load_checker_file(check.checker_path, check.version)
+            check = check.materialize(loaded_checkers[check.checker_path])
+        if isinstance(check, CheckPy):
+            try:
+                check.check_list.checker_module
+            except Exception as error:
+                logging.debug(f"Cannot import the checker module {check.check_list.module_name}: {error}")
+
+
+@lru_cache(maxsize=None)
+def _get_default_checkers_folders() -> Set[Path]:
+    return {path.resolve() for path in DEFAULT_CHECKERS_PATHS}
+
+
+def _load_checker_file(checker_path: Path, version: str) -> List[BaseCheck]:
+    check_list: List[BaseCheck] = []
+    if checker_path.suffix != ".py":
+        # Native and executable checkers of the zipapp bundle are extracted on first use
+        checker_path = bundle.get_filesystem_path(checker_path)
     if checker_path.suffix == ".so" or checker_path.suffix == ".dll":
         check_list = getChecksC(checker_path, version)
     elif checker_path.suffix == ".py" and not checker_path.name.startswith("__"):
         check_list = getChecksPy(checker_path, version)
     elif checker_path.suffix == ".sh":
-        if not os.access(checker_path, os.X_OK):
-            logging.warning(f"A checker does not have execute permissions: {checker_path}.")
-            return check_list
         check_list = getChecksExe(checker_path, version)
     elif checker_path.suffix == ".bat":  # TODO: Add more executable types
         check_list = getChecksExe(checker_path, version)
+    # Results of Python checkers shipped with the utility are not validated, only their status is computed
+    if checker_path.suffix == ".py" and checker_path.resolve().parent in _get_default_checkers_folders():
+        for check in check_list:
+            check.trusted = True
+    return check_list
+
+
+def _get_static_checks(checker_path: Path, version: str) -> Optional[List[BaseCheck]]:
+    """Return lazy checks of the Python checker if its metadata can be read without import."""
+    if checker_path.suffix != ".py" or checker_path.name.startswith("__"):
+        return None
+    static_metadata = get_static_metadata(checker_path)
+    # An incompatible checker is loaded to report the error
+    if static_metadata is None or static_metadata[0] != version or len(static_metadata[1]) == 0:
+        return None
+    return [LazyCheck(checker_path, version, metadata) for metadata in static_metadata[1]]
+
+
+@trace(log_args=True)
+def load_checks_from_checker(
+        checker_path: Path, version: str, loaded_checks_map: Dict[Path, CheckMetadataPy],
+        manifest_cache: Optional[CheckerManifestCache] = None) -> List[BaseCheck]:
+    check_list: List[BaseCheck] = []
+    if not bundle.exists(checker_path):
+        logging.warning(f"Checker not found at this path: {checker_path}.")
+        return check_list
+    if checker_path.suffix == ".sh" and not bundle.is_executable(checker_path):
+        logging.warning(f"A checker does not have execute permissions: {checker_path}.")
+        return check_list
+    cached_metadata = manifest_cache.get(checker_path, version) if manifest_cache is not None else None
+    if cached_metadata is not None:
+        is_described = manifest_cache.is_described(checker_path) if manifest_cache is not None else None
+        check_list = [
+            LazyCheck(checker_path, version, metadata, is_described) for metadata in cached_metadata
+        ]
+    else:
+        static_check_list = _get_static_checks(checker_path, version)
+        check_list = static_check_list if static_check_list is not None \
+            else _load_checker_file(checker_path, version)
+        if manifest_cache is not None and len(check_list) != 0:
+            manifest_cache.set(checker_path, version, check_list)
     loaded_checks_map.update({checker_path: check.get_metadata() for check in check_list})
     return check_list
 
 
 @trace(log_args=True)
 def load_checks(
-        paths: List[Path], version: str, loaded_checks_map: Dict[Path, CheckMetadataPy]) -> List[BaseCheck]:
-    checks = []
-    for file in paths:
-        checks.extend(load_checks_from_checker(file, version, loaded_checks_map))
+        paths: List[Path], version: str, loaded_checks_map: Dict[Path, CheckMetadataPy],
+        manifest_cache: Optional[CheckerManifestCache] = None) -> List[BaseCheck]:
+    """
+    Load checker files concurrently. Checks and the map of loaded checks are merged in the order of paths.
+    If some checker files cannot be loaded, the error with the reasons of all failures is raised.
+    """
+    checks: List[BaseCheck] = []
+    if len(paths) == 0:
+        return checks
+    checkers_maps: List[Dict[Path, CheckMetadataPy]] = [{} for _ in paths]
+    with ThreadPoolExecutor(max_workers=min(len(paths), MAX_LOADING_JOBS)) as executor:
+        futures = [
+            executor.submit(load_checks_from_checker, file, version, checker_map, manifest_cache)
+            for file, checker_map in zip(paths, checkers_maps)
+        ]
+    errors: List[str] = []
+    for future, checker_map in zip(futures, checkers_maps):
+        try:
+            checks.extend(future.result())
+        except Exception as error:
+            errors.append(str(error))
+            continue
+        loaded_checks_map.update(checker_map)
+    if len(errors) != 0:
+        raise ValueError("\n".join(errors))
     return checks
 
 
 @trace(log_args=True)
 def load_checks_from_config(
-        config: Path, version: str, loaded_checks_map: Dict[Path, CheckMetadataPy]) -> List[BaseCheck]:
+        config: Path, version: str, loaded_checks_map: Dict[Path, CheckMetadataPy],
+        manifest_cache: Optional[CheckerManifestCache] = None) -> List[BaseCheck]:
     result: List[BaseCheck] = []
     try:
         config_data = read_config_data(config)
         checkers_to_load = get_checkers_to_load_from_config_data(config_data)
         for checker in checkers_to_load:
-            loaded_checks = load_checks_from_checker(Path(checker), version, loaded_checks_map)
+            loaded_checks = load_checks_from_checker(
+                Path(checker), version, loaded_checks_map, manifest_cache)
             if len(loaded_checks) == 0:
                 raise ValueError(f"No checks were found from checker file: {checker}")
             result.extend(loaded_checks)
@@ -93,17 +455,17 @@ def load_checks_from_config(
 
 @trace(log_args=True)
 def load_default_checks(
-        version: str, loaded_checks_map: Dict[Path, CheckMetadataPy]) -> List[BaseCheck]:
+        version: str, loaded_checks_map: Dict[Path, CheckMetadataPy],
+        manifest_cache: Optional[CheckerManifestCache] = None) -> List[BaseCheck]:
     # TODO: customization of directories to search
     # TODO: recursive search
     result: List[BaseCheck] = []
     try:
+        # Checker files of all folders are loaded at once
+        files: List[Path] = []
         for path in DEFAULT_CHECKERS_PATHS:
-            result.extend(load_checks(
-                get_files_list_from_folder(path),
-                version,
-                loaded_checks_map
-            ))
+            files.extend(get_files_list_from_folder(path))
+        result.extend(load_checks(files, version, loaded_checks_map, manifest_cache))
     except Exception as error:
         print(error)
         exit(1)
@@ -112,7 +474,8 @@ def load_default_checks(
 
 @trace(log_args=True)
 def load_checks_from_env(
-        version: str, loaded_checks_map: Dict[Path, CheckMetadataPy]) -> List[BaseCheck]:
+        version: str, loaded_checks_map: Dict[Path, CheckMetadataPy],
+        manifest_cache: Optional[CheckerManifestCache] = None) -> List[BaseCheck]:
     result: List[BaseCheck] = []
     try:
         DIAGUTIL_PATH_ENV = os.getenv("DIAGUTIL_PATH")
@@ -125,12 +488,34 @@ def load_checks_from_env(
             if not path.exists():
                 raise ValueError(f"{path} does not exist.")
             if path.is_dir():
-                result.extend(load_checks(get_files_list_from_folder(path), version, loaded_checks_map))
+                result.extend(load_checks(
+                    get_files_list_from_folder(path), version, loaded_checks_map, manifest_cache))
             elif path.is_file():
-                result.extend(load_checks_from_checker(path, version, loaded_checks_map))
+                result.extend(load_checks_from_checker(path, version, loaded_checks_map, manifest_cache))
             else:
                 raise ValueError(f"{path} is not a file or directory.")
     except Exception as error:
         print(error)
         exit(1)
     return result
+
+
+@trace(log_args=True)
+def load_checks_from_entry_points(
+        version: str, loaded_checks_map: Dict[Path, CheckMetadataPy],
+        manifest_cache: Optional[CheckerManifestCache] = None,
+        entry_points_index: Optional[CheckerEntryPointsIndex] = None) -> List[BaseCheck]:
+    result: List[BaseCheck] = []
+    try:
+        if entry_points_index is None:
+            entry_points_index = CheckerEntryPointsIndex(read=False, write=False)
+        checkers_modules = entry_points_index.get_checkers_modules()
+        # Checker modules are imported as a part of their packages, so relative imports are resolved
+        for checker_path, module_name in checkers_modules:
+            register_checker_module(checker_path, module_name)
+        checkers_paths = [checker_path for checker_path, _ in checkers_modules]
+        result.extend(load_checks(checkers_paths, version, loaded_checks_map, manifest_cache))
+    except Exception as error:
+        print(error)
+        exit(1)
+    return result
@@ -9,14 +9,14 @@
 #
 # *******************************************************************************/
 
-import sys
 import logging
 
 from pathlib import Path
 from typing import List, Dict
 
+from modules import bundle
 from modules.check.check_list_py import CheckListPy
-from modules.check.check import CheckMetadataPy, BaseCheck, CheckSummary
+from modules.check.check import CheckMetadataPy, BaseCheck, CheckSummary, trusted_summaries
 
 from modules.log import trace  # type: ignore
 
@@ -33,7 +33,8 @@ class CheckPy(BaseCheck):
     @trace(log_args=True)
     def run(self, data: Dict) -> CheckSummary:
         func = getattr(self.check_list.checker_module, self.metadata.run)
-        return func(data)
+        with trusted_summaries(self.trusted):
+            return func(data)
 
     def __str__(self) -> str:
         return f"{type(self).__name__}('check_list'='{self.check_list}', 'metadata'='{self.metadata}')"
@@ -41,10 +42,9 @@ class CheckPy(BaseCheck):
 
 @trace(log_args=True)
 def getChecksPy(checker_path: Path, version: str) -> List[BaseCheck]:
-    if not checker_path.exists():
+    if not bundle.exists(checker_path):
         logging.error(f"Failed to load {str(checker_path)}: No such file.")
         raise OSError(f"Failed to load {str(checker_path)}: No such file.")
-    sys.path.append(str(checker_path.parent))
     check_list = CheckListPy(checker_path)
     if check_list.api_version != version:
         logging.error(f"Failed to load {str(checker_path)}:{str(checker_path)} is incompatible.")
@@ -0,0 +1,84 @@
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from modules.check.check import BaseCheck
+
+
+class CheckRegistry:
+    """
+    Loaded checks indexed by name, by name and version, and by group.
+
+    Checks keep the order in which they were added. A check with the name of an already added check
+    is not indexed, it is recorded as a duplicate instead.
+    """
+
+    def __init__(self, checks: Iterable[BaseCheck] = ()) -> None:
+        self._checks: List[BaseCheck] = []
+        self._positions: Dict[str, int] = {}
+        self._by_name: Dict[str, BaseCheck] = {}
+        self._by_name_and_version: Dict[Tuple[str, int], BaseCheck] = {}
+        self._by_group: Dict[str, List[BaseCheck]] = {}
+        self._duplicates: Dict[str, List[BaseCheck]] = {}
+        for check in checks:
+            self.add(check)
+
+    def add(self, check: BaseCheck) -> bool:
+        """Add the check, return `False` if a check with the same name was already added."""
+        metadata = check.get_metadata()
+        if metadata.name in self._by_name:
+            self._duplicates.setdefault(metadata.name, [self._by_name[metadata.name]]).append(check)
+            return False
+        self._positions[metadata.name] = len(self._checks)
+        self._checks.append(check)
+        self._by_name[metadata.name] = check
+        self._by_name_and_version[(metadata.name, metadata.version)] = check
+        for group in set(metadata.groups.split(",")):
+            self._by_group.setdefault(group, []).append(check)
+        return True
+
+    def get(self, name: str, version: Optional[int] = None) -> Optional[BaseCheck]:
+        """Return the check with the name and, if it is given, the version."""
+        if version is None:
+            return self._by_name.get(name)
+        return self._by_name_and_version.get((name, version))
+
+    def get_group(self, group: str) -> List[BaseCheck]:
+        return list(self._by_group.get(group, []))
+
+    def select(self, selection: Iterable[str]) -> List[BaseCheck]:
+        """Return checks which names or groups are in the selection, `all` selects all checks."""
+        selection = set(selection)
+        if "all" in selection:
+            return list(self._checks)
+        selected: Dict[str, BaseCheck] = {}
+        for item in selection:
+            check = self._by_name.get(item)
+            if check is not None:
+                selected[item] = check
+            for check in self._by_group.get(item, []):
+                selected[check.get_metadata().name] = check
+        return [selected[name] for name in sorted(selected, key=self._positions.__getitem__)]
+
+    @property
+    def duplicates(self) -> Dict[str, List[BaseCheck]]:
+        """Checks with the same name, the first one is the indexed check."""
+        return {name: list(checks) for name, checks in self._duplicates.items()}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
+
+    def __iter__(self) -> Iterator[BaseCheck]:
+        return iter(self._checks)
+
+    def __len__(self) -> int:
+        return len(self._checks)
@@ -11,127 +11,845 @@
 
 import json
 import logging
+import os
+import pickle
+import signal
+import time
 
-from typing import Dict, List, Set, Tuple
-from multiprocessing import Process, Pipe
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from queue import Queue
+from threading import Lock, current_thread, main_thread
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from multiprocessing import Process, Pipe, get_all_start_methods, get_context, get_start_method
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
 
-from modules.check.check import BaseCheck, CheckSummary
+from modules.check.check import BaseCheck, CheckSummary, ERROR_CODE_TO_STATUS
+from modules.check.check_cache import CheckResultCache
+from modules.check.check_registry import CheckRegistry
+from modules.check.result_store import ResultStore, StoredResults
 
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
 
-def _check_run(connection, check, data) -> None:
+
+def _get_crashed_check_summary(check: BaseCheck) -> CheckSummary:
+    json_dict = {
+        "CheckStatus": "ERROR",
+        "Verbosity": 0,
+        "Message": "",
+        "CheckResult": {
+            f"{check.get_metadata().name}": {
+                "CheckResult": "",
+                "Verbosity": 0,
+                "Message": "The check crashed at runtime. No data was received. "
+                           "See call stack above.",
+                "CheckStatus": "ERROR"
+            }
+        }
+    }
+    json_str = json.dumps(json_dict)
+    return CheckSummary(result=json_str)
+
+
+def _get_timeout_check_summary(
+        check: BaseCheck,
+        survived_processes: Optional[List[str]] = None) -> CheckSummary:
+    message = ""
+    if survived_processes:
+        message = "The following processes were not terminated: " + ", ".join(survived_processes) + "."
+    json_dict = {
+        "CheckStatus": "ERROR",
+        "Verbosity": 0,
+        "Message": "",
+        "CheckResult": {
+            f"{check.get_metadata().name}": {
+                "CheckResult": "Timeout was exceeded.",
+                "Verbosity": 0,
+                "Message": message,
+                "CheckStatus": "ERROR"
+            }
+        }
+    }
+    json_str = json.dumps(json_dict)
+    return CheckSummary(result=json_str)
+
+
+def _get_skipped_check_summary(check: BaseCheck, reason: str, message: str) -> CheckSummary:
+    json_dict = {
+        "CheckStatus": "INFO",
+        "Verbosity": 0,
+        "Message": "",
+        "CheckResult": {
+            f"{check.get_metadata().name}": {
+                "CheckResult": f"SKIPPED({reason})",
+                "Verbosity": 0,
+                "Message": message,
+                "CheckStatus": "INFO"
+            }
+        }
+    }
+    json_str = json.dumps(json_dict)
+    summary = CheckSummary(result=json_str)
+    summary.skip_reason = reason
+    return summary
+
+
+def _get_cpu_usage() -> Optional[Tuple[float, float]]:
+    """Return user time and system time of the current process and its waited-for children."""
+    if resource is None:  # pragma: no cover
+        return None
+    self_usage = resource.getrusage(resource.RUSAGE_SELF)
+    children_usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return (
+        self_usage.ru_utime + children_usage.ru_utime,
+        self_usage.ru_stime + children_usage.ru_stime
+    )
+
+
+def _run_with_resource_usage(check, data):
+    """
+    Run the check and set the CPU time spent by the run. The peak RSS is not set, in a worker process
+    it is the peak of all checks run by the worker, not of this check. The mapping of `StoredResults`
+    is closed when the check returns.
+    """
+    start_usage = _get_cpu_usage()
     try:
         result = check.run(data)
-        connection.send(result)
+    finally:
+        # The results read by the check are kept, the file mapping is not needed anymore
+        if isinstance(data, StoredResults):
+            data.close()
+    end_usage = _get_cpu_usage()
+    if isinstance(result, CheckSummary) and start_usage is not None and end_usage is not None:
+        result.user_time = end_usage[0] - start_usage[0]
+        result.system_time = end_usage[1] - start_usage[1]
+    return result
+
+
+def _wait_process(process: BaseProcess, timeout: Optional[float] = None) -> Optional[Any]:
+    """
+    Reap the process and return its resource usage, it includes the usage of the descendants the
+    process waited for. None is returned if the usage is not available on the platform.
+    If `timeout` is set and the process does not exit in `timeout` seconds, it is not reaped.
+    """
+    if not hasattr(os, "wait4"):
+        process.join(timeout)
+        return None
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    while True:
+        try:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG if deadline is not None else 0)
+        except ChildProcessError:
+            process.join(timeout)
+            return None
+        if pid != 0:
+            break
+        if time.monotonic() >= deadline:  # type: ignore
+            return None
+        time.sleep(_TERMINATION_POLL_INTERVAL)
+    # The process is reaped, so multiprocessing cannot get the exit code itself
+    exit_code = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
+    process._popen.returncode = exit_code  # type: ignore
+    process.join()
+    return usage
+
+
+def _set_resource_usage(result: CheckSummary, usage: Optional[Any]) -> None:
+    if usage is None:
+        return
+    result.user_time = usage.ru_utime
+    result.system_time = usage.ru_stime
+    result.max_rss = usage.ru_maxrss
+
+
+TERMINATION_GRACE_PERIOD = 2
+# The longest time to terminate a process tree, SIGTERM and SIGKILL are both followed by the grace period
+TERMINATION_TIME = 2 * TERMINATION_GRACE_PERIOD
+_TERMINATION_POLL_INTERVAL = 0.05
+
+# Process groups of the running check processes and workers
+_process_groups: Set[int] = set()
+_process_groups_lock = Lock()
+
+
+def _start_new_session() -> None:
+    """Move the current process to a new session, so the process and all its descendants form a group."""
+    if hasattr(os, "setsid"):
+        try:
+            os.setsid()
+        except OSError:
+            pass
+
+
+def _get_process_group_members(pgid: int) -> List[str]:
+    """Return the processes of the group that are still running, zombies are skipped."""
+    if not os.path.isdir("/proc"):
+        try:
+            os.killpg(pgid, 0)
+        except OSError:
+            return []
+        return [f"process group {pgid}"]
+    members = []
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat", mode="r") as file:
+                stat = file.read()
+        except OSError:
+            continue
+        name = stat[stat.find("(") + 1:stat.rfind(")")]
+        fields = stat[stat.rfind(")") + 2:].split()
+        if len(fields) > 2 and fields[0] != "Z" and int(fields[2]) == pgid:
+            members.append(f"{pid} ({name})")
+    return members
+
+
+def _wait_process_group(pgid: int, timeout: float) -> List[str]:
+    deadline = time.monotonic() + timeout
+    members = _get_process_group_members(pgid)
+    while members and time.monotonic() < deadline:
+        time.sleep(_TERMINATION_POLL_INTERVAL)
+        members = _get_process_group_members(pgid)
+    return members
+
+
+def _signal_process_group(pgid: int, signal_number: int) -> None:
+    try:
+        os.killpg(pgid, signal_number)
+    except OSError:
+        pass
+
+
+def _add_process_group(pgid: int) -> None:
+    with _process_groups_lock:
+        _process_groups.add(pgid)
+
+
+def _remove_process_group(pgid: int) -> None:
+    with _process_groups_lock:
+        _process_groups.discard(pgid)
+
+
+def _kill_process_groups() -> None:
+    """
+    Kill the process groups of the running check processes and workers.
+
+    The check processes are moved to new sessions, so SIGINT of the terminal does not reach them,
+    and they would be left running if the run was interrupted. The processes are not reaped here,
+    the threads that started them reap them.
+    """
+    if not hasattr(os, "killpg"):
+        return
+    with _process_groups_lock:
+        pgids = list(_process_groups)
+    for pgid in pgids:
+        _signal_process_group(pgid, signal.SIGKILL)
+        try:
+            # The process may not have moved to its new session yet
+            os.kill(pgid, signal.SIGKILL)
+        except OSError:
+            pass
+    for pgid in pgids:
+        _wait_process_group(pgid, TERMINATION_GRACE_PERIOD)
+
+
+@contextmanager
+def _killing_process_groups_on_exit() -> Iterator[None]:
+    """Kill the process groups of the running checks if the run exits with an exception, e.g. on Ctrl+C."""
+    try:
+        yield
+    except BaseException:
+        _kill_process_groups()
+        raise
+
+
+def _terminate_process_tree(process: BaseProcess) -> Tuple[List[str], Optional[Any]]:
+    """
+    Terminate the process and all its descendants, and reap the process.
+
+    The process is expected to be the leader of its own process group. SIGTERM is sent to the group
+    first, SIGKILL is sent to the processes that are still running after the grace period.
+    Descendants that are left without a parent are reaped by init.
+    Returns the processes of the group that survived and the resource usage of the reaped process.
+    """
+    pgid = process.pid
+    try:
+        is_group_leader = hasattr(os, "killpg") and os.getpgid(pgid) == pgid
+    except OSError:
+        is_group_leader = False
+    if not is_group_leader:
+        if process.is_alive():
+            process.terminate()
+        usage = _wait_process(process, TERMINATION_GRACE_PERIOD)
+        if process.is_alive():
+            process.kill()
+            usage = _wait_process(process)
+        return [], usage
+    _signal_process_group(pgid, signal.SIGTERM)
+    if _wait_process_group(pgid, TERMINATION_GRACE_PERIOD):
+        _signal_process_group(pgid, signal.SIGKILL)
+    usage = _wait_process(process)
+    survived_processes = _wait_process_group(pgid, TERMINATION_GRACE_PERIOD)
+    for survived_process in survived_processes:
+        logging.warning(f"The process {survived_process} was not terminated.")
+    return survived_processes, usage
+
+
+def _send_result(connection: Connection, result: Union[CheckSummary, Exception]) -> None:
+    """
+    Send the result of the check run to the parent process. A summary is pickled with its native result
+    tree only, so neither the JSON text of the result is sent nor the parent parses and validates it again.
+    Values of the tree that are not JSON types are converted here, even for trusted checks, because
+    the parent encodes the tree to JSON. A tree that cannot be encoded is sent as the error of the check.
+    """
+    if isinstance(result, CheckSummary):
+        try:
+            result._make_json_native()
+        except (TypeError, ValueError) as error:
+            logging.error(f"The result of the check cannot be encoded to JSON: {error}")
+            result = RuntimeError(f"The result of the check cannot be encoded to JSON: {error}")
+    try:
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as error:
+        # The parent reports the check as crashed instead of waiting for the timeout
+        payload = pickle.dumps(
+            RuntimeError(f"Cannot send the result of the check: {error}"), protocol=pickle.HIGHEST_PROTOCOL)
+    connection.send_bytes(payload)
+
+
+def _receive_result(connection: Connection) -> Union[CheckSummary, Exception]:
+    return pickle.loads(connection.recv_bytes())
+
+
+def _check_run(connection, check, data) -> None:
+    _start_new_session()
+    try:
+        result = _run_with_resource_usage(check, data)
+        _send_result(connection, result)
     except Exception as e:
-        connection.send(e)
+        _send_result(connection, e)
     finally:
         connection.close
 
 
-def check_run(check, data) -> CheckSummary:
+def check_run(check, data, timeout: Optional[float] = None) -> CheckSummary:
     parent_connection, child_connection = Pipe(duplex=False)
     process = Process(target=_check_run, args=(child_connection, check, data))
+    # The process is forked from a thread of the executor, see `CheckWorkerPool` why it is safe
     process.start()
-    if parent_connection.poll(timeout=check.get_metadata().timeout):
-        result = parent_connection.recv()
-        if isinstance(result, Exception):
-            json_dict = {
-                "CheckStatus": "ERROR",
-                "Verbosity": 0,
-                "Message": "",
-                "CheckResult": {
-                    f"{check.get_metadata().name}": {
-                        "CheckResult": "",
-                        "Verbosity": 0,
-                        "Message": "The check crashed at runtime. No data was received. "
-                                   "See call stack above.",
-                        "CheckStatus": "ERROR"
-                    }
-                }
-            }
-            json_str = json.dumps(json_dict)
-            result = CheckSummary(result=json_str)
-        parent_connection.close()
-    else:
-        process.terminate()
-        json_dict = {
-            "CheckStatus": "ERROR",
-            "Verbosity": 0,
-            "Message": "",
-            "CheckResult": {
-                f"{check.get_metadata().name}": {
-                    "CheckResult": "Timeout was exceeded.",
-                    "Verbosity": 0,
-                    "Message": "",
-                    "CheckStatus": "ERROR"
-                }
-            }
-        }
-        json_str = json.dumps(json_dict)
-        result = CheckSummary(result=json_str)
+    _add_process_group(process.pid)
+    # The parent does not keep the end of the child, so the pipe is closed if the process exits
+    child_connection.close()
+    if timeout is None:
+        timeout = check.get_metadata().timeout
+    deadline = time.monotonic() + timeout
+    try:
+        if parent_connection.poll(timeout=timeout):
+            try:
+                result = _receive_result(parent_connection)
+            except EOFError:
+                # The process exited without sending the result, e.g. it was killed
+                result = _get_crashed_check_summary(check)
+            if isinstance(result, Exception):
+                result = _get_crashed_check_summary(check)
+            parent_connection.close()
+            # The process may not exit after sending the result, e.g. it waits for its threads
+            usage = _wait_process(process, max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logging.warning(f"The process of the {check.get_metadata().name} did not exit after sending "
+                                f"the result. The process will be terminated.")
+                _, usage = _terminate_process_tree(process)
+        else:
+            survived_processes, usage = _terminate_process_tree(process)
+            result = _get_timeout_check_summary(check, survived_processes)
+    finally:
+        _remove_process_group(process.pid)
+    _set_resource_usage(result, usage)
     return result
 
 
-def _get_dependency_checks_map(checks: List[BaseCheck], dataReq: Dict) -> Dict[str, BaseCheck]:
+def _check_worker_loop(connection, checks: List[BaseCheck]) -> None:
+    _start_new_session()
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        index, data = task
+        try:
+            result = _run_with_resource_usage(checks[index], data)
+            _send_result(connection, result)
+        except Exception as e:
+            _send_result(connection, e)
+    connection.close()
+
+
+def is_worker_pool_supported() -> bool:
+    return "fork" in get_all_start_methods()
+
+
+class CheckWorkerPool:
+    """
+    Pool of worker processes that are reused to run checks.
+
+    Workers are forked after the checks are loaded, so they inherit the checker modules imported by
+    `materialize_checks` and the loaded libraries, and only the index of the check and the dependency
+    data are sent to a worker.
+    A worker is stopped when a check exceeds its timeout or the worker crashes.
+
+    Workers are started only from the main thread, by the constructor and `replace_stopped_workers`,
+    so a worker is not started by the thread that is waiting for the stopped one. The parent still has
+    other threads when workers are replaced, and checks that are not in the pool are run by `check_run`,
+    which forks from the thread that calls `run`. A forked process gets only the thread that forked it,
+    with the locks held by the other threads locked forever. This is safe here because the other
+    threads of the parent only wait for check processes: they do not run checks, and the locks they
+    take, the locks of the pool, its queue and the process groups, are not used by the forked process.
+    Python reinitializes the locks of `logging` in the forked process.
+    """
+
+    def __init__(self, checks: List[BaseCheck], size: int) -> None:
+        self._context = get_context("fork")
+        self._checks = checks
+        self._indexes = {id(check): index for index, check in enumerate(checks)}
+        self._workers: List[Tuple[BaseProcess, Connection]] = []
+        self._idle_workers: Queue = Queue()
+        self._lock = Lock()
+        self._stopped_workers = 0
+        for _ in range(max(1, size)):
+            self._idle_workers.put(self._start_worker())
+
+    def _start_worker(self) -> Tuple[BaseProcess, Connection]:
+        if current_thread() is not main_thread():
+            raise RuntimeError("Worker processes can be started only from the main thread.")
+        parent_connection, child_connection = self._context.Pipe(duplex=True)
+        process = self._context.Process(target=_check_worker_loop, args=(child_connection, self._checks))
+        process.daemon = True
+        process.start()
+        _add_process_group(process.pid)
+        child_connection.close()
+        worker = (process, parent_connection)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _stop_worker(self, worker: Tuple[BaseProcess, Connection]) -> List[str]:
+        process, connection = worker
+        # The resource usage of the worker is not of a single check, so it is not reported
+        survived_processes, _ = _terminate_process_tree(process)
+        _remove_process_group(process.pid)
+        connection.close()
+        with self._lock:
+            self._workers.remove(worker)
+        return survived_processes
+
+    def replace_stopped_workers(self) -> None:
+        """Start new workers instead of the stopped ones. Must be called from the main thread."""
+        with self._lock:
+            stopped_workers, self._stopped_workers = self._stopped_workers, 0
+        for _ in range(stopped_workers):
+            self._idle_workers.put(self._start_worker())
+
+    def run(self, check: BaseCheck, data: Dict, timeout: Optional[float] = None) -> CheckSummary:
+        if id(check) not in self._indexes:
+            return check_run(check, data, timeout)
+        if current_thread() is main_thread():
+            self.replace_stopped_workers()
+        if timeout is None:
+            timeout = check.get_metadata().timeout
+        worker = self._idle_workers.get()
+        process, connection = worker
+        is_stopped = False
+        try:
+            connection.send((self._indexes[id(check)], data))
+            if connection.poll(timeout=timeout):
+                result = _receive_result(connection)
+                if isinstance(result, Exception):
+                    result = _get_crashed_check_summary(check)
+            else:
+                logging.warning(f"The {check.get_metadata().name} exceeded the timeout. "
+                                f"The worker process {process.pid} will be replaced.")
+                is_stopped = True
+                survived_processes = self._stop_worker(worker)
+                result = _get_timeout_check_summary(check, survived_processes)
+        except (EOFError, OSError):
+            logging.warning(f"The worker process {process.pid} crashed while running "
+                            f"the {check.get_metadata().name}. The worker will be replaced.")
+            is_stopped = True
+            self._stop_worker(worker)
+            result = _get_crashed_check_summary(check)
+        finally:
+            if is_stopped:
+                with self._lock:
+                    self._stopped_workers += 1
+            else:
+                self._idle_workers.put(worker)
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            workers = list(self._workers)
+        for process, connection in workers:
+            try:
+                connection.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            process, _ = worker
+            process.join(timeout=1)
+            self._stop_worker(worker)
+
+    def __enter__(self) -> "CheckWorkerPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _create_checks_index(checks: Union[CheckRegistry, List[BaseCheck]]) -> CheckRegistry:
+    return checks if isinstance(checks, CheckRegistry) else CheckRegistry(checks)
+
+
+def _get_dependency_checks_map(checks_index: CheckRegistry, dataReq: Dict) -> Dict[str, BaseCheck]:
     required_dependencies_map: Dict[str, BaseCheck] = {}
     for name, version in dataReq.items():
-        is_found = False
-        for check in checks:
-            metadata = check.get_metadata()
-            if metadata.name == name:
-                if metadata.version == version:
-                    required_dependencies_map.update({name: check})
-                    is_found = True
-                    break
-                else:
-                    logging.error(f"Another version of the required dependency {name} is loaded.")
-            else:
-                continue
-        if not is_found:
+        check = checks_index.get(name)
+        if check is None:
             logging.error(f"Cannot find the {name} in the loaded list of checks.")
+        elif check.get_metadata().version != version:
+            logging.error(f"Another version of the required dependency {name} is loaded.")
+        else:
+            required_dependencies_map.update({name: check})
     return required_dependencies_map
 
 
+_VISITING, _RESOLVED, _UNRESOLVED = range(3)
+
+
+def _visit_check(
+        check: BaseCheck, checks_index: CheckRegistry,
+        states: Dict[str, int], stack: List[List]) -> None:
+    dataReq = json.loads(check.get_metadata().dataReq)
+    dependencies = _get_dependency_checks_map(checks_index, dataReq)
+    states[check.get_metadata().name] = _VISITING
+    # Stack frames are [check, iterator over its dependencies, are all dependencies resolved]
+    stack.append([check, iter(dependencies.values()), len(dependencies) == len(dataReq)])
+
+
+def _resolve_dependencies(
+        selected_checks: List[BaseCheck], checks_index: CheckRegistry) -> List[BaseCheck]:
+    """
+    Return the selected checks with all their transitive dependencies in topological order.
+
+    Checks with missing dependencies, dependencies of another version or dependency cycles are
+    reported and excluded together with all checks that depend on them.
+    """
+    ordered_checks: List[BaseCheck] = []
+    states: Dict[str, int] = {}
+    for selected_check in selected_checks:
+        if selected_check.get_metadata().name in states:
+            continue
+        stack: List[List] = []
+        _visit_check(selected_check, checks_index, states, stack)
+        while len(stack) != 0:
+            frame = stack[-1]
+            dependency = next(frame[1], None)
+            if dependency is not None:
+                dependency_name = dependency.get_metadata().name
+                dependency_state = states.get(dependency_name)
+                if dependency_state is None:
+                    _visit_check(dependency, checks_index, states, stack)
+                elif dependency_state == _VISITING:
+                    cycle_start = next(
+                        index for index, item in enumerate(stack)
+                        if item[0].get_metadata().name == dependency_name)
+                    cycle = [item[0].get_metadata().name for item in stack[cycle_start:]]
+                    logging.error(f"Dependency cycle detected: {' -> '.join(cycle + [dependency_name])}.")
+                    for item in stack[cycle_start:]:
+                        item[2] = False
+                elif dependency_state == _UNRESOLVED:
+                    frame[2] = False
+                continue
+            stack.pop()
+            check, _, is_resolved = frame
+            if is_resolved:
+                states[check.get_metadata().name] = _RESOLVED
+                ordered_checks.append(check)
+            else:
+                states[check.get_metadata().name] = _UNRESOLVED
+                logging.error(f"The {check.get_metadata().name} will not be run because its dependencies "
+                              f"cannot be resolved.")
+            if len(stack) != 0 and not is_resolved:
+                stack[-1][2] = False
+    return ordered_checks
+
+
 def create_dependency_order(
-        loaded_checks: List[BaseCheck], selection: Set[str]) -> Tuple[List[str], List[BaseCheck]]:
-    checks_to_print: List[str] = []
-    ordered_checks_map: Dict[str, BaseCheck] = {}
-    for check in loaded_checks:
-        check_metadata = check.get_metadata()
-        if "all" not in selection and \
-           len((set(check_metadata.groups.split(",")) | {check_metadata.name}) & selection) == 0:
-            continue  # pragma: no cover
-        checks_to_print.append(check_metadata.name)
-        dependency_checks = _get_dependency_checks_map(loaded_checks, json.loads(check_metadata.dataReq))
-        for name, dependency in dependency_checks.items():
-            if name not in ordered_checks_map:
-                ordered_checks_map[name] = dependency
-
-        if check_metadata.name not in ordered_checks_map:
-            ordered_checks_map[check_metadata.name] = check
-
-    return checks_to_print, list(ordered_checks_map.values())
-
-
-def run_checks(checks_to_run: List[BaseCheck]) -> None:
+        loaded_checks: Union[CheckRegistry, List[BaseCheck]],
+        selection: Set[str]) -> Tuple[List[str], List[BaseCheck]]:
+    checks_index = _create_checks_index(loaded_checks)
+    selected_checks = checks_index.select(selection)
+
+    ordered_checks = _resolve_dependencies(selected_checks, checks_index)
+    ordered_checks_names = {check.get_metadata().name for check in ordered_checks}
+    checks_to_print = [
+        check.get_metadata().name
+        for check in selected_checks
+        if check.get_metadata().name in ordered_checks_names
+    ]
+    return checks_to_print, ordered_checks
+
+
+def _get_required_dependencies(check: BaseCheck) -> Set[str]:
+    return set(json.loads(check.get_metadata().dataReq).keys())
+
+
+def _has_pending_dependents(name: str, pending: List[BaseCheck]) -> bool:
+    return any(name in _get_required_dependencies(check) for check in pending)
+
+
+def _get_unmet_status_requirements(check: BaseCheck, error_codes: Dict[str, int]) -> List[str]:
+    status_req = json.loads(check.get_metadata().statusReq)
+    statuses = {name: ERROR_CODE_TO_STATUS.get(error_codes[name], "ERROR") for name in status_req}
+    return [
+        f"{name} ({statuses[name]})"
+        for name, required_statuses in sorted(status_req.items())
+        if statuses[name] not in required_statuses
+    ]
+
+
+def _get_checks_priorities(checks_to_run: List[BaseCheck]) -> Dict[str, int]:
+    """Return the priority of each check: the highest merit of the check and all checks that depend on it."""
+    priorities = {check.get_metadata().name: check.get_metadata().merit for check in checks_to_run}
+    is_changed = True
+    while is_changed:
+        is_changed = False
+        for check in reversed(checks_to_run):
+            priority = priorities[check.get_metadata().name]
+            for dependency_name in _get_required_dependencies(check):
+                if dependency_name in priorities and priorities[dependency_name] < priority:
+                    priorities[dependency_name] = priority
+                    is_changed = True
+    return priorities
+
+
+def _get_expected_duration(check: BaseCheck, result_cache: Optional[CheckResultCache]) -> Optional[float]:
+    return result_cache.get_duration(check) if result_cache is not None else None
+
+
+def _skip_check(
+        check: BaseCheck, reason: str, message: str,
+        on_check_completed: Optional[Callable[[BaseCheck], None]]) -> None:
+    logging.info(f"The {check.get_metadata().name} is skipped. {message}")
+    check.set_summary(_get_skipped_check_summary(check, reason, message))
+    if on_check_completed is not None:
+        on_check_completed(check)
+
+
+def run_checks(
+        checks_to_run: List[BaseCheck], jobs: int = 1, use_worker_pool: bool = False,
+        result_cache: Optional[CheckResultCache] = None,
+        on_check_completed: Optional[Callable[[BaseCheck], None]] = None,
+        budget: Optional[float] = None,
+        fail_fast: bool = False) -> None:
+    """
+    Run checks as a DAG built from the `dataReq` of each check.
+
+    Checks whose dependencies are all finished are started as soon as a worker slot
+    is free, so independent checks run concurrently up to `jobs` at a time.
+    Ready checks are started in the order of `checks_to_run`, which keeps
+    the run sequential and in the same order when `jobs` is 1.
+    If `use_worker_pool` is set and the platform supports it, checks are run in reused
+    worker processes of `CheckWorkerPool` instead of a new process per check. The workers are
+    started and replaced from the calling thread, which must be the main thread.
+    If `result_cache` is set, valid cached results are used instead of running checks and
+    the results of checks that were run are saved to the cache.
+    If `on_check_completed` is set, it is called with each check as soon as its summary is received.
+    If the checks are run in the worker pool or in processes that are not forked, results of finished
+    checks that other pending checks depend on are written once to the `ResultStore` of the run, and
+    checks get the results of their dependencies as `StoredResults`, so a large result is not pickled
+    again for each dependent check.
+    If `budget` is set, the checks are run within `budget` seconds: ready checks are started
+    in the order of their merit raised to the merit of their dependents, checks whose duration of
+    the previous run does not fit the remaining time are skipped, checks without a known duration are
+    run with the timeout capped to the remaining time, and running checks are cut off when the time is
+    over. When the timeout of a check is capped, the time to terminate it is reserved in the budget.
+    Skipped and cut off checks and their dependents are reported as SKIPPED(budget).
+    Checks whose dependencies do not have the statuses required by `statusReq` in metadata are not run
+    and reported as SKIPPED(dependency). If `fail_fast` is set, no checks are started after the first
+    check with the FAIL or ERROR status, and the rest of the checks are reported as SKIPPED(fail_fast).
+    If the run is interrupted, e.g. by Ctrl+C, the process groups of the running checks are killed.
+    """
     # TODO: Add more debug information
     json_full_results = {}
     if len(checks_to_run) == 0:
         print("No checks found to run.")
         exit(1)
 
-    for check in checks_to_run:
-        metadata = check.get_metadata()
-        required_dependencies = json.loads(metadata.dataReq)
-        required_dependencies_data = {
-            check_name: summary
-            for check_name, summary in json_full_results.items()
-            if check_name in required_dependencies.keys()
-        }
-        if len(required_dependencies) != len(required_dependencies_data):
-            logging.error(f"The {metadata.name} depends on results of other checks that cannot be obtained. "
-                          f"Please load checks with names: {','.join(list(required_dependencies.keys()))}.")
-            continue
-        check_summary = check_run(check, required_dependencies_data)
-        check.set_summary(check_summary)
-        json_full_results[check.get_metadata().name] = json.loads(check.get_summary().result)
+    workers = max(1, jobs)
+    checks_names = {check.get_metadata().name for check in checks_to_run}
+    pending: List[BaseCheck] = list(checks_to_run)
+    running: Dict[Future, Tuple[BaseCheck, Dict, float, Optional[float]]] = {}
+    not_obtained: Set[str] = set()
+    skipped: Dict[str, str] = {}
+    error_codes: Dict[str, int] = {}
+    is_failed = False
+    cache_looked_up: Set[str] = set()
+    deadline = time.monotonic() + budget if budget is not None else None
+    priorities = _get_checks_priorities(checks_to_run) if budget is not None else {}
+
+    worker_pool: Optional[CheckWorkerPool] = None
+    if use_worker_pool and is_worker_pool_supported():
+        worker_pool = CheckWorkerPool(checks_to_run, min(workers, len(checks_to_run)))
+    runner = worker_pool.run if worker_pool is not None else check_run
+    # Results are sent to the check processes through the store only if they are pickled,
+    # a forked check process gets the results from the memory of the parent
+    result_store = ResultStore() if worker_pool is not None or get_start_method() != "fork" else None
+
+    try:
+        # The process groups are killed before the executor waits for the threads that run the checks
+        with ThreadPoolExecutor(max_workers=workers) as executor, _killing_process_groups_on_exit():
+            while len(pending) != 0 or len(running) != 0:
+                is_pending_changed = False
+                if worker_pool is not None:
+                    # Workers stopped by the finished checks are replaced before new checks are started
+                    worker_pool.replace_stopped_workers()
+                ready_checks = list(pending)
+                if budget is not None:
+                    ready_checks.sort(key=lambda check: -priorities[check.get_metadata().name])
+                for check in ready_checks:
+                    metadata = check.get_metadata()
+                    required_dependencies = _get_required_dependencies(check)
+                    if required_dependencies - checks_names or required_dependencies & not_obtained:
+                        logging.error(f"The {metadata.name} depends on results of other checks that "
+                                      f"cannot be obtained. Please load checks with names: "
+                                      f"{','.join(list(required_dependencies))}.")
+                        not_obtained.add(metadata.name)
+                        pending.remove(check)
+                        is_pending_changed = True
+                        continue
+                    if is_failed:
+                        pending.remove(check)
+                        skipped[metadata.name] = "fail_fast"
+                        _skip_check(
+                            check, "fail_fast", "The check was not run because another check failed.",
+                            on_check_completed)
+                        is_pending_changed = True
+                        continue
+                    skipped_dependencies = sorted(required_dependencies & skipped.keys())
+                    if len(skipped_dependencies) != 0:
+                        pending.remove(check)
+                        skipped[metadata.name] = skipped[skipped_dependencies[0]]
+                        _skip_check(
+                            check, skipped[metadata.name],
+                            f"The required checks were skipped: {', '.join(skipped_dependencies)}.",
+                            on_check_completed)
+                        is_pending_changed = True
+                        continue
+                    if not required_dependencies.issubset(json_full_results.keys()):
+                        continue
+                    unmet_status_requirements = _get_unmet_status_requirements(check, error_codes)
+                    if len(unmet_status_requirements) != 0:
+                        pending.remove(check)
+                        skipped[metadata.name] = "dependency"
+                        _skip_check(
+                            check, "dependency",
+                            f"The required checks do not have the required status: "
+                            f"{', '.join(unmet_status_requirements)}.",
+                            on_check_completed)
+                        is_pending_changed = True
+                        continue
+                    required_dependencies_data = {
+                        check_name: summary
+                        for check_name, summary in json_full_results.items()
+                        if check_name in required_dependencies
+                    }
+                    cached_summary = None
+                    if result_cache is not None and metadata.name not in cache_looked_up:
+                        cached_summary = result_cache.get(check, required_dependencies_data)
+                        cache_looked_up.add(metadata.name)
+                    if cached_summary is not None:
+                        pending.remove(check)
+                        cached_summary.duration = 0.0
+                        check.set_summary(cached_summary)
+                        json_full_results[metadata.name] = check.get_summary().result_tree
+                        if result_store is not None and _has_pending_dependents(metadata.name, pending):
+                            result_store.put(metadata.name, json_full_results[metadata.name])
+                        error_codes[metadata.name] = cached_summary.error_code
+                        is_failed = is_failed or (fail_fast and cached_summary.error_code >= 2)
+                        if on_check_completed is not None:
+                            on_check_completed(check)
+                        is_pending_changed = True
+                        continue
+                    timeout = None
+                    if deadline is not None:
+                        remaining_time = deadline - time.monotonic()
+                        expected_duration = _get_expected_duration(check, result_cache)
+                        if remaining_time <= 0 or \
+                           expected_duration is not None and expected_duration > remaining_time:
+                            pending.remove(check)
+                            skipped[metadata.name] = "budget"
+                            _skip_check(
+                                check, "budget", "The check cannot finish in the remaining time budget.",
+                                on_check_completed)
+                            is_pending_changed = True
+                            continue
+                        # If the timeout is capped, the time to terminate the cut off check is reserved,
+                        # up to a half of the remaining time, so a short budget does not skip all checks
+                        termination_time = min(TERMINATION_TIME, remaining_time / 2)
+                        timeout = min(metadata.timeout, remaining_time - termination_time)
+                    if len(running) >= workers:
+                        continue
+                    pending.remove(check)
+                    dependencies_data = result_store.view(required_dependencies_data) \
+                        if result_store is not None else required_dependencies_data
+                    run_args = (check, dependencies_data) if timeout is None else \
+                        (check, dependencies_data, timeout)
+                    running[executor.submit(runner, *run_args)] = \
+                        (check, required_dependencies_data, time.monotonic(), timeout)
+
+                if is_pending_changed:
+                    continue
+                if len(running) == 0:
+                    # The rest of the checks wait for each other
+                    for check in pending:
+                        metadata = check.get_metadata()
+                        logging.error(f"The {metadata.name} depends on results of other checks that "
+                                      f"cannot be obtained because of a dependency cycle.")
+                    break
+
+                done, _ = wait(running.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    check, required_dependencies_data, start_time, timeout = running.pop(future)
+                    summary = future.result()
+                    summary.duration = time.monotonic() - start_time
+                    if timeout is not None and timeout < check.get_metadata().timeout and \
+                       summary.error_code == 3 and summary.duration >= timeout:
+                        skipped[check.get_metadata().name] = "budget"
+                        _skip_check(
+                            check, "budget", "The check was cut off because the time budget is over.",
+                            on_check_completed)
+                        continue
+                    check.set_summary(summary)
+                    if result_cache is not None:
+                        result_cache.set(check, required_dependencies_data, check.get_summary())
+                        result_cache.set_duration(check, summary.duration)
+                    json_full_results[check.get_metadata().name] = check.get_summary().result_tree
+                    name = check.get_metadata().name
+                    if result_store is not None and _has_pending_dependents(name, pending):
+                        result_store.put(name, json_full_results[name])
+                    error_codes[check.get_metadata().name] = summary.error_code
+                    is_failed = is_failed or (fail_fast and summary.error_code >= 2)
+                    if on_check_completed is not None:
+                        on_check_completed(check)
+    finally:
+        if worker_pool is not None:
+            worker_pool.close()
+        if result_store is not None:
+            result_store.close()
@@ -0,0 +1,184 @@
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+import ast
+import logging
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from modules import bundle
+from modules.check.check import CheckMetadataPy
+
+
+_METADATA_FIELDS = [
+    "name", "type", "groups", "descr", "dataReq", "merit", "timeout", "version", "run", "cache_ttl",
+    "statusReq"
+]
+
+
+# Patterns of the match statement that bind names, Python 3.10 and newer
+_MATCH_MAPPING = getattr(ast, "MatchMapping", ())
+_MATCH_CAPTURES = tuple(
+    getattr(ast, name) for name in ("MatchAs", "MatchStar", "MatchMapping") if hasattr(ast, name))
+
+
+class _NotStatic(Exception):
+    pass
+
+
+def _get_function(module: ast.Module, name: str) -> ast.FunctionDef:
+    for node in module.body:
+        if isinstance(node, ast.FunctionDef) and node.name == name:
+            return node
+    raise _NotStatic(f"The {name} function is not found.")
+
+
+def _get_statements(function: ast.FunctionDef) -> List[ast.stmt]:
+    statements = function.body
+    # Skip the docstring
+    if len(statements) != 0 and isinstance(statements[0], ast.Expr) and \
+       isinstance(statements[0].value, ast.Constant) and isinstance(statements[0].value.value, str):
+        statements = statements[1:]
+    return statements
+
+
+def _get_bindings(module: ast.Module) -> Optional[Dict[str, int]]:
+    # Number of bindings of each module level name, including bindings in nested blocks, imports and
+    # `global` declarations in functions. Returns None if `import *` can bind any name
+    bindings: Dict[str, int] = {}
+    nodes: List[ast.AST] = list(module.body)
+    while len(nodes) != 0:
+        node = nodes.pop()
+        names: List[str] = []
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            # The body is another scope, only its `global` declarations rebind module level names
+            names.append(node.name)
+            for inner_node in ast.walk(node):
+                if isinstance(inner_node, ast.Global):
+                    names.extend(inner_node.names * 2)
+            nodes.extend(node.decorator_list)
+            if isinstance(node, ast.ClassDef):
+                nodes.extend(node.bases + [keyword.value for keyword in node.keywords])
+            else:
+                nodes.extend(node.args.defaults + [value for value in node.args.kw_defaults if value])
+        elif isinstance(node, ast.Lambda):
+            nodes.extend(node.args.defaults + [value for value in node.args.kw_defaults if value])
+        else:
+            if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                names.append(node.id)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    if alias.name == "*":
+                        return None
+                    names.append(alias.asname or alias.name.split(".")[0])
+            elif isinstance(node, ast.ExceptHandler) and node.name is not None:
+                names.append(node.name)
+            elif isinstance(node, _MATCH_CAPTURES):
+                capture = node.rest if isinstance(node, _MATCH_MAPPING) else node.name
+                if capture is not None:
+                    names.append(capture)
+            nodes.extend(ast.iter_child_nodes(node))
+        for name in names:
+            bindings[name] = bindings.get(name, 0) + 1
+    return bindings
+
+
+def _get_constants(module: ast.Module) -> Dict[str, Any]:
+    # Module level names bound exactly once by an assignment of a literal, e.g. CHECK_NAME = "gpu_check"
+    bindings = _get_bindings(module)
+    if bindings is None:
+        return {}
+    constants: Dict[str, Any] = {}
+    for node in module.body:
+        if not isinstance(node, (ast.Assign, ast.AnnAssign)) or node.value is None:
+            continue
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        for target in targets:
+            if not isinstance(target, ast.Name) or bindings.get(target.id) != 1:
+                continue
+            try:
+                constants[target.id] = ast.literal_eval(node.value)
+            except ValueError:
+                pass
+    return constants
+
+
+def _get_literal(node: ast.expr, constants: Dict[str, Any]) -> Any:
+    if isinstance(node, ast.Name) and node.id in constants:
+        return constants[node.id]
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise _NotStatic(f"The value at line {node.lineno} is not a literal.")
+
+
+def _get_metadata(node: ast.expr, constants: Dict[str, Any]) -> CheckMetadataPy:
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name) or \
+       node.func.id != "CheckMetadataPy" or len(node.args) > len(_METADATA_FIELDS):
+        raise _NotStatic(f"The value at line {node.lineno} is not a CheckMetadataPy call.")
+    arguments: Dict[str, Any] = {}
+    for field, argument in zip(_METADATA_FIELDS, node.args):
+        arguments[field] = _get_literal(argument, constants)
+    for keyword in node.keywords:
+        if keyword.arg is None:
+            raise _NotStatic(f"The value at line {node.lineno} uses keyword unpacking.")
+        arguments[keyword.arg] = _get_literal(keyword.value, constants)
+    return CheckMetadataPy(**arguments)
+
+
+def _get_api_version(module: ast.Module, constants: Dict[str, Any]) -> str:
+    statements = _get_statements(_get_function(module, "get_api_version"))
+    if len(statements) != 1 or not isinstance(statements[0], ast.Return) or statements[0].value is None:
+        raise _NotStatic("The get_api_version function does not return a literal.")
+    api_version = _get_literal(statements[0].value, constants)
+    if not isinstance(api_version, str):
+        raise _NotStatic("The get_api_version function does not return a string.")
+    return api_version
+
+
+def _get_check_list(module: ast.Module, constants: Dict[str, Any]) -> List[CheckMetadataPy]:
+    variables: Dict[str, CheckMetadataPy] = {}
+    for statement in _get_statements(_get_function(module, "get_check_list")):
+        if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and \
+           isinstance(statement.targets[0], ast.Name):
+            variables[statement.targets[0].id] = _get_metadata(statement.value, constants)
+        elif isinstance(statement, ast.Return) and isinstance(statement.value, ast.List):
+            result = []
+            for element in statement.value.elts:
+                if isinstance(element, ast.Name) and element.id in variables:
+                    result.append(variables[element.id])
+                else:
+                    result.append(_get_metadata(element, constants))
+            return result
+        else:
+            raise _NotStatic(f"The statement at line {statement.lineno} of get_check_list is not supported.")
+    raise _NotStatic("The get_check_list function does not return a list.")
+
+
+def get_static_metadata(checker_path: Path) -> Optional[Tuple[str, List[CheckMetadataPy]]]:
+    """
+    Return the API version and the list of check metadata of the Python checker without importing it.
+
+    The metadata is read from the source code if `get_api_version` returns a string literal and
+    `get_check_list` only creates `CheckMetadataPy` objects from literals or module level constants
+    and returns them as a list.
+    Otherwise `None` is returned and the checker module has to be imported to get the metadata.
+    """
+    try:
+        module = ast.parse(bundle.read_bytes(checker_path).decode("utf-8"), filename=str(checker_path))
+        constants = _get_constants(module)
+        return _get_api_version(module, constants), _get_check_list(module, constants)
+    except _NotStatic as error:
+        logging.debug(f"Cannot read metadata of {checker_path} without import: {error}")
+    except (OSError, SyntaxError, ValueError, TypeError) as error:
+        logging.debug(f"Cannot parse {checker_path}: {error}")
+    return None
@@ -0,0 +1,137 @@
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+import re
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
+
+
+class ResultPathError(KeyError):
+    """The node of the path is not found in the result tree."""
+
+    def __str__(self) -> str:
+        return str(self.args[0])
+
+
+_MISSING = object()
+_Segment = Union[str, Pattern]
+
+
+def _parse_segments(path: str) -> List[_Segment]:
+    # Names are separated by dots, `\.` is a dot in the name and `*` matches any part of the name
+    names = [name.replace("\0", ".") for name in path.replace("\\.", "\0").split(".")]
+    segments: List[_Segment] = []
+    for name in names:
+        if name == "":
+            raise ValueError(f"The path '{path}' contains an empty name.")
+        if "*" in name:
+            segments.append(re.compile("(.*)".join(re.escape(part) for part in name.split("*"))))
+        else:
+            segments.append(name)
+    return segments
+
+
+class ResultPath:
+    """
+    Path to nodes of result trees, e.g. `gpu_backend_check.GPU.Driver information.Driver # *`.
+
+    Names of the nodes are separated by dots, the `CheckResult` fields between the nodes are implied.
+    A name with `*` matches all sibling nodes with such names, e.g. `Device # *` matches `Device # 0`,
+    `Device # 1` and so on. Paths are evaluated against the dependency data of a check, a dict or
+    `StoredResults`, or against the `CheckResult` dict of a node for paths relative to the node.
+    """
+    __slots__ = ("path", "_segments", "_has_wildcards")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._segments = _parse_segments(path)
+        self._has_wildcards = any(not isinstance(segment, str) for segment in self._segments)
+
+    def find(self, data: Dict) -> List[Tuple[Tuple[str, ...], Dict]]:
+        """
+        Return all nodes of the path in the order of the tree, each node with the parts of its names
+        matched by wildcards.
+        """
+        matches: List[Tuple[Tuple[str, ...], Dict]] = [((), {"CheckResult": data})]
+        for segment in self._segments:
+            next_matches = []
+            for captures, node in matches:
+                children = node.get("CheckResult")
+                if not isinstance(children, (dict, Mapping)):
+                    continue
+                if isinstance(segment, str):
+                    child = children.get(segment)
+                    if isinstance(child, dict):
+                        next_matches.append((captures, child))
+                    continue
+                for name, child in children.items():
+                    match = segment.fullmatch(name)
+                    if match is not None and isinstance(child, dict):
+                        next_matches.append((captures + match.groups(), child))
+            matches = next_matches
+        return matches
+
+    def _get_node(self, data: Dict) -> Tuple[Optional[Dict], int]:
+        # Return the node and the number of found names, the first match is used for wildcards
+        if self._has_wildcards:
+            matches = self.find(data)
+            return (matches[0][1], len(self._segments)) if matches else (None, 0)
+        node: Any = {"CheckResult": data}
+        for index, segment in enumerate(self._segments):
+            children = node.get("CheckResult")
+            node = children.get(segment) if isinstance(children, (dict, Mapping)) else None
+            if not isinstance(node, dict):
+                return None, index
+        return node, len(self._segments)
+
+    def get_node(self, data: Dict) -> Dict:
+        """Return the node of the path, the first matched node for paths with wildcards."""
+        node, found = self._get_node(data)
+        if node is None:
+            missing = self.path if self._has_wildcards else self._segments[found]
+            name = missing if isinstance(missing, str) else missing.pattern
+            raise ResultPathError(f"The '{name}' node of the '{self.path}' path is not found.")
+        return node
+
+    def get(
+            self,
+            data: Dict,
+            field: str = "CheckResult",
+            default: Any = _MISSING,
+            value_type: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Return the field of the node of the path, the `CheckResult` value by default.
+
+        * `default`: The value returned if the node or the field is not found, or the value cannot be
+          converted. If it is not set, `ResultPathError` is raised.
+        * `value_type`: The type the value is converted to, e.g. `int` for the number of devices.
+        """
+        try:
+            node = self.get_node(data)
+            if field not in node:
+                raise ResultPathError(f"The {field} field of the '{self.path}' path is not found.")
+            value = node[field]
+            return value_type(value) if value_type is not None else value
+        except (ResultPathError, TypeError, ValueError):
+            if default is _MISSING:
+                raise
+            return default
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+
+@lru_cache(maxsize=None)
+def compile_result_path(path: str) -> ResultPath:
+    """Return the compiled path, paths are compiled once and cached."""
+    return ResultPath(path)
@@ -0,0 +1,143 @@
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class StoredResults(Mapping):
+    """
+    Read only mapping of the names of dependency checks to their result trees, the `data` passed to
+    a check.
+
+    Results are read from the file of `ResultStore` when they are accessed, the file is memory mapped
+    and a result is unpickled from the mapped memory without copying it. Only the results of the
+    dependencies the check touches are materialized. In the process that created the mapping the native
+    result trees are used, and only the path and the offsets of the results are pickled when the mapping
+    is sent to another process.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str],
+            index: Dict[str, Tuple[int, int]],
+            results: Optional[Dict[str, Any]] = None) -> None:
+        self._path = path
+        self._index = index
+        self._results: Dict[str, Any] = dict(results) if results is not None else {}
+        self._names = list(index) + [name for name in self._results if name not in index]
+        self._mapping: Optional[mmap.mmap] = None
+
+    def _open(self) -> mmap.mmap:
+        if self._mapping is None:
+            with open(self._path, "rb") as file:
+                self._mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mapping
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._results:
+            return self._results[name]
+        offset, length = self._index[name]
+        with memoryview(self._open()) as view, view[offset:offset + length] as payload:
+            result = pickle.loads(payload)
+        self._results[name] = result
+        return result
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._names})"
+
+    def __reduce__(self):
+        # Results that are not in the file are sent as is
+        results = {name: result for name, result in self._results.items() if name not in self._index}
+        return type(self), (self._path, self._index, results)
+
+    def close(self) -> None:
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+
+class ResultStore:
+    """
+    Store of the check results of one run. Each result is pickled and written to a temporary file once,
+    when the check is finished, and `view` creates the `StoredResults` for the dependencies of a check.
+    So results are not pickled again for every dependent check that runs in a worker process.
+    If the file cannot be written, the results are sent to the checks as is.
+    """
+
+    def __init__(self, folder: Optional[str] = None) -> None:
+        self._results: Dict[str, Any] = {}
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._size = 0
+        self.path: Optional[str] = None
+        self._file = None
+        try:
+            descriptor, self.path = tempfile.mkstemp(prefix="diagnostics_results_", dir=folder)
+            self._file = os.fdopen(descriptor, "wb")
+        except OSError as error:
+            logging.warning(f"Cannot create the file to store check results: {error}")
+
+    def put(self, name: str, result_tree: Dict) -> None:
+        self._results[name] = result_tree
+        if self._file is None:
+            return
+        try:
+            payload = pickle.dumps(result_tree, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            logging.warning(f"Cannot store the result of the {name}: {error}")
+            return
+        try:
+            self._file.write(payload)
+            self._file.flush()
+        except OSError as error:
+            # The size of the file is unknown after a failed write, so the next results are not stored
+            logging.warning(f"Cannot store the result of the {name}: {error}")
+            self._file.close()
+            self._file = None
+            return
+        self._index[name] = (self._size, len(payload))
+        self._size += len(payload)
+
+    def view(self, names: Iterable[str]) -> StoredResults:
+        names = [name for name in names if name in self._results]
+        return StoredResults(
+            self.path,
+            {name: self._index[name] for name in names if name in self._index},
+            {name: self._results[name] for name in names})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.path is None or not os.path.exists(self.path):
+            return
+        try:
+            os.remove(self.path)
+        except OSError as error:
+            logging.warning(f"Cannot remove the file of check results: {error}")
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+import json
+
+from modules.check.check import BaseCheck, CheckMetadataPy, CheckSummary
+
+
+def get_check(
+        name: str = "check",
+        groups: str = "default",
+        merit: int = 0,
+        timeout: int = 1,
+        version: int = 1,
+        cache_ttl: int = 0,
+        dataReq: str = "{}",
+        statusReq: str = "{}") -> BaseCheck:
+    return BaseCheck(metadata=CheckMetadataPy(
+        name=name,
+        type="Data",
+        groups=groups,
+        descr="Description",
+        dataReq=dataReq,
+        merit=merit,
+        timeout=timeout,
+        version=version,
+        run="run",
+        cache_ttl=cache_ttl,
+        statusReq=statusReq
+    ))
+
+
+def get_summary(status: str = "PASS") -> CheckSummary:
+    return CheckSummary(result=json.dumps({
+        "CheckResult": {
+            "Check": {
+                "CheckResult": "Check Value",
+                "CheckStatus": status
+            }
+        }
+    }))
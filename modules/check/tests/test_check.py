@@ -16,13 +16,14 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
 
 import json  # noqa: E402
+import pickle  # noqa: E402
 from copy import deepcopy  # noqa: E402
 
 import unittest  # noqa: E402
 from unittest.mock import patch  # noqa: E402
 
 from modules.check.check import BaseCheck, CheckMetadataPy, CheckSummary, _result_summary_is_correct, \
-                                 check_correct_metadata, check_correct_summary  # noqa: E402
+                                 check_correct_metadata, check_correct_summary, trusted_summaries  # noqa: E402
 
 
 correct_result_dict_1 = {
@@ -355,6 +356,29 @@ class TestResultSummury(unittest.TestCase):
 
         self.assertEqual(expected_error_code, actual.error_code)
 
+    def test_init_check_summary_with_result_tree(self):
+        actual = CheckSummary(
+            result_tree=correct_result_dict_1
+        )
+
+        self.assertEqual(0, actual.error_code)
+        self.assertEqual(correct_result_dict_1, json.loads(actual.result))
+
+    def test_raise_error_init_check_summary_without_result(self):
+        with self.assertRaises(ValueError):
+            CheckSummary()
+
+    def test_check_summary_pickle_keeps_only_result_tree(self):
+        summary = CheckSummary(
+            result=json.dumps(correct_result_dict_1)
+        )
+
+        actual = pickle.loads(pickle.dumps(summary))
+
+        self.assertIsNone(summary.__getstate__()["_result"])
+        self.assertEqual(summary.result_tree, actual.result_tree)
+        self.assertEqual(summary.result, actual.result)
+
     def test_no_error_init_check_summary_with_correct_data_check_warning(self):
         expected_error_code = 1
 
@@ -447,6 +471,54 @@ class TestResultSummury(unittest.TestCase):
         with self.assertRaises(ValueError):
             check_correct_summary(temp.func)(obj)
 
+    def test_check_summary_decorator_does_not_validate_summary_again(self):
+        summary = CheckSummary(result_tree=correct_result_dict_1)
+
+        class temp:
+            def func(self):
+                return summary
+
+        with patch("modules.check.check._result_summary_is_correct") as mocked_validate:
+            check_correct_summary(temp.func)(temp())
+
+        mocked_validate.assert_not_called()
+
+    def test_raise_error_with_all_violations(self):
+        result_tree = deepcopy(correct_result_dict_2)
+        result_tree["CheckResult"]["Check1"]["CheckResult"]["Subcheck1"]["CheckStatus"] = "DONE"
+        result_tree["CheckResult"]["Check2"]["CheckResult"]["Subcheck2"]["Message"] = 0
+
+        with self.assertRaises(ValueError) as context:
+            _result_summary_is_correct(result_tree)
+
+        self.assertIn("Check1/Subcheck1: CheckStatus value can be only", str(context.exception))
+        self.assertIn("Check2/Subcheck2: Message must be a string.", str(context.exception))
+
+    def test_no_error_with_tree_deeper_than_recursion_limit(self):
+        node = {"CheckResult": "Value", "CheckStatus": "FAIL"}
+        for _ in range(sys.getrecursionlimit() * 2):
+            node = {"CheckResult": {"Subcheck": node}, "CheckStatus": "PASS"}
+
+        actual = _result_summary_is_correct({"CheckResult": {"Check": node}})
+
+        self.assertEqual(2, actual)
+
+    def test_trusted_summary_is_not_validated(self):
+        result_tree = deepcopy(correct_result_dict_10)
+        result_tree["CheckResult"]["Check1"]["Message"] = 0
+
+        actual = CheckSummary(result_tree=result_tree, trusted=True)
+
+        self.assertEqual(3, actual.error_code)
+
+    def test_summary_is_trusted_in_trusted_summaries_context(self):
+        with trusted_summaries():
+            actual = CheckSummary(result_tree=incorrect_dict_with_wrong_message)
+
+        self.assertEqual(0, actual.error_code)
+        with self.assertRaises(ValueError):
+            CheckSummary(result_tree=incorrect_dict_with_wrong_message)
+
 
 class TestCheckMetadataPy(unittest.TestCase):
 
@@ -516,6 +588,50 @@ class TestCheckMetadataPy(unittest.TestCase):
                 run='run'
             )
 
+    def test_no_error_init_check_metadata_with_correct_statusreq(self):
+        CheckMetadataPy(
+            name='example',
+            type='data',
+            groups='group',
+            descr='decription',
+            dataReq='{"dependency": 1}',
+            merit=0,
+            timeout=1,
+            version=2,
+            run='run',
+            statusReq='{"dependency": ["PASS", "WARNING"]}'
+        )
+
+    def test_raise_error_init_check_metadata_with_statusreq_not_in_datareq(self):
+        with self.assertRaises(ValueError):
+            CheckMetadataPy(
+                name='example',
+                type='data',
+                groups='group',
+                descr='decription',
+                dataReq='{}',
+                merit=0,
+                timeout=1,
+                version=2,
+                run='run',
+                statusReq='{"dependency": ["PASS"]}'
+            )
+
+    def test_raise_error_init_check_metadata_with_incorrect_statusreq_status(self):
+        with self.assertRaises(ValueError):
+            CheckMetadataPy(
+                name='example',
+                type='data',
+                groups='group',
+                descr='decription',
+                dataReq='{"dependency": 1}',
+                merit=0,
+                timeout=1,
+                version=2,
+                run='run',
+                statusReq='{"dependency": ["INFO"]}'
+            )
+
     def test_raise_error_init_check_metadata_with_incorrect_name(self):
         with self.assertRaises(ValueError):
             CheckMetadataPy(
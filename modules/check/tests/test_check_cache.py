@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+# NOTE: workaround to import modules
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
+
+import json  # noqa: E402
+import tempfile  # noqa: E402
+import unittest  # noqa: E402
+from functools import partial  # noqa: E402
+from pathlib import Path  # noqa: E402
+from unittest.mock import patch  # noqa: E402
+
+from modules.check.check_cache import CheckResultCache  # noqa: E402
+from modules.check.check_runner import run_checks  # noqa: E402
+from modules.check.tests.check_test_helper import get_check, get_summary  # noqa: E402
+
+
+# Results of the checks are cached unless `cache_ttl` is 0
+_get_check = partial(get_check, cache_ttl=60)
+
+
+class TestCheckResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = CheckResultCache("0.2", folder=Path(self.temp_dir.name))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_saved_result_positive(self):
+        check = _get_check()
+        expected = get_summary()
+
+        self.cache.set(check, {}, expected)
+        actual = self.cache.get(check, {})
+
+        self.assertEqual(expected.result, actual.result)
+
+    def test_get_not_saved_result(self):
+        self.assertIsNone(self.cache.get(_get_check(), {}))
+
+    def test_check_without_ttl_is_not_cached(self):
+        check = _get_check(cache_ttl=0)
+
+        self.cache.set(check, {}, get_summary())
+
+        self.assertIsNone(self.cache.get(check, {}))
+
+    def test_error_result_is_not_cached(self):
+        check = _get_check()
+
+        self.cache.set(check, {}, get_summary("ERROR"))
+
+        self.assertIsNone(self.cache.get(check, {}))
+
+    @patch("time.time")
+    def test_expired_result(self, mocked_time):
+        check = _get_check()
+        mocked_time.return_value = 1000.0
+        self.cache.set(check, {}, get_summary())
+
+        mocked_time.return_value = 1061.0
+        actual = self.cache.get(check, {})
+
+        self.assertIsNone(actual)
+
+    def test_another_check_version(self):
+        self.cache.set(_get_check(version=1), {}, get_summary())
+
+        self.assertIsNone(self.cache.get(_get_check(version=2), {}))
+
+    def test_another_api_version(self):
+        check = _get_check()
+        self.cache.set(check, {}, get_summary())
+
+        another_cache = CheckResultCache("0.3", folder=Path(self.temp_dir.name))
+
+        self.assertIsNone(another_cache.get(check, {}))
+
+    def test_changed_dependency_data(self):
+        check = _get_check()
+        self.cache.set(check, {"dependency": {"CheckResult": "1"}}, get_summary())
+
+        self.assertIsNone(self.cache.get(check, {"dependency": {"CheckResult": "2"}}))
+
+    def test_read_disabled(self):
+        check = _get_check()
+        self.cache.set(check, {}, get_summary())
+
+        cache = CheckResultCache("0.2", folder=Path(self.temp_dir.name), read=False)
+
+        self.assertIsNone(cache.get(check, {}))
+
+    def test_write_disabled(self):
+        check = _get_check()
+        cache = CheckResultCache("0.2", folder=Path(self.temp_dir.name), write=False)
+
+        cache.set(check, {}, get_summary())
+
+        self.assertIsNone(self.cache.get(check, {}))
+
+    @patch("logging.warning")
+    def test_broken_cache_file(self, mocked_warning):
+        check = _get_check()
+        self.cache.set(check, {}, get_summary())
+        with open(self.cache.folder / "check.json", "w") as file:
+            file.write("not a json")
+
+        self.assertIsNone(self.cache.get(check, {}))
+        mocked_warning.assert_called_once()
+
+    def test_get_saved_duration(self):
+        check = _get_check()
+        self.cache.set_duration(check, 1.5)
+
+        self.assertEqual(CheckResultCache("0.2", folder=Path(self.temp_dir.name)).get_duration(check), 1.5)
+
+    def test_get_not_saved_duration(self):
+        self.assertIsNone(self.cache.get_duration(_get_check()))
+
+
+class TestRunChecksWithCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = CheckResultCache("0.2", folder=Path(self.temp_dir.name))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_uses_cached_result(self, mocked_check_run):
+        check = _get_check()
+        self.cache.set(check, {}, get_summary())
+
+        run_checks([check], result_cache=self.cache)
+
+        mocked_check_run.assert_not_called()
+        self.assertEqual(check.get_summary().error_code, 0)
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_saves_result(self, mocked_check_run):
+        check = _get_check()
+        mocked_check_run.return_value = get_summary()
+
+        run_checks([check], result_cache=self.cache)
+
+        self.assertIsNotNone(self.cache.get(check, {}))
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_invalidates_dependent_result(self, mocked_check_run):
+        upstream_check = _get_check(name="upstream_check", cache_ttl=0)
+        check = _get_check(dataReq="""{"upstream_check": 1}""")
+        self.cache.set(check, {"upstream_check": json.loads(get_summary("PASS").result)}, get_summary())
+        mocked_check_run.side_effect = [get_summary("WARNING"), get_summary()]
+
+        run_checks([upstream_check, check], result_cache=self.cache)
+
+        self.assertEqual(mocked_check_run.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
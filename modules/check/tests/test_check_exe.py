@@ -41,6 +41,11 @@ exe_metadata_output = json.dumps({
 
 exe_api_version_output = "0.2"
 
+exe_describe_output = json.dumps({
+    "api_version": "0.2",
+    "checks": [json.loads(exe_metadata_output)]
+})
+
 exe_check_result_output = '{"result": {"CheckResult": {"Exe example check": {"CheckResult": "Exe example value", "CheckStatus": "PASS"}}}}'  # noqa: E501
 
 
@@ -93,7 +98,25 @@ class TestClassCheckExe(unittest.TestCase):
 
         actual = self.check_exe.run({})
 
-        self.assertEqual(expected.__dict__, actual.__dict__)
+        self.assertEqual(expected.result_tree, actual.result_tree)
+        self.assertEqual(expected.result, actual.result)
+        self.assertEqual(expected.error_code, actual.error_code)
+
+    def test_run_raise_error_if_data_is_passed_to_not_described_check(self):
+        self.assertRaises(NotImplementedError, self.check_exe.run, {"dependency_check": {}})
+
+    @patch("subprocess.Popen")
+    def test_run_described_check_passes_data_on_stdin(self, mock_popen):
+        check = check_exe.CheckExe("path", self.check_exe.get_metadata(), "0.2")
+        data = {"dependency_check": {"CheckResult": {}}}
+        mock_popen.return_value.communicate.return_value = (exe_check_result_output, "")
+        mock_popen.return_value.returncode = 0
+
+        actual = check.run(data)
+
+        self.assertEqual(["path", "--run", "exe_example"], mock_popen.call_args[0][0])
+        mock_popen.return_value.communicate.assert_called_once_with(input=json.dumps(data))
+        self.assertEqual(json.loads(exe_check_result_output)["result"], actual.result_tree)
 
 
 class TestGetCheckExe(unittest.TestCase):
@@ -119,7 +142,12 @@ class TestGetCheckExe(unittest.TestCase):
         mock_api_version.communicate.return_value = (exe_api_version_output, "")
         mock_api_version.returncode = 0
 
+        mock_describe = MagicMock()
+        mock_describe.communicate.return_value = ("", "")
+        mock_describe.returncode = 1
+
         mock_popen.side_effect = [
+            mock_describe,
             mock_api_version,
             mock_metadata
         ]
@@ -132,6 +160,32 @@ class TestGetCheckExe(unittest.TestCase):
 
         self.assertEqual(expected.__dict__, actual.__dict__)
 
+    @patch("subprocess.Popen")
+    def test_get_checks_exe_uses_describe(self, mock_popen):
+        expected = CheckMetadataPy(
+            name='exe_example',
+            type='Data',
+            groups='cpu',
+            descr='This is example of exe module',
+            dataReq='{}',
+            merit=0,
+            timeout=1,
+            version=2,
+            run=''
+        )
+        mock_popen.return_value.communicate.return_value = (exe_describe_output, "")
+        mock_popen.return_value.returncode = 0
+
+        mock_file = MagicMock()
+        mock_file.__str__.return_value = test_filename
+        mock_file.exists.return_value = True
+
+        actual = check_exe.getChecksExe(mock_file, "0.2")
+
+        self.assertEqual(expected.__dict__, actual[0].get_metadata().__dict__)
+        self.assertEqual("0.2", actual[0].get_api_version())
+        mock_popen.assert_called_once()
+
     @patch("logging.error")
     @patch("subprocess.Popen")
     def test_get_checks_exe_raise_error_if_check_has_non_zero_return_code(self, mock_popen, mock_log):
@@ -15,11 +15,12 @@ import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
 
+import tempfile  # noqa: E402
 import unittest  # noqa: E402
 from unittest.mock import Mock, patch  # noqa: E402
 from pathlib import Path  # noqa: E402
 
-from modules.check.check_list_py import CheckListPy  # noqa: E402
+from modules.check.check_list_py import CheckListPy, import_checker_module  # noqa: E402
 from modules.check.check import CheckMetadataPy  # noqa: E402
 
 
@@ -40,7 +41,7 @@ py_api_version = "0.2"
 
 class TestClassCheckListPy(unittest.TestCase):
 
-    @patch("builtins.__import__")
+    @patch("modules.check.check_list_py.import_checker_module")
     def setUp(self, mock_load):
         mock_module = Mock()
         mock_module.get_api_version.return_value = py_api_version
@@ -76,5 +77,82 @@ class TestClassCheckListPy(unittest.TestCase):
             self.check_list[:]
 
 
+class TestClassCheckListPyStaticMetadata(unittest.TestCase):
+
+    @patch("modules.check.check_list_py.get_static_metadata", return_value=(py_api_version, [py_metadata]))
+    @patch("modules.check.check_list_py.import_checker_module")
+    def test_init_static_metadata_does_not_import_module(self, mock_load, mock_get_static_metadata):
+        check_list = CheckListPy(Path("test.py"))
+
+        mock_load.assert_not_called()
+        self.assertEqual(py_api_version, check_list.api_version)
+        self.assertEqual([py_metadata], check_list.checkers)
+
+    @patch("modules.check.check_list_py.get_static_metadata", return_value=(py_api_version, [py_metadata]))
+    def test_checker_module_imports_module_once(self, mock_get_static_metadata):
+        check_list = CheckListPy(Path("test.py"))
+        mock_module = Mock()
+
+        with patch("modules.check.check_list_py.import_checker_module",
+                   return_value=mock_module) as mock_load:
+            first = check_list.checker_module
+            second = check_list.checker_module
+
+        mock_load.assert_called_once()
+        self.assertIs(mock_module, first)
+        self.assertIs(mock_module, second)
+
+
+class TestImportCheckerModule(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folders = [Path(self.temp_dir.name) / "first", Path(self.temp_dir.name) / "second"]
+        for index, folder in enumerate(self.folders):
+            folder.mkdir()
+            (folder / "same_name_checker.py").write_text(f"VALUE = {index}\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_import_checker_module_does_not_change_sys_path(self):
+        expected = list(sys.path)
+
+        import_checker_module(self.folders[0] / "same_name_checker.py")
+
+        self.assertEqual(expected, sys.path)
+
+    def test_import_checker_module_same_file_names(self):
+        first = import_checker_module(self.folders[0] / "same_name_checker.py")
+        second = import_checker_module(self.folders[1] / "same_name_checker.py")
+
+        self.assertEqual(0, first.VALUE)
+        self.assertEqual(1, second.VALUE)
+
+    def test_import_checker_module_imports_once(self):
+        first = import_checker_module(self.folders[0] / "same_name_checker.py")
+        second = import_checker_module(self.folders[0] / "same_name_checker.py")
+
+        self.assertIs(first, second)
+
+    def test_import_checker_module_imports_sibling_module(self):
+        (self.folders[0] / "sibling_helper_module.py").write_text("VALUE = 'helper'\n")
+        (self.folders[0] / "sibling_checker.py").write_text("from sibling_helper_module import VALUE\n")
+        expected = list(sys.path)
+
+        actual = import_checker_module(self.folders[0] / "sibling_checker.py")
+
+        self.assertEqual("helper", actual.VALUE)
+        self.assertEqual(expected, sys.path)
+        del sys.modules["sibling_helper_module"]
+
+    def test_import_checker_module_error_is_not_cached(self):
+        checker_path = self.folders[0] / "broken_checker.py"
+        checker_path.write_text("raise ValueError()\n")
+
+        self.assertRaises(ValueError, import_checker_module, checker_path)
+        self.assertRaises(ValueError, import_checker_module, checker_path)
+
+
 if __name__ == '__main__':
     unittest.main()
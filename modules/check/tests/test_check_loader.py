@@ -15,8 +15,12 @@ import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
 
+import importlib  # noqa: E402
+import subprocess  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
 import unittest  # noqa: E402
-from unittest.mock import MagicMock, patch  # noqa: E402
+from unittest.mock import ANY, MagicMock, patch  # noqa: E402
 from pathlib import Path  # noqa: E402
 
 from modules.check import check_loader  # noqa: E402
@@ -204,6 +208,51 @@ class TestLoadChecks(unittest.TestCase):
         self.assertEqual(expected, actual)
         mocked_load_checks_from_checker.assert_called()
 
+    @patch("modules.check.check_loader.load_checks_from_checker")
+    def test_load_checks_keeps_order_of_paths(self, mocked_load_checks_from_checker):
+        checks = {}
+        for index in range(8):
+            metadata = MagicMock()
+            metadata.name = f"mocked_check_{index}"
+            check = MagicMock()
+            check.get_metadata.return_value = metadata
+            checks[Path(f"checker_{index}")] = check
+
+        def load_checks_from_checker(checker_path, version, loaded_checks_map, manifest_cache):
+            # The first checker is loaded last
+            if checker_path == Path("checker_0"):
+                time.sleep(0.1)
+            loaded_checks_map[checker_path] = checks[checker_path].get_metadata()
+            return [checks[checker_path]]
+        mocked_load_checks_from_checker.side_effect = load_checks_from_checker
+        loaded_checks_map = {}
+
+        actual = check_loader.load_checks(list(checks.keys()), "0.2", loaded_checks_map)
+
+        self.assertEqual(list(checks.values()), actual)
+        self.assertEqual(list(checks.keys()), list(loaded_checks_map.keys()))
+
+    @patch("modules.check.check_loader.load_checks_from_checker")
+    def test_load_checks_reports_all_errors(self, mocked_load_checks_from_checker):
+        results = {
+            Path("checker_0"): OSError("Failed to load checker_0"),
+            Path("checker_1"): [self.mock_check_c_1],
+            Path("checker_2"): ValueError("Failed to load checker_2")
+        }
+
+        def load_checks_from_checker(checker_path, version, loaded_checks_map, manifest_cache):
+            if isinstance(results[checker_path], Exception):
+                raise results[checker_path]
+            return results[checker_path]
+        mocked_load_checks_from_checker.side_effect = load_checks_from_checker
+        loaded_checks_map = {}
+
+        with self.assertRaises(ValueError) as context:
+            check_loader.load_checks(
+                [Path("checker_0"), Path("checker_1"), Path("checker_2")], "0.2", loaded_checks_map)
+
+        self.assertEqual("Failed to load checker_0\nFailed to load checker_2", str(context.exception))
+
 
 class TestLoadDefaultChecks(unittest.TestCase):
 
@@ -263,7 +312,8 @@ class TestLoadDefaultChecks(unittest.TestCase):
         self.mock_sys_check_2.get_metadata.return_value = self.mock_sys_check_2_metadata
 
     @patch("modules.check.check_loader.load_checks")
-    def test_load_all_default_checks(self, mocked_load_checks):
+    @patch("modules.check.check_loader.get_files_list_from_folder")
+    def test_load_all_default_checks(self, mocked_get_files_list, mocked_load_checks):
         expected = [
             self.mock_check_c_1,
             self.mock_check_c_2,
@@ -272,124 +322,73 @@ class TestLoadDefaultChecks(unittest.TestCase):
             self.mock_check_exe_1,
             self.mock_check_exe_2
         ]
-
-        mocked_load_checks.side_effect = [
-            [self.mock_check_c_1,
-             self.mock_check_c_2],
-            [self.mock_check_py_1,
-             self.mock_check_py_2],
-            [self.mock_check_exe_1,
-             self.mock_check_exe_2],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            []
+        checkers_paths = [
+            Path(f"checker_{index}") for index in range(len(check_loader.DEFAULT_CHECKERS_PATHS))
         ]
+        mocked_get_files_list.side_effect = [[path] for path in checkers_paths]
+        mocked_load_checks.return_value = expected
 
         actual = check_loader.load_default_checks("0.2", {})
 
         self.assertEqual(expected, actual)
+        mocked_load_checks.assert_called_once_with(checkers_paths, "0.2", {}, None)
 
     @patch("modules.check.check_loader.load_checks")
-    def test_load_sys_checks_only(self, mocked_load_checks):
+    @patch("modules.check.check_loader.get_files_list_from_folder")
+    def test_load_sys_checks_only(self, mocked_get_files_list, mocked_load_checks):
         expected = [
             self.mock_sys_check_1,
             self.mock_sys_check_2
         ]
-
-        mocked_load_checks.side_effect = [
-            [self.mock_sys_check_1,
-             self.mock_sys_check_2],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            []
-        ]
+        mocked_get_files_list.side_effect = [[Path("sys_checker")]] + \
+            [[] for _ in check_loader.DEFAULT_CHECKERS_PATHS[1:]]
+        mocked_load_checks.return_value = expected
 
         actual = check_loader.load_default_checks("0.2", {})
 
         self.assertEqual(expected, actual)
-
-    @patch("modules.check.check_loader.load_checks")
-    def test_load_checks_c_only(self, mocked_load_checks):
+        mocked_load_checks.assert_called_once_with([Path("sys_checker")], "0.2", {}, None)
+
+    def _load_default_checks_from_folder(self, folder_index, checks):
+        checker_path = Path(f"checker_{folder_index}")
+        files = [[] for _ in check_loader.DEFAULT_CHECKERS_PATHS]
+        files[folder_index] = [checker_path]
+        with patch("modules.check.check_loader.get_files_list_from_folder", side_effect=files), \
+                patch("modules.check.check_loader.load_checks_from_checker",
+                      return_value=checks) as mocked_load_checks_from_checker:
+            actual = check_loader.load_default_checks("0.2", {})
+            check_loader.materialize_checks(actual)
+
+        mocked_load_checks_from_checker.assert_called_once_with(checker_path, "0.2", ANY, None)
+        return actual
+
+    def test_load_checks_c_only(self):
         expected = [
             self.mock_check_c_1,
             self.mock_check_c_2
         ]
 
-        mocked_load_checks.side_effect = [
-            [],
-            [self.mock_check_c_1,
-             self.mock_check_c_2],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            []
-        ]
-
-        actual = check_loader.load_default_checks("0.2", {})
+        actual = self._load_default_checks_from_folder(0, expected)
 
         self.assertEqual(expected, actual)
 
-    @patch("modules.check.check_loader.load_checks")
-    def test_load_checks_py_only(self, mocked_load_checks):
+    def test_load_checks_py_only(self):
         expected = [
             self.mock_check_py_1,
             self.mock_check_py_2
         ]
 
-        mocked_load_checks.side_effect = [
-            [],
-            [],
-            [self.mock_check_py_1,
-             self.mock_check_py_2],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            []
-        ]
-
-        actual = check_loader.load_default_checks("0.2", {})
+        actual = self._load_default_checks_from_folder(2, expected)
 
         self.assertEqual(expected, actual)
 
-    @patch("modules.check.check_loader.load_checks")
-    def test_load_checks_exe_only(self, mocked_load_checks):
+    def test_load_checks_exe_only(self):
         expected = [
             self.mock_check_exe_1,
             self.mock_check_exe_2
         ]
 
-        mocked_load_checks.side_effect = [
-            [],
-            [],
-            [self.mock_check_exe_1,
-             self.mock_check_exe_2],
-            [],
-            [],
-            [],
-            [],
-            [],
-            [],
-            []
-        ]
-
-        actual = check_loader.load_default_checks("0.2", {})
+        actual = self._load_default_checks_from_folder(1, expected)
 
         self.assertEqual(expected, actual)
 
@@ -584,5 +583,303 @@ class TestLoadChecksFromEnv(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+MANIFEST_CHECKER = """
+from modules.check.check import CheckMetadataPy, CheckSummary
+
+
+def run_manifest_check(data):
+    return CheckSummary(result_tree={"CheckResult": {"Check": {"CheckResult": "", "CheckStatus": "PASS"}}})
+
+
+def get_api_version():
+    return "0.2"
+
+
+def get_check_list():
+    return [CheckMetadataPy(
+        name="manifest_check", type="Data", groups="default", descr="Description",
+        dataReq="{}", merit=0, timeout=1, version=1, run="run_manifest_check")]
+"""
+
+LEGACY_EXE_CHECKER = """#!/bin/sh
+case "$1" in
+--get_api_version) echo "0.2" ;;
+--get_metadata) echo '{"name": "legacy_check", "type": "Data", "groups": "default", '\\
+'"descr": "Description", "dataReq": "{}", "merit": 0, "timeout": 1, "version": 1, "run": ""}' ;;
+--get_summary) echo '{"result": {"CheckResult": {"Check": {"CheckResult": "", "CheckStatus": "PASS"}}}}' ;;
+*) exit 1 ;;
+esac
+"""
+
+# The metadata of this checker cannot be read from the source code, so the checker is imported
+DYNAMIC_MANIFEST_CHECKER = MANIFEST_CHECKER.replace('descr="Description"', 'descr="Description".strip()')
+
+
+class TestCheckerManifestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        self.checker_path = self.folder / "manifest_test_checker.py"
+        self.checker_path.write_text(DYNAMIC_MANIFEST_CHECKER)
+        manifest_cache = check_loader.CheckerManifestCache(folder=self.folder)
+        check_loader.load_checks_from_checker(self.checker_path, "0.2", {}, manifest_cache)
+        manifest_cache.save()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @patch("modules.check.check_loader.getChecksPy")
+    def test_load_checks_from_checker_uses_manifest(self, mocked_get_checks):
+        loaded_checks_map = {}
+        manifest_cache = check_loader.CheckerManifestCache(folder=self.folder)
+
+        actual = check_loader.load_checks_from_checker(
+            self.checker_path, "0.2", loaded_checks_map, manifest_cache)
+
+        mocked_get_checks.assert_not_called()
+        self.assertEqual(len(actual), 1)
+        self.assertIsInstance(actual[0], check_loader.LazyCheck)
+        self.assertEqual(actual[0].get_metadata().name, "manifest_check")
+        self.assertEqual(loaded_checks_map[self.checker_path].name, "manifest_check")
+
+    def test_lazy_check_run(self):
+        checks = check_loader.load_checks_from_checker(
+            self.checker_path, "0.2", {}, check_loader.CheckerManifestCache(folder=self.folder))
+
+        check_loader.materialize_checks(checks)
+
+        self.assertEqual(checks[0].run({}).error_code, 0)
+
+    @patch("modules.check.check_loader.getChecksPy")
+    def test_load_checks_from_checker_changed_file(self, mocked_get_checks):
+        self.checker_path.write_text(DYNAMIC_MANIFEST_CHECKER + "\n")
+
+        check_loader.load_checks_from_checker(
+            self.checker_path, "0.2", {}, check_loader.CheckerManifestCache(folder=self.folder))
+
+        mocked_get_checks.assert_called_once()
+
+    @patch("modules.check.check_loader.getChecksPy")
+    def test_load_checks_from_checker_another_api_version(self, mocked_get_checks):
+        check_loader.load_checks_from_checker(
+            self.checker_path, "0.3", {}, check_loader.CheckerManifestCache(folder=self.folder))
+
+        mocked_get_checks.assert_called_once()
+
+    @patch("modules.check.check_loader.getChecksPy")
+    def test_load_checks_from_checker_read_disabled(self, mocked_get_checks):
+        check_loader.load_checks_from_checker(
+            self.checker_path, "0.2", {}, check_loader.CheckerManifestCache(folder=self.folder, read=False))
+
+        mocked_get_checks.assert_called_once()
+
+    @unittest.skipIf(sys.platform.startswith("win"), "run on linux only")
+    def test_lazy_exe_check_run_does_not_probe_protocol(self):
+        checker_path = self.folder / "legacy_test_checker.sh"
+        checker_path.write_text(LEGACY_EXE_CHECKER)
+        checker_path.chmod(0o755)
+        manifest_cache = check_loader.CheckerManifestCache(folder=self.folder)
+        check_loader.load_checks_from_checker(checker_path, "0.2", {}, manifest_cache)
+        manifest_cache.save()
+        checks = check_loader.load_checks_from_checker(
+            checker_path, "0.2", {}, check_loader.CheckerManifestCache(folder=self.folder))
+
+        with patch("subprocess.Popen", wraps=subprocess.Popen) as mocked_popen:
+            check_loader.materialize_checks(checks)
+            actual = checks[0].run({})
+
+        self.assertFalse(checks[0].is_described)
+        self.assertEqual(actual.error_code, 0)
+        mocked_popen.assert_called_once()
+        self.assertEqual(mocked_popen.call_args.args[0][1], "--get_summary")
+
+
+class TestLoadStaticChecks(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checker_path = Path(self.temp_dir.name) / "static_test_checker.py"
+        self.checker_path.write_text(MANIFEST_CHECKER)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @patch("modules.check.check_loader.getChecksPy")
+    def test_load_checks_from_checker_does_not_load_static_checker(self, mocked_get_checks):
+        loaded_checks_map = {}
+
+        actual = check_loader.load_checks_from_checker(self.checker_path, "0.2", loaded_checks_map)
+
+        mocked_get_checks.assert_not_called()
+        self.assertEqual(len(actual), 1)
+        self.assertIsInstance(actual[0], check_loader.LazyCheck)
+        self.assertEqual(loaded_checks_map[self.checker_path].name, "manifest_check")
+
+    @patch("modules.check.check_loader.getChecksPy")
+    def test_load_checks_from_checker_loads_incompatible_static_checker(self, mocked_get_checks):
+        check_loader.load_checks_from_checker(self.checker_path, "0.3", {})
+
+        mocked_get_checks.assert_called_once()
+
+    def test_materialize_checks_loads_only_selected_checkers(self):
+        other_checker_path = Path(self.temp_dir.name) / "other_static_test_checker.py"
+        other_checker_path.write_text(MANIFEST_CHECKER.replace("manifest_check", "other_check"))
+        checks = check_loader.load_checks([self.checker_path, other_checker_path], "0.2", {})
+
+        with patch("modules.check.check_loader.getChecksPy", wraps=check_loader.getChecksPy) as mocked:
+            check_loader.materialize_checks(checks[1:])
+
+        mocked.assert_called_once_with(other_checker_path, "0.2")
+        self.assertEqual(checks[1].run({}).error_code, 0)
+
+    def test_materialize_checks_imports_checker_modules(self):
+        checks = check_loader.load_checks([self.checker_path], "0.2", {})
+
+        check_loader.materialize_checks(checks)
+
+        self.assertIsNotNone(checks[0].materialize().check_list._checker_module)
+
+    @patch("logging.debug")
+    def test_materialize_checks_does_not_raise_import_error(self, mocked_debug):
+        self.checker_path.write_text(MANIFEST_CHECKER + "raise ImportError('broken helper')\n")
+        checks = check_loader.load_checks([self.checker_path], "0.2", {})
+
+        check_loader.materialize_checks(checks)
+
+        self.assertIsNone(checks[0].materialize().check_list._checker_module)
+        self.assertRaises(ImportError, checks[0].run, {})
+
+    def test_load_checker_file_trusts_only_default_checkers(self):
+        default_checker_path = check_loader.DEFAULT_CHECKERS_PATHS[0] / "static_test_checker.py"
+
+        def get_checks(*args):
+            return [check_loader.BaseCheck()]
+
+        with patch("modules.check.check_loader.getChecksPy", side_effect=get_checks):
+            default_checks = check_loader._load_checker_file(default_checker_path, "0.3")
+            checks = check_loader._load_checker_file(self.checker_path, "0.3")
+
+        self.assertTrue(default_checks[0].trusted)
+        self.assertFalse(checks[0].trusted)
+
+
+PLUGIN_METADATA = """Metadata-Version: 2.1
+Name: diagnostics-plugin
+Version: 1.0
+"""
+
+PLUGIN_ENTRY_POINTS = """[diagnostics_utility.checkers]
+plugin = diagnostics_plugin.plugin_checker
+"""
+
+
+class TestCheckerEntryPointsIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_folder = Path(self.temp_dir.name) / "cache"
+        self.site_folder = Path(self.temp_dir.name) / "site-packages"
+        dist_info = self.site_folder / "diagnostics_plugin-1.0.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "METADATA").write_text(PLUGIN_METADATA)
+        (dist_info / "entry_points.txt").write_text(PLUGIN_ENTRY_POINTS)
+        package = self.site_folder / "diagnostics_plugin"
+        package.mkdir()
+        # The package must not be imported until the check is run
+        (package / "__init__.py").write_text("raise RuntimeError('The package is imported')\n")
+        self.checker_path = package / "plugin_checker.py"
+        self.checker_path.write_text(MANIFEST_CHECKER)
+        self.paths = [str(self.site_folder)]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_checkers_paths_finds_registered_checker(self):
+        index = check_loader.CheckerEntryPointsIndex(folder=self.cache_folder, paths=self.paths)
+
+        actual = index.get_checkers_paths()
+
+        self.assertEqual(actual, [self.checker_path])
+
+    def test_get_checkers_paths_uses_saved_index(self):
+        index = check_loader.CheckerEntryPointsIndex(folder=self.cache_folder, paths=self.paths)
+        index.get_checkers_paths()
+        index.save()
+
+        with patch("modules.check.check_loader._discover_entry_points") as mocked_discover:
+            actual = check_loader.CheckerEntryPointsIndex(
+                folder=self.cache_folder, paths=self.paths).get_checkers_paths()
+
+        mocked_discover.assert_not_called()
+        self.assertEqual(actual, [self.checker_path])
+
+    def test_get_checkers_paths_rescans_changed_site_packages(self):
+        index = check_loader.CheckerEntryPointsIndex(folder=self.cache_folder, paths=self.paths)
+        index.get_checkers_paths()
+        index.save()
+        stat = self.site_folder.stat()
+        os.utime(self.site_folder, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        with patch("modules.check.check_loader._discover_entry_points", return_value=[]) as mocked_discover:
+            actual = check_loader.CheckerEntryPointsIndex(
+                folder=self.cache_folder, paths=self.paths).get_checkers_paths()
+
+        mocked_discover.assert_called_once_with(self.paths)
+        self.assertEqual(actual, [])
+
+    def test_get_checkers_paths_read_disabled(self):
+        index = check_loader.CheckerEntryPointsIndex(folder=self.cache_folder, paths=self.paths)
+        index.get_checkers_paths()
+        index.save()
+
+        with patch("modules.check.check_loader._discover_entry_points", return_value=[]) as mocked_discover:
+            check_loader.CheckerEntryPointsIndex(
+                folder=self.cache_folder, read=False, paths=self.paths).get_checkers_paths()
+
+        mocked_discover.assert_called_once()
+
+    @patch("logging.warning")
+    def test_get_checkers_paths_skips_not_found_module(self, mocked_log):
+        self.checker_path.unlink()
+        index = check_loader.CheckerEntryPointsIndex(folder=self.cache_folder, paths=self.paths)
+
+        actual = index.get_checkers_paths()
+
+        self.assertEqual(actual, [])
+        mocked_log.assert_called_once()
+
+    @patch("modules.check.check_loader.getChecksPy")
+    def test_load_checks_from_entry_points_does_not_import_checker(self, mocked_get_checks):
+        loaded_checks_map = {}
+        index = check_loader.CheckerEntryPointsIndex(folder=self.cache_folder, paths=self.paths)
+
+        actual = check_loader.load_checks_from_entry_points("0.2", loaded_checks_map, None, index)
+
+        mocked_get_checks.assert_not_called()
+        self.assertEqual(len(actual), 1)
+        self.assertIsInstance(actual[0], check_loader.LazyCheck)
+        self.assertEqual(loaded_checks_map[self.checker_path].name, "manifest_check")
+
+    def test_load_checks_from_entry_points_resolves_relative_imports(self):
+        package = self.checker_path.parent
+        (package / "__init__.py").write_text("")
+        (package / "helper.py").write_text("STATUS = 'PASS'\n")
+        checker = MANIFEST_CHECKER.replace('"CheckStatus": "PASS"', '"CheckStatus": STATUS')
+        self.checker_path.write_text("from .helper import STATUS\n" + checker)
+        index = check_loader.CheckerEntryPointsIndex(folder=self.cache_folder, paths=self.paths)
+        self.addCleanup(lambda: [
+            sys.modules.pop(name) for name in list(sys.modules) if name.startswith("diagnostics_plugin")])
+        importlib.invalidate_caches()
+
+        with patch.object(sys, "path", sys.path + self.paths):
+            checks = check_loader.load_checks_from_entry_points("0.2", {}, None, index)
+            check_loader.materialize_checks(checks)
+            actual = checks[0].run({})
+
+        self.assertEqual(actual.error_code, 0)
+        self.assertIn("diagnostics_plugin.plugin_checker", sys.modules)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -91,7 +91,7 @@ class TestClassCheckPy(unittest.TestCase):
 
 class TestGetCheckerPy(unittest.TestCase):
 
-    @patch("builtins.__import__", return_value=mocked_module)
+    @patch("modules.check.check_list_py.import_checker_module", return_value=mocked_module)
     def test_get_checks_py_correct_with_correct_argument(self, mock_import):
         expected = py_metadata
         mocked_file = MagicMock()
@@ -111,7 +111,7 @@ class TestGetCheckerPy(unittest.TestCase):
         self.assertRaises(OSError, check_py.getChecksPy, mocked_file, "0.2")
         mock_log.assert_called()
 
-    @patch("builtins.__import__", return_value=mocked_module)
+    @patch("modules.check.check_list_py.import_checker_module", return_value=mocked_module)
     @patch("logging.error")
     def test_get_checks_py_raise_error_if_version_not_compatible(self, mock_log, mock_import):
         mocked_file = MagicMock()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+# NOTE: workaround to import modules
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
+
+import unittest  # noqa: E402
+
+from modules.check.check_registry import CheckRegistry  # noqa: E402
+from modules.check.tests.check_test_helper import get_check  # noqa: E402
+
+
+class TestCheckRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.check_1 = get_check("check_1", groups="default,gpu")
+        self.check_2 = get_check("check_2", groups="sysinfo", version=2)
+        self.check_3 = get_check("check_3", groups="gpu")
+        self.registry = CheckRegistry([self.check_1, self.check_2, self.check_3])
+
+    def test_get_by_name(self):
+        self.assertIs(self.check_2, self.registry.get("check_2"))
+        self.assertIsNone(self.registry.get("check_4"))
+
+    def test_get_by_name_and_version(self):
+        self.assertIs(self.check_2, self.registry.get("check_2", 2))
+        self.assertIsNone(self.registry.get("check_2", 1))
+
+    def test_get_group(self):
+        expected = [self.check_1, self.check_3]
+
+        actual = self.registry.get_group("gpu")
+
+        self.assertEqual(expected, actual)
+
+    def test_select_keeps_order_of_checks(self):
+        expected = [self.check_1, self.check_2, self.check_3]
+
+        actual = self.registry.select(["check_3", "sysinfo", "default"])
+
+        self.assertEqual(expected, actual)
+
+    def test_select_all(self):
+        expected = [self.check_1, self.check_2, self.check_3]
+
+        actual = self.registry.select(["gpu", "all"])
+
+        self.assertEqual(expected, actual)
+
+    def test_select_not_found(self):
+        self.assertEqual([], self.registry.select(["unknown"]))
+
+    def test_add_duplicate(self):
+        duplicate = get_check("check_1", groups="sysinfo", version=2)
+
+        is_added = self.registry.add(duplicate)
+
+        self.assertFalse(is_added)
+        self.assertEqual({"check_1": [self.check_1, duplicate]}, self.registry.duplicates)
+        self.assertIs(self.check_1, self.registry.get("check_1"))
+        self.assertEqual([self.check_2], self.registry.get_group("sysinfo"))
+        self.assertEqual(3, len(self.registry))
+
+    def test_contains(self):
+        self.assertIn("check_1", self.registry)
+        self.assertNotIn("check_4", self.registry)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,12 +19,76 @@ from modules.check.check import CheckSummary
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
 
 import json  # noqa: E402
+import pickle  # noqa: E402
+import subprocess  # noqa: E402
+import tempfile  # noqa: E402
+import threading  # noqa: E402
 import time  # noqa: E402
 import unittest  # noqa: E402
-from unittest.mock import MagicMock, patch, call  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from multiprocessing import Pipe, Process  # noqa: E402
+from unittest.mock import ANY, MagicMock, patch, call  # noqa: E402
 
-from modules.check.check_runner import run_checks, check_run, _get_dependency_checks_map,\
-    create_dependency_order, _check_run  # noqa: E402
+from modules.check.check_runner import run_checks, check_run, _get_dependency_checks_map, \
+    create_dependency_order, _create_checks_index, _check_run, CheckWorkerPool, is_worker_pool_supported, \
+    _get_timeout_check_summary, _get_checks_priorities, _receive_result, _wait_process, \
+    TERMINATION_TIME  # noqa: E402
+from modules.check.result_store import ResultStore, StoredResults  # noqa: E402
+from modules.check.tests.check_test_helper import get_check, get_summary  # noqa: E402
+
+
+_RESULT_TREE = {
+    "CheckResult": {
+        "Check": {
+            "CheckResult": {
+                "Subcheck": {
+                    "CheckResult": "Subcheck Value",
+                    "CheckStatus": "WARNING"
+                }
+            },
+            "CheckStatus": "INFO"
+        }
+    }
+}
+
+
+def _get_pid_summary(data):
+    return CheckSummary(result=json.dumps({
+        "CheckResult": {
+            "Check": {
+                "CheckResult": os.getpid(),
+                "CheckStatus": "INFO"
+            }
+        }
+    }))
+
+
+def _get_info_summary(*args):
+    return get_summary("INFO")
+
+
+def _start_thread_and_get_info_summary(data):
+    # The thread is not a daemon, so the process waits for it to exit
+    threading.Thread(target=time.sleep, args=(30,)).start()
+    return _get_info_summary()
+
+
+def _spawn_grandchild(pid_file):
+    def run(data):
+        process = subprocess.Popen(["sleep", "30"])
+        with open(pid_file, mode="w") as file:
+            file.write(str(process.pid))
+        time.sleep(5)
+    return run
+
+
+def _is_running(pid):
+    try:
+        with open(f"/proc/{pid}/stat", mode="r") as file:
+            stat = file.read()
+    except OSError:
+        return False
+    return stat[stat.rfind(")") + 2] != "Z"
 
 
 @unittest.skipUnless(not platform.system(
@@ -54,7 +118,11 @@ class TestCheckRun(unittest.TestCase):
         }))
         actual = check_run(mocked_check, {})
 
-        self.assertEqual(expected.__dict__, actual.__dict__)
+        self.assertEqual(expected.result, actual.result)
+        self.assertEqual(expected.error_code, actual.error_code)
+        self.assertIsNotNone(actual.user_time)
+        self.assertIsNotNone(actual.system_time)
+        self.assertIsNotNone(actual.max_rss)
 
     def test_check_run_timeout_positive(self):
         mocked_check = MagicMock()
@@ -78,7 +146,74 @@ class TestCheckRun(unittest.TestCase):
         }))
         actual = check_run(mocked_check, {})
 
-        self.assertEqual(expected.__dict__, actual.__dict__)
+        self.assertEqual(expected.result, actual.result)
+        self.assertEqual(expected.error_code, actual.error_code)
+        self.assertIsNotNone(actual.user_time)
+        self.assertIsNotNone(actual.system_time)
+        self.assertIsNotNone(actual.max_rss)
+
+    @patch("logging.warning")
+    def test_check_run_terminates_process_that_does_not_exit_after_result(self, mocked_warning):
+        mocked_check = MagicMock()
+        mocked_check.get_metadata.return_value = MagicMock()
+        mocked_check.get_metadata.return_value.name = "check"
+        mocked_check.get_metadata.return_value.timeout = 1
+        mocked_check.run = _start_thread_and_get_info_summary
+        start_time = time.monotonic()
+
+        actual = check_run(mocked_check, {})
+
+        self.assertLess(time.monotonic() - start_time, 10)
+        self.assertEqual(actual.result_tree, _get_info_summary().result_tree)
+        mocked_warning.assert_called_once()
+
+    @unittest.skipUnless(os.path.isdir("/proc"), "requires procfs")
+    def test_check_run_timeout_kills_process_tree(self):
+        mocked_check = MagicMock()
+        mocked_check.get_metadata.return_value = MagicMock()
+        mocked_check.get_metadata.return_value.name = "check"
+        mocked_check.get_metadata.return_value.timeout = 1
+        with tempfile.TemporaryDirectory() as folder:
+            pid_file = os.path.join(folder, "pid")
+            mocked_check.run = _spawn_grandchild(pid_file)
+
+            actual = json.loads(check_run(mocked_check, {}).result)
+
+            with open(pid_file, mode="r") as file:
+                grandchild_pid = int(file.read())
+
+        self.assertEqual(actual["CheckResult"]["check"]["CheckResult"], "Timeout was exceeded.")
+        self.assertFalse(_is_running(grandchild_pid))
+
+    def test_check_run_process_exits_without_result(self):
+        check = get_check("check", timeout=10)
+        check.run = lambda data: os._exit(1)
+
+        start_time = time.monotonic()
+        actual = check_run(check, {})
+
+        self.assertEqual(actual.error_code, 3)
+        self.assertLess(time.monotonic() - start_time, 5)
+
+    def test_get_timeout_check_summary_survived_processes(self):
+        mocked_check = MagicMock()
+        mocked_check.get_metadata.return_value.name = "check"
+
+        actual = json.loads(_get_timeout_check_summary(mocked_check, ["123 (sleep)"]).result)
+
+        self.assertEqual(
+            actual["CheckResult"]["check"]["Message"],
+            "The following processes were not terminated: 123 (sleep).")
+
+    @unittest.skipUnless(hasattr(os, "wait4"), "requires os.wait4")
+    def test_wait_process_returns_usage_and_sets_exit_code(self):
+        process = Process(target=sys.exit, args=(3,))
+        process.start()
+
+        actual = _wait_process(process)
+
+        self.assertIsNotNone(actual.ru_maxrss)
+        self.assertEqual(3, process.exitcode)
 
     def test_check_run_check_crush_positive(self):
         mocked_check = MagicMock()
@@ -103,7 +238,137 @@ class TestCheckRun(unittest.TestCase):
         }))
         actual = check_run(mocked_check, {})
 
-        self.assertEqual(expected.__dict__, actual.__dict__)
+        self.assertEqual(expected.result, actual.result)
+        self.assertEqual(expected.error_code, actual.error_code)
+        self.assertIsNotNone(actual.max_rss)
+
+
+@unittest.skipUnless(is_worker_pool_supported(), "fork start method is not supported")
+class TestCheckWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.mocked_check = MagicMock()
+        self.mocked_check.get_metadata.return_value = MagicMock()
+        self.mocked_check.get_metadata.return_value.name = "check"
+        self.mocked_check.get_metadata.return_value.timeout = 1
+        self.mocked_check.run.side_effect = _get_pid_summary
+
+    def test_worker_pool_run_reuses_worker(self):
+        with CheckWorkerPool([self.mocked_check], 1) as pool:
+            first = json.loads(pool.run(self.mocked_check, {}).result)
+            second = json.loads(pool.run(self.mocked_check, {}).result)
+
+        self.assertNotEqual(first["CheckResult"]["Check"]["CheckResult"], os.getpid())
+        self.assertEqual(first, second)
+
+    def test_worker_pool_run_reports_cpu_time_of_check_only(self):
+        with CheckWorkerPool([self.mocked_check], 1) as pool:
+            actual = pool.run(self.mocked_check, {})
+
+        self.assertIsNotNone(actual.user_time)
+        self.assertIsNotNone(actual.system_time)
+        self.assertIsNone(actual.max_rss)
+
+    @patch("logging.warning")
+    def test_worker_pool_run_timeout_replaces_worker(self, mocked_warning):
+        mocked_slow_check = MagicMock()
+        mocked_slow_check.get_metadata.return_value = MagicMock()
+        mocked_slow_check.get_metadata.return_value.name = "slow_check"
+        mocked_slow_check.get_metadata.return_value.timeout = 1
+        mocked_slow_check.run = lambda data: time.sleep(2)
+
+        with CheckWorkerPool([self.mocked_check, mocked_slow_check], 1) as pool:
+            first = json.loads(pool.run(self.mocked_check, {}).result)
+            timeout = pool.run(mocked_slow_check, {})
+            second = json.loads(pool.run(self.mocked_check, {}).result)
+
+        self.assertEqual(
+            timeout.result_tree["CheckResult"]["slow_check"]["CheckResult"], "Timeout was exceeded.")
+        self.assertIsNone(timeout.user_time)
+        self.assertIsNone(timeout.max_rss)
+        self.assertNotEqual(first, second)
+        mocked_warning.assert_called_once()
+
+    @patch("logging.warning")
+    def test_worker_pool_replaces_workers_stopped_in_other_thread_from_main_thread(self, mocked_warning):
+        mocked_slow_check = MagicMock()
+        mocked_slow_check.get_metadata.return_value = MagicMock()
+        mocked_slow_check.get_metadata.return_value.name = "slow_check"
+        mocked_slow_check.get_metadata.return_value.timeout = 1
+        mocked_slow_check.run = lambda data: time.sleep(2)
+
+        with CheckWorkerPool([self.mocked_check, mocked_slow_check], 1) as pool, \
+                ThreadPoolExecutor(max_workers=1) as executor:
+            with patch.object(pool, "_start_worker", wraps=pool._start_worker) as mocked_start_worker:
+                executor.submit(pool.run, mocked_slow_check, {}).result()
+                mocked_start_worker.assert_not_called()
+
+                pool.replace_stopped_workers()
+                actual = json.loads(executor.submit(pool.run, self.mocked_check, {}).result().result)
+
+        mocked_start_worker.assert_called_once_with()
+        self.assertNotEqual(actual["CheckResult"]["Check"]["CheckResult"], os.getpid())
+
+    @unittest.skipUnless(os.path.isdir("/proc"), "requires procfs")
+    @patch("logging.warning")
+    def test_worker_pool_run_timeout_kills_process_tree(self, mocked_warning):
+        mocked_slow_check = MagicMock()
+        mocked_slow_check.get_metadata.return_value = MagicMock()
+        mocked_slow_check.get_metadata.return_value.name = "slow_check"
+        mocked_slow_check.get_metadata.return_value.timeout = 1
+        with tempfile.TemporaryDirectory() as folder:
+            pid_file = os.path.join(folder, "pid")
+            mocked_slow_check.run = _spawn_grandchild(pid_file)
+
+            with CheckWorkerPool([mocked_slow_check], 1) as pool:
+                pool.run(mocked_slow_check, {})
+
+            with open(pid_file, mode="r") as file:
+                grandchild_pid = int(file.read())
+
+        self.assertFalse(_is_running(grandchild_pid))
+
+    def test_worker_pool_run_reads_stored_results(self):
+        self.mocked_check.run.side_effect = lambda data: CheckSummary(result_tree=data["dependency_check"])
+
+        with ResultStore() as store, CheckWorkerPool([self.mocked_check], 1) as pool:
+            store.put("dependency_check", _RESULT_TREE)
+            actual = pool.run(self.mocked_check, store.view(["dependency_check"]))
+
+        self.assertEqual(_RESULT_TREE, actual.result_tree)
+
+    def test_worker_pool_run_check_exception(self):
+        self.mocked_check.run.side_effect = Exception()
+
+        with CheckWorkerPool([self.mocked_check], 1) as pool:
+            actual = pool.run(self.mocked_check, {})
+
+        self.assertEqual(actual.error_code, 3)
+
+    @patch("logging.warning")
+    def test_worker_pool_run_worker_crash_replaces_worker(self, mocked_warning):
+        mocked_crash_check = MagicMock()
+        mocked_crash_check.get_metadata.return_value = MagicMock()
+        mocked_crash_check.get_metadata.return_value.name = "crash_check"
+        mocked_crash_check.get_metadata.return_value.timeout = 5
+        mocked_crash_check.run = lambda data: os._exit(1)
+
+        with CheckWorkerPool([self.mocked_check, mocked_crash_check], 1) as pool:
+            crash = json.loads(pool.run(mocked_crash_check, {}).result)
+            actual = pool.run(self.mocked_check, {})
+
+        self.assertEqual(crash["CheckStatus"], "ERROR")
+        self.assertEqual(actual.error_code, 0)
+        mocked_warning.assert_called_once()
+
+    def test_run_checks_with_worker_pool(self):
+        self.mocked_check.get_metadata.return_value.dataReq = "{}"
+        self.mocked_check.get_metadata.return_value.statusReq = "{}"
+        self.mocked_check.get_summary.side_effect = lambda: self.mocked_check.set_summary.call_args.args[0]
+
+        run_checks([self.mocked_check], use_worker_pool=True)
+
+        self.assertEqual(self.mocked_check.get_summary().error_code, 0)
 
 
 class TestGetDependencyChecksMap(unittest.TestCase):
@@ -116,7 +381,7 @@ class TestGetDependencyChecksMap(unittest.TestCase):
 
         expected = {"check": mocked_check}
 
-        actual = _get_dependency_checks_map([mocked_check], {"check": 2})
+        actual = _get_dependency_checks_map(_create_checks_index([mocked_check]), {"check": 2})
 
         self.assertEqual(expected, actual)
 
@@ -128,7 +393,7 @@ class TestGetDependencyChecksMap(unittest.TestCase):
 
         expected = {}
 
-        actual = _get_dependency_checks_map([mocked_check], {})
+        actual = _get_dependency_checks_map(_create_checks_index([mocked_check]), {})
 
         self.assertEqual(expected, actual)
 
@@ -141,7 +406,7 @@ class TestGetDependencyChecksMap(unittest.TestCase):
 
         expected = {}
 
-        actual = _get_dependency_checks_map([mocked_check], {"check": 3})
+        actual = _get_dependency_checks_map(_create_checks_index([mocked_check]), {"check": 3})
 
         self.assertEqual(expected, actual)
         mocked_log.assert_called()
@@ -155,7 +420,7 @@ class TestGetDependencyChecksMap(unittest.TestCase):
 
         expected = {}
 
-        actual = _get_dependency_checks_map([mocked_check], {"check": 2})
+        actual = _get_dependency_checks_map(_create_checks_index([mocked_check]), {"check": 2})
 
         self.assertEqual(expected, actual)
         mocked_log.assert_called_once()
@@ -169,6 +434,7 @@ class TestCreateDependencyOrder(unittest.TestCase):
         mocked_check_1.get_metadata.return_value.name = "check_1"
         mocked_check_1.get_metadata.return_value.version = 2
         mocked_check_1.get_metadata.return_value.dataReq = """{"check_3": 2}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
         mocked_check_1.get_metadata.return_value.groups = "default"
 
         mocked_check_2 = MagicMock()
@@ -176,6 +442,7 @@ class TestCreateDependencyOrder(unittest.TestCase):
         mocked_check_2.get_metadata.return_value.name = "check_2"
         mocked_check_2.get_metadata.return_value.version = 2
         mocked_check_2.get_metadata.return_value.dataReq = """{"check_1": 2}"""
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
         mocked_check_2.get_metadata.return_value.groups = "default"
 
         mocked_check_3 = MagicMock()
@@ -183,6 +450,7 @@ class TestCreateDependencyOrder(unittest.TestCase):
         mocked_check_3.get_metadata.return_value.name = "check_3"
         mocked_check_3.get_metadata.return_value.version = 2
         mocked_check_3.get_metadata.return_value.dataReq = "{}"
+        mocked_check_3.get_metadata.return_value.statusReq = "{}"
         mocked_check_3.get_metadata.return_value.groups = "default"
 
         expected = (["check_1", "check_2", "check_3"], [mocked_check_3, mocked_check_1, mocked_check_2])
@@ -191,6 +459,103 @@ class TestCreateDependencyOrder(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_create_dependency_order_transitive_dependencies(self):
+        mocked_check_1 = MagicMock()
+        mocked_check_1.get_metadata.return_value = MagicMock()
+        mocked_check_1.get_metadata.return_value.name = "check_1"
+        mocked_check_1.get_metadata.return_value.version = 2
+        mocked_check_1.get_metadata.return_value.dataReq = """{"check_2": 2}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
+        mocked_check_1.get_metadata.return_value.groups = "default"
+
+        mocked_check_2 = MagicMock()
+        mocked_check_2.get_metadata.return_value = MagicMock()
+        mocked_check_2.get_metadata.return_value.name = "check_2"
+        mocked_check_2.get_metadata.return_value.version = 2
+        mocked_check_2.get_metadata.return_value.dataReq = """{"check_3": 2}"""
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
+        mocked_check_2.get_metadata.return_value.groups = "other"
+
+        mocked_check_3 = MagicMock()
+        mocked_check_3.get_metadata.return_value = MagicMock()
+        mocked_check_3.get_metadata.return_value.name = "check_3"
+        mocked_check_3.get_metadata.return_value.version = 2
+        mocked_check_3.get_metadata.return_value.dataReq = "{}"
+        mocked_check_3.get_metadata.return_value.statusReq = "{}"
+        mocked_check_3.get_metadata.return_value.groups = "other"
+
+        expected = (["check_1"], [mocked_check_3, mocked_check_2, mocked_check_1])
+
+        actual = create_dependency_order([mocked_check_1, mocked_check_2, mocked_check_3], {"default"})
+
+        self.assertEqual(expected, actual)
+
+    @patch("logging.error")
+    def test_create_dependency_order_cycle(self, mocked_error):
+        mocked_check_1 = MagicMock()
+        mocked_check_1.get_metadata.return_value = MagicMock()
+        mocked_check_1.get_metadata.return_value.name = "check_1"
+        mocked_check_1.get_metadata.return_value.version = 2
+        mocked_check_1.get_metadata.return_value.dataReq = """{"check_2": 2}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
+        mocked_check_1.get_metadata.return_value.groups = "default"
+
+        mocked_check_2 = MagicMock()
+        mocked_check_2.get_metadata.return_value = MagicMock()
+        mocked_check_2.get_metadata.return_value.name = "check_2"
+        mocked_check_2.get_metadata.return_value.version = 2
+        mocked_check_2.get_metadata.return_value.dataReq = """{"check_1": 2}"""
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
+        mocked_check_2.get_metadata.return_value.groups = "other"
+
+        mocked_check_3 = MagicMock()
+        mocked_check_3.get_metadata.return_value = MagicMock()
+        mocked_check_3.get_metadata.return_value.name = "check_3"
+        mocked_check_3.get_metadata.return_value.version = 2
+        mocked_check_3.get_metadata.return_value.dataReq = "{}"
+        mocked_check_3.get_metadata.return_value.statusReq = "{}"
+        mocked_check_3.get_metadata.return_value.groups = "default"
+
+        expected = (["check_3"], [mocked_check_3])
+
+        actual = create_dependency_order([mocked_check_1, mocked_check_2, mocked_check_3], {"default"})
+
+        self.assertEqual(expected, actual)
+        mocked_error.assert_any_call("Dependency cycle detected: check_1 -> check_2 -> check_1.")
+
+    @patch("logging.error")
+    def test_create_dependency_order_version_conflict(self, mocked_error):
+        mocked_check_1 = MagicMock()
+        mocked_check_1.get_metadata.return_value = MagicMock()
+        mocked_check_1.get_metadata.return_value.name = "check_1"
+        mocked_check_1.get_metadata.return_value.version = 2
+        mocked_check_1.get_metadata.return_value.dataReq = """{"check_2": 2}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
+        mocked_check_1.get_metadata.return_value.groups = "default"
+
+        mocked_check_2 = MagicMock()
+        mocked_check_2.get_metadata.return_value = MagicMock()
+        mocked_check_2.get_metadata.return_value.name = "check_2"
+        mocked_check_2.get_metadata.return_value.version = 2
+        mocked_check_2.get_metadata.return_value.dataReq = """{"check_3": 1}"""
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
+        mocked_check_2.get_metadata.return_value.groups = "default"
+
+        mocked_check_3 = MagicMock()
+        mocked_check_3.get_metadata.return_value = MagicMock()
+        mocked_check_3.get_metadata.return_value.name = "check_3"
+        mocked_check_3.get_metadata.return_value.version = 2
+        mocked_check_3.get_metadata.return_value.dataReq = "{}"
+        mocked_check_3.get_metadata.return_value.statusReq = "{}"
+        mocked_check_3.get_metadata.return_value.groups = "default"
+
+        expected = (["check_3"], [mocked_check_3])
+
+        actual = create_dependency_order([mocked_check_1, mocked_check_2, mocked_check_3], {"default"})
+
+        self.assertEqual(expected, actual)
+        mocked_error.assert_any_call("Another version of the required dependency check_3 is loaded.")
+
 
 class TestRunChecks(unittest.TestCase):
 
@@ -210,6 +575,7 @@ class TestRunChecks(unittest.TestCase):
         mocked_check.get_metadata.return_value = MagicMock()
         mocked_check.get_metadata.return_value.name = "check"
         mocked_check.get_metadata.return_value.dataReq = """{"data": "2"}"""
+        mocked_check.get_metadata.return_value.statusReq = "{}"
         mocked_check.get_summary.return_value = None
 
         run_checks([mocked_check])
@@ -219,44 +585,99 @@ class TestRunChecks(unittest.TestCase):
     @patch("modules.check.check_runner.check_run")
     def test_run_checks_run_check(self, mocked_check_run):
         mocked_summary = MagicMock()
-        mocked_summary.result = "{}"
+        mocked_summary.result_tree = {}
         mocked_check = MagicMock()
         mocked_check.get_metadata.return_value = MagicMock()
         mocked_check.get_metadata.return_value.name = "check"
         mocked_check.get_metadata.return_value.timeout = 1
         mocked_check.get_metadata.return_value.dataReq = "{}"
+        mocked_check.get_metadata.return_value.statusReq = "{}"
         mocked_check.get_summary.return_value = mocked_summary
 
         run_checks([mocked_check])
 
         mocked_check_run.assert_called_once_with(mocked_check, {})
 
+    @patch("modules.check.check_runner.get_start_method", return_value="fork")
+    @patch("modules.check.check_runner.ResultStore")
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_forked_checks_do_not_use_result_store(
+            self, mocked_check_run, mocked_result_store, mocked_get_start_method):
+        mocked_check_run.side_effect = _get_info_summary
+        check = get_check("check")
+        dependent_check = get_check("dependent_check", dataReq="""{"check": 1}""")
+
+        run_checks([check, dependent_check])
+
+        mocked_result_store.assert_not_called()
+        self.assertIs(type(mocked_check_run.call_args.args[1]), dict)
+
+    @patch("modules.check.check_runner.ResultStore")
+    @patch("modules.check.check_runner.CheckWorkerPool")
+    def test_run_checks_stores_only_results_with_pending_dependents(
+            self, mocked_worker_pool, mocked_result_store):
+        mocked_worker_pool.return_value.run.side_effect = _get_info_summary
+        check = get_check("check")
+        dependent_check = get_check("dependent_check", dataReq="""{"check": 1}""")
+        independent_check = get_check("independent_check")
+
+        run_checks([check, dependent_check, independent_check], use_worker_pool=True)
+
+        mocked_result_store.return_value.put.assert_called_once_with("check", ANY)
+        mocked_result_store.return_value.close.assert_called_once_with()
+
+    @unittest.skipUnless(hasattr(os, "killpg") and os.path.isdir("/proc"), "requires process groups")
+    def test_run_checks_kills_process_groups_on_keyboard_interrupt(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pid_file = os.path.join(temp_dir, "pid")
+            check = get_check("check", timeout=10)
+            check.run = _spawn_grandchild(pid_file)
+
+            def interrupt(*args, **kwargs):
+                while not os.path.exists(pid_file) or os.path.getsize(pid_file) == 0:
+                    time.sleep(0.01)
+                raise KeyboardInterrupt()
+
+            start_time = time.monotonic()
+            with patch("modules.check.check_runner.wait", side_effect=interrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    run_checks([check])
+            duration = time.monotonic() - start_time
+
+            with open(pid_file, mode="r") as file:
+                grandchild_pid = int(file.read())
+
+        self.assertFalse(_is_running(grandchild_pid))
+        self.assertLess(duration, 5)
+
     @patch("modules.check.check_runner.check_run")
     def test_run_checks_run_two_dependencies_checks(self, mocked_check_run):
         mocked_summary_1 = MagicMock()
-        mocked_summary_1.result = "{}"
+        mocked_summary_1.result_tree = {}
         mocked_check_1 = MagicMock()
         mocked_check_1.get_metadata.return_value = MagicMock()
         mocked_check_1.get_metadata.return_value.name = "check_1"
         mocked_check_1.get_metadata.return_value.timeout = 1
         mocked_check_1.get_metadata.return_value.dataReq = """{"check_2": "2"}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
         mocked_check_1.get_summary.return_value = mocked_summary_1
 
         mocked_summary_2 = MagicMock()
-        mocked_summary_2.result = json.dumps({
+        mocked_summary_2.result_tree = {
             "CheckResult": {
                 "Check 2": {
                     "CheckResult": "Check 2 Value",
                     "CheckStatus": "INFO"
                 }
             }
-        })
+        }
         mocked_check_2 = MagicMock()
         mocked_check_2.get_metadata.return_value = MagicMock()
         mocked_check_2.get_metadata.return_value.name = "check_2"
         mocked_check_2.get_metadata.return_value.version = "2"
         mocked_check_2.get_metadata.return_value.timeout = 1
         mocked_check_2.get_metadata.return_value.dataReq = "{}"
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
         mocked_check_2.get_summary.return_value = mocked_summary_2
 
         run_checks([mocked_check_2, mocked_check_1])
@@ -276,12 +697,13 @@ class TestRunChecks(unittest.TestCase):
     @patch("modules.check.check_runner.check_run")
     def test_run_checks_run_two_separate_checks(self, mocked_check_run):
         mocked_summary = MagicMock()
-        mocked_summary.result = "{}"
+        mocked_summary.result_tree = {}
         mocked_check_1 = MagicMock()
         mocked_check_1.get_metadata.return_value = MagicMock()
         mocked_check_1.get_metadata.return_value.name = "check_1"
         mocked_check_1.get_metadata.return_value.timeout = 1
         mocked_check_1.get_metadata.return_value.dataReq = "{}"
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
         mocked_check_1.get_summary.return_value = mocked_summary
 
         mocked_check_2 = MagicMock()
@@ -289,6 +711,7 @@ class TestRunChecks(unittest.TestCase):
         mocked_check_2.get_metadata.return_value.name = "check_2"
         mocked_check_2.get_metadata.return_value.timeout = 1
         mocked_check_2.get_metadata.return_value.dataReq = "{}"
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
         mocked_check_2.get_summary.return_value = mocked_summary
 
         run_checks([mocked_check_1, mocked_check_2])
@@ -299,6 +722,251 @@ class TestRunChecks(unittest.TestCase):
         ]
         mocked_check_run.assert_has_calls(expected_calls, any_order=True)
 
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_run_independent_checks_concurrently(self, mocked_check_run):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_other_check(check, data):
+            barrier.wait()
+            return MagicMock()
+
+        mocked_check_run.side_effect = wait_for_other_check
+        mocked_summary = MagicMock()
+        mocked_summary.result_tree = {}
+        mocked_check_1 = MagicMock()
+        mocked_check_1.get_metadata.return_value = MagicMock()
+        mocked_check_1.get_metadata.return_value.name = "check_1"
+        mocked_check_1.get_metadata.return_value.dataReq = "{}"
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
+        mocked_check_1.get_summary.return_value = mocked_summary
+
+        mocked_check_2 = MagicMock()
+        mocked_check_2.get_metadata.return_value = MagicMock()
+        mocked_check_2.get_metadata.return_value.name = "check_2"
+        mocked_check_2.get_metadata.return_value.dataReq = "{}"
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
+        mocked_check_2.get_summary.return_value = mocked_summary
+
+        run_checks([mocked_check_1, mocked_check_2], jobs=2)
+
+        self.assertFalse(barrier.broken)
+        self.assertEqual(mocked_check_run.call_count, 2)
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_run_dependent_check_after_dependency(self, mocked_check_run):
+        mocked_summary = MagicMock()
+        mocked_summary.result_tree = {}
+        mocked_check_1 = MagicMock()
+        mocked_check_1.get_metadata.return_value = MagicMock()
+        mocked_check_1.get_metadata.return_value.name = "check_1"
+        mocked_check_1.get_metadata.return_value.dataReq = """{"check_2": 2}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
+        mocked_check_1.get_summary.return_value = mocked_summary
+
+        mocked_check_2 = MagicMock()
+        mocked_check_2.get_metadata.return_value = MagicMock()
+        mocked_check_2.get_metadata.return_value.name = "check_2"
+        mocked_check_2.get_metadata.return_value.dataReq = "{}"
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
+        mocked_check_2.get_summary.return_value = mocked_summary
+
+        run_checks([mocked_check_1, mocked_check_2], jobs=2)
+
+        expected_calls = [
+            call(mocked_check_2, {}),
+            call(mocked_check_1, {"check_2": {}})
+        ]
+        self.assertEqual(expected_calls, mocked_check_run.call_args_list)
+
+    @patch("logging.error")
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_skip_checks_with_not_obtained_dependencies(self, mocked_check_run, mocked_error):
+        mocked_check_1 = MagicMock()
+        mocked_check_1.get_metadata.return_value = MagicMock()
+        mocked_check_1.get_metadata.return_value.name = "check_1"
+        mocked_check_1.get_metadata.return_value.dataReq = """{"check_2": 2}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
+
+        mocked_check_2 = MagicMock()
+        mocked_check_2.get_metadata.return_value = MagicMock()
+        mocked_check_2.get_metadata.return_value.name = "check_2"
+        mocked_check_2.get_metadata.return_value.dataReq = """{"check_3": 2}"""
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
+
+        run_checks([mocked_check_1, mocked_check_2], jobs=2)
+
+        mocked_check_run.assert_not_called()
+        self.assertEqual(mocked_error.call_count, 2)
+
+    @patch("logging.error")
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_skip_checks_with_dependency_cycle(self, mocked_check_run, mocked_error):
+        mocked_check_1 = MagicMock()
+        mocked_check_1.get_metadata.return_value = MagicMock()
+        mocked_check_1.get_metadata.return_value.name = "check_1"
+        mocked_check_1.get_metadata.return_value.dataReq = """{"check_2": 2}"""
+        mocked_check_1.get_metadata.return_value.statusReq = "{}"
+
+        mocked_check_2 = MagicMock()
+        mocked_check_2.get_metadata.return_value = MagicMock()
+        mocked_check_2.get_metadata.return_value.name = "check_2"
+        mocked_check_2.get_metadata.return_value.dataReq = """{"check_1": 2}"""
+        mocked_check_2.get_metadata.return_value.statusReq = "{}"
+
+        run_checks([mocked_check_1, mocked_check_2])
+
+        mocked_check_run.assert_not_called()
+        self.assertEqual(mocked_error.call_count, 2)
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_on_check_completed(self, mocked_check_run):
+        mocked_check_run.return_value = CheckSummary(result=json.dumps({
+            "CheckResult": {
+                "Check": {
+                    "CheckResult": "Check Value",
+                    "CheckStatus": "INFO"
+                }
+            }
+        }))
+        mocked_check = MagicMock()
+        mocked_check.get_metadata.return_value = MagicMock()
+        mocked_check.get_metadata.return_value.name = "check"
+        mocked_check.get_metadata.return_value.dataReq = "{}"
+        mocked_check.get_metadata.return_value.statusReq = "{}"
+        mocked_check.get_summary.return_value = mocked_check_run.return_value
+        mocked_on_check_completed = MagicMock()
+
+        run_checks([mocked_check], on_check_completed=mocked_on_check_completed)
+
+        mocked_on_check_completed.assert_called_once_with(mocked_check)
+        self.assertIsNotNone(mocked_check_run.return_value.duration)
+
+    def test_get_checks_priorities(self):
+        dependency_check = get_check("dependency_check", merit=1)
+        check = get_check("check", merit=3, dataReq="""{"dependency_check": 1}""")
+        top_check = get_check("top_check", merit=7, dataReq="""{"check": 1}""")
+
+        actual = _get_checks_priorities([top_check, check, dependency_check])
+
+        self.assertEqual(actual, {"dependency_check": 7, "check": 7, "top_check": 7})
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_budget_runs_checks_by_merit(self, mocked_check_run):
+        mocked_check_run.side_effect = _get_info_summary
+        low_merit_check = get_check("low_merit_check", merit=1)
+        dependency_check = get_check("dependency_check", merit=0)
+        high_merit_check = get_check("high_merit_check", merit=5, dataReq="""{"dependency_check": 1}""")
+
+        run_checks([low_merit_check, dependency_check, high_merit_check], budget=60)
+
+        self.assertEqual(
+            [call.args[0] for call in mocked_check_run.call_args_list],
+            [dependency_check, high_merit_check, low_merit_check])
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_budget_skips_checks_that_cannot_finish(self, mocked_check_run):
+        mocked_check_run.side_effect = _get_info_summary
+        short_check = get_check("short_check", timeout=1)
+        long_check = get_check("long_check", timeout=60)
+        dependent_check = get_check("dependent_check", dataReq="""{"long_check": 1}""")
+        mocked_on_check_completed = MagicMock()
+        mocked_result_cache = MagicMock()
+        mocked_result_cache.get.return_value = None
+        mocked_result_cache.get_duration.side_effect = lambda check: check.get_metadata().timeout
+
+        run_checks(
+            [short_check, long_check, dependent_check], result_cache=mocked_result_cache,
+            on_check_completed=mocked_on_check_completed, budget=10)
+
+        mocked_check_run.assert_called_once()
+        self.assertEqual(mocked_check_run.call_args.args[0], short_check)
+        self.assertIsNone(short_check.get_summary().skip_reason)
+        self.assertEqual(long_check.get_summary().skip_reason, "budget")
+        self.assertEqual(dependent_check.get_summary().skip_reason, "budget")
+        self.assertEqual(long_check.get_summary().error_code, 0)
+        self.assertEqual(mocked_on_check_completed.call_count, 3)
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_budget_cuts_off_running_check(self, mocked_check_run):
+        def time_out(check, data, timeout):
+            time.sleep(timeout)
+            return _get_timeout_check_summary(check)
+        mocked_check_run.side_effect = time_out
+        mocked_result_cache = MagicMock()
+        mocked_result_cache.get.return_value = None
+        mocked_result_cache.get_duration.return_value = 0.1
+        check = get_check("check", timeout=60)
+
+        run_checks([check], result_cache=mocked_result_cache, budget=0.6)
+
+        self.assertLessEqual(mocked_check_run.call_args.args[2], 0.3)
+        self.assertEqual(check.get_summary().skip_reason, "budget")
+        mocked_result_cache.set.assert_not_called()
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_budget_runs_checks_without_duration_with_capped_timeout(self, mocked_check_run):
+        mocked_check_run.side_effect = _get_info_summary
+        check = get_check("check", timeout=60)
+
+        run_checks([check], budget=TERMINATION_TIME + 10)
+
+        self.assertLessEqual(mocked_check_run.call_args.args[2], 10)
+        self.assertIsNone(check.get_summary().skip_reason)
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_budget_runs_checks_with_budget_shorter_than_termination(self, mocked_check_run):
+        mocked_check_run.side_effect = _get_info_summary
+        checks = [get_check(f"check_{index}", timeout=60) for index in range(3)]
+
+        run_checks(checks, budget=TERMINATION_TIME / 2)
+
+        self.assertEqual(mocked_check_run.call_count, 3)
+        for call_args in mocked_check_run.call_args_list:
+            self.assertGreater(call_args.args[2], 0)
+            self.assertLessEqual(call_args.args[2], TERMINATION_TIME / 4)
+        for check in checks:
+            self.assertIsNone(check.get_summary().skip_reason)
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_skip_checks_without_required_status(self, mocked_check_run):
+        mocked_check_run.return_value = get_summary("FAIL")
+        detector_check = get_check("detector_check")
+        gpu_check = get_check(
+            "gpu_check", dataReq="""{"detector_check": 1}""",
+            statusReq="""{"detector_check": ["PASS", "WARNING"]}""")
+        metrics_check = get_check("metrics_check", dataReq="""{"gpu_check": 1}""")
+
+        run_checks([detector_check, gpu_check, metrics_check])
+
+        mocked_check_run.assert_called_once_with(detector_check, {})
+        self.assertEqual(gpu_check.get_summary().skip_reason, "dependency")
+        self.assertEqual(metrics_check.get_summary().skip_reason, "dependency")
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_run_checks_with_required_status(self, mocked_check_run):
+        mocked_check_run.side_effect = _get_info_summary
+        detector_check = get_check("detector_check")
+        gpu_check = get_check(
+            "gpu_check", dataReq="""{"detector_check": 1}""",
+            statusReq="""{"detector_check": ["PASS", "WARNING"]}""")
+
+        run_checks([detector_check, gpu_check])
+
+        self.assertEqual(mocked_check_run.call_count, 2)
+        self.assertIsNone(gpu_check.get_summary().skip_reason)
+
+    @patch("modules.check.check_runner.check_run")
+    def test_run_checks_fail_fast(self, mocked_check_run):
+        mocked_check_run.side_effect = [get_summary("ERROR"), _get_info_summary()]
+        failed_check = get_check("failed_check")
+        check = get_check("check")
+
+        run_checks([failed_check, check], fail_fast=True)
+
+        mocked_check_run.assert_called_once_with(failed_check, {})
+        self.assertEqual(failed_check.get_summary().error_code, 3)
+        self.assertEqual(check.get_summary().skip_reason, "fail_fast")
+
     def test__check_run(self):
         mocked_connection = MagicMock()
         mocked_check = MagicMock()
@@ -308,7 +976,79 @@ class TestRunChecks(unittest.TestCase):
         _check_run(mocked_connection, mocked_check, {})
 
         mocked_check.run.assert_called_with({})
-        mocked_connection.send.assert_called_with('result')
+        mocked_connection.send_bytes.assert_called_once()
+        self.assertEqual(pickle.loads(mocked_connection.send_bytes.call_args.args[0]), 'result')
+
+    def test__check_run_sends_only_result_tree(self):
+        parent_connection, child_connection = Pipe(duplex=False)
+        mocked_check = MagicMock()
+        mocked_check.run.return_value = CheckSummary(result=json.dumps(_RESULT_TREE, indent=4))
+
+        _check_run(child_connection, mocked_check, {})
+        actual = _receive_result(parent_connection)
+
+        self.assertNotIn(b"    ", pickle.dumps(mocked_check.run.return_value))
+        self.assertEqual(actual.result_tree, _RESULT_TREE)
+        self.assertEqual(actual.error_code, 1)
+
+    def test__check_run_sends_error_if_result_cannot_be_pickled(self):
+        parent_connection, child_connection = Pipe(duplex=False)
+        mocked_check = MagicMock()
+        mocked_check.run.return_value = lambda: None
+
+        _check_run(child_connection, mocked_check, {})
+
+        self.assertIsInstance(_receive_result(parent_connection), RuntimeError)
+
+    @patch("logging.error")
+    def test__check_run_sends_error_if_result_is_not_json_serializable(self, mocked_error):
+        parent_connection, child_connection = Pipe(duplex=False)
+        mocked_check = MagicMock()
+        mocked_check.run.return_value = CheckSummary(result_tree={
+            "CheckResult": {"Check": {"CheckResult": {1, 2}, "CheckStatus": "INFO"}}}, trusted=True)
+
+        _check_run(child_connection, mocked_check, {})
+
+        self.assertIsInstance(_receive_result(parent_connection), RuntimeError)
+        mocked_error.assert_called_once()
+
+    def test__check_run_converts_result_to_json_types(self):
+        parent_connection, child_connection = Pipe(duplex=False)
+        mocked_check = MagicMock()
+        mocked_check.run.return_value = CheckSummary(result_tree={
+            "CheckResult": {1: {"CheckResult": ("a", "b"), "CheckStatus": "INFO"}}}, trusted=True)
+
+        _check_run(child_connection, mocked_check, {})
+        actual = _receive_result(parent_connection)
+
+        self.assertEqual(
+            {"CheckResult": {"1": {"CheckResult": ["a", "b"], "CheckStatus": "INFO"}}},
+            actual.result_tree)
+
+    def test__check_run_closes_stored_results(self):
+        parent_connection, child_connection = Pipe(duplex=False)
+        mocked_check = MagicMock()
+        mocked_check.run.side_effect = lambda data: CheckSummary(result_tree=data["dependency_check"])
+
+        with ResultStore() as store:
+            store.put("dependency_check", _RESULT_TREE)
+            stored_results = pickle.loads(pickle.dumps(store.view(["dependency_check"])))
+            with patch.object(stored_results, "close", wraps=stored_results.close) as mocked_close:
+                _check_run(child_connection, mocked_check, stored_results)
+
+        mocked_close.assert_called_once_with()
+        self.assertEqual(_RESULT_TREE, _receive_result(parent_connection).result_tree)
+
+    def test__check_run_closes_stored_results_if_check_raises_exception(self):
+        parent_connection, child_connection = Pipe(duplex=False)
+        mocked_check = MagicMock()
+        mocked_check.run.side_effect = Exception()
+        stored_results = MagicMock(spec=StoredResults)
+
+        _check_run(child_connection, mocked_check, stored_results)
+
+        stored_results.close.assert_called_once_with()
+        self.assertIsInstance(_receive_result(parent_connection), Exception)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+# NOTE: workaround to import modules
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
+
+import tempfile  # noqa: E402
+import unittest  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from modules.check.check_static_py import get_static_metadata  # noqa: E402
+from modules.check.check import CheckMetadataPy  # noqa: E402
+
+
+static_checker = """
+import tempfile
+
+CHECK_NAME = "static_check"
+TEMP_FOLDER = tempfile.mkdtemp()
+
+
+def run_static_check(data):
+    pass
+
+
+def get_api_version() -> str:
+    '''Return API version.'''
+    return "0.2"
+
+
+def get_check_list():
+    someCheck = CheckMetadataPy(
+        name=CHECK_NAME,
+        type="Data",
+        groups="default",
+        descr="Static check.",
+        dataReq="{}",
+        merit=10,
+        timeout=5,
+        version=1,
+        run="run_static_check",
+        cache_ttl=60
+    )
+    return [someCheck, CheckMetadataPy("second_check", "Data", "gpu", "Second check.", "{}", 0, 1, 2, "run")]
+"""
+
+dynamic_checker = """
+def get_api_version() -> str:
+    return "0.2"
+
+
+def get_check_list():
+    return [CheckMetadataPy(name=make_name(), type="Data", groups="default", descr="", dataReq="{}",
+                            merit=0, timeout=1, version=1, run="run")]
+"""
+
+
+class TestGetStaticMetadata(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checker_path = Path(self.temp_dir.name) / "checker.py"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_static_metadata_literal_checker(self):
+        self.checker_path.write_text(static_checker)
+        expected = ("0.2", [
+            CheckMetadataPy(
+                name="static_check", type="Data", groups="default", descr="Static check.", dataReq="{}",
+                merit=10, timeout=5, version=1, run="run_static_check", cache_ttl=60),
+            CheckMetadataPy(
+                name="second_check", type="Data", groups="gpu", descr="Second check.", dataReq="{}",
+                merit=0, timeout=1, version=2, run="run")
+        ])
+
+        actual = get_static_metadata(self.checker_path)
+
+        self.assertEqual(expected[0], actual[0])
+        self.assertEqual([vars(metadata) for metadata in expected[1]],
+                         [vars(metadata) for metadata in actual[1]])
+
+    def test_get_static_metadata_returns_none_for_non_literal_checker(self):
+        self.checker_path.write_text(dynamic_checker)
+
+        actual = get_static_metadata(self.checker_path)
+
+        self.assertIsNone(actual)
+
+    def test_get_static_metadata_returns_none_for_syntax_error(self):
+        self.checker_path.write_text("def get_check_list(:\n")
+
+        actual = get_static_metadata(self.checker_path)
+
+        self.assertIsNone(actual)
+
+    def test_get_static_metadata_returns_none_for_missing_file(self):
+        actual = get_static_metadata(self.checker_path)
+
+        self.assertIsNone(actual)
+
+    def test_get_static_metadata_returns_none_for_reassigned_constant(self):
+        self.checker_path.write_text(
+            static_checker + "\nCHECK_NAME = \"other_name\"\n")
+
+        actual = get_static_metadata(self.checker_path)
+
+        self.assertIsNone(actual)
+
+    def test_get_static_metadata_returns_none_for_constant_rebound_in_block(self):
+        rebindings = [
+            "if sys.platform == \"linux\":\n    CHECK_NAME = \"other_name\"\n",
+            "try:\n    pass\nexcept ImportError as CHECK_NAME:\n    pass\n",
+            "for CHECK_NAME in []:\n    pass\n",
+            "with open(__file__) as CHECK_NAME:\n    pass\n",
+            "from os import path as CHECK_NAME\n",
+            "def rename():\n    global CHECK_NAME\n    CHECK_NAME = \"other_name\"\n",
+            "from os import *\n"
+        ]
+        for rebinding in rebindings:
+            with self.subTest(rebinding=rebinding):
+                self.checker_path.write_text(static_checker + "\n" + rebinding)
+
+                actual = get_static_metadata(self.checker_path)
+
+                self.assertIsNone(actual)
+
+    def test_get_static_metadata_ignores_local_names(self):
+        self.checker_path.write_text(
+            static_checker + "\n\ndef get_name():\n    CHECK_NAME = \"local_name\"\n    return CHECK_NAME\n")
+
+        actual = get_static_metadata(self.checker_path)
+
+        self.assertEqual("static_check", actual[1][0].name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+# NOTE: workaround to import modules
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
+
+import unittest  # noqa: E402
+
+from modules.check.result_path import ResultPathError, compile_result_path  # noqa: E402
+
+
+def _device(name):
+    return {
+        "CheckResult": {"Device name": {"CheckResult": name, "CheckStatus": "INFO"}},
+        "CheckStatus": "INFO"
+    }
+
+
+DATA = {
+    "gpu_backend_check": {
+        "CheckResult": {
+            "Driver is loaded.": {"CheckResult": "", "CheckStatus": "PASS"},
+            "Driver information": {
+                "CheckResult": {
+                    "Installed driver number": {"CheckResult": "2", "CheckStatus": "INFO"},
+                    "Driver # 0": {"CheckResult": {
+                        "Device # 0": _device("GPU 0"),
+                        "Device # 1": _device("GPU 1")
+                    }},
+                    "Driver # 1": {"CheckResult": {
+                        "Device # 0": _device("GPU 2")
+                    }},
+                    "Broken driver": {"CheckResult": "Not a dict"}
+                },
+                "CheckStatus": "INFO"
+            }
+        },
+        "CheckStatus": "PASS"
+    }
+}
+
+
+class TestResultPath(unittest.TestCase):
+
+    def test_get_returns_value_of_node(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Installed driver number")
+
+        self.assertEqual("2", path.get(DATA))
+        self.assertEqual("INFO", path.get(DATA, field="CheckStatus"))
+
+    def test_get_converts_value_to_type(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Installed driver number")
+
+        self.assertEqual(2, path.get(DATA, value_type=int))
+
+    def test_get_returns_default_when_value_is_not_converted(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Driver # 0.Device # 0.Device name")
+
+        self.assertEqual(0, path.get(DATA, default=0, value_type=int))
+
+    def test_get_returns_default_when_node_is_not_found(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Driver # 2.Device # 0")
+
+        self.assertIsNone(path.get(DATA, default=None))
+
+    def test_get_raise_error_with_missing_node(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Driver # 2.Device # 0")
+
+        with self.assertRaises(ResultPathError) as context:
+            path.get(DATA)
+        self.assertIn("'Driver # 2'", str(context.exception))
+        self.assertIsInstance(context.exception, KeyError)
+
+    def test_get_raise_error_with_missing_field(self):
+        path = compile_result_path("gpu_backend_check.Driver information")
+
+        with self.assertRaises(ResultPathError):
+            path.get(DATA, field="Message")
+
+    def test_get_does_not_go_through_values(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Broken driver.Device # 0")
+
+        self.assertIsNone(path.get(DATA, default=None))
+
+    def test_escaped_dot_is_part_of_name(self):
+        path = compile_result_path("gpu_backend_check.Driver is loaded\\.")
+
+        self.assertEqual("PASS", path.get(DATA, field="CheckStatus"))
+
+    def test_find_with_wildcards_returns_all_siblings(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Driver # *.Device # *.Device name")
+
+        actual = [(captures, node["CheckResult"]) for captures, node in path.find(DATA)]
+
+        self.assertEqual([(("0", "0"), "GPU 0"), (("0", "1"), "GPU 1"), (("1", "0"), "GPU 2")], actual)
+
+    def test_get_with_wildcards_returns_first_node(self):
+        path = compile_result_path("gpu_backend_check.Driver information.Driver # *.Device # *.Device name")
+
+        self.assertEqual("GPU 0", path.get(DATA))
+
+    def test_path_relative_to_node(self):
+        driver = compile_result_path("gpu_backend_check.Driver information.Driver # 1").get(DATA)
+
+        self.assertEqual("GPU 2", compile_result_path("Device # 0.Device name").get(driver))
+
+    def test_compiled_path_is_cached(self):
+        self.assertIs(compile_result_path("gpu_backend_check"), compile_result_path("gpu_backend_check"))
+
+    def test_raise_error_with_empty_name(self):
+        with self.assertRaises(ValueError):
+            compile_result_path("gpu_backend_check..Driver information")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+# NOTE: workaround to import modules
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../'))
+
+import pickle  # noqa: E402
+import tempfile  # noqa: E402
+import unittest  # noqa: E402
+from unittest.mock import patch  # noqa: E402
+
+from modules.check.result_path import compile_result_path  # noqa: E402
+from modules.check.result_store import ResultStore, StoredResults  # noqa: E402
+
+
+GPU_RESULT = {"CheckResult": {"GPU": {"CheckResult": "Found", "CheckStatus": "PASS"}}}
+CPU_RESULT = {"CheckResult": {"CPU": {"CheckResult": "Found", "CheckStatus": "INFO"}}}
+
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.store = ResultStore(self.folder.name)
+        self.store.put("gpu_check", GPU_RESULT)
+        self.store.put("cpu_check", CPU_RESULT)
+
+    def tearDown(self):
+        self.store.close()
+        self.folder.cleanup()
+
+    def test_view_returns_results_of_dependencies(self):
+        actual = self.store.view({"gpu_check"})
+
+        self.assertEqual({"gpu_check": GPU_RESULT}, actual)
+        self.assertIs(GPU_RESULT, actual["gpu_check"])
+
+    def test_pickled_view_reads_results_from_file(self):
+        actual = pickle.loads(pickle.dumps(self.store.view(["gpu_check", "cpu_check"])))
+
+        self.assertEqual({"gpu_check": GPU_RESULT, "cpu_check": CPU_RESULT}, dict(actual))
+        self.assertIsNot(GPU_RESULT, actual["gpu_check"])
+        actual.close()
+
+    def test_pickled_view_does_not_contain_results(self):
+        payload = pickle.dumps(self.store.view(["gpu_check"]))
+
+        self.assertNotIn(b"Found", payload)
+
+    def test_pickled_view_loads_only_accessed_results(self):
+        stored_results = pickle.loads(pickle.dumps(self.store.view(["gpu_check", "cpu_check"])))
+
+        with patch("modules.check.result_store.pickle.loads", wraps=pickle.loads) as mocked_loads:
+            stored_results["gpu_check"]
+            stored_results["gpu_check"]
+
+        mocked_loads.assert_called_once()
+        stored_results.close()
+
+    def test_result_path_is_evaluated_against_view(self):
+        stored_results = pickle.loads(pickle.dumps(self.store.view(["gpu_check"])))
+
+        actual = compile_result_path("gpu_check.GPU").get(stored_results, field="CheckStatus")
+
+        self.assertEqual("PASS", actual)
+        stored_results.close()
+
+    def test_view_raise_error_with_missing_result(self):
+        stored_results = self.store.view(["gpu_check", "unknown_check"])
+
+        self.assertNotIn("unknown_check", stored_results)
+        with self.assertRaises(KeyError):
+            stored_results["unknown_check"]
+
+    def test_results_are_sent_as_is_when_file_is_not_written(self):
+        with patch("modules.check.result_store.tempfile.mkstemp", side_effect=OSError("No space left")):
+            store = ResultStore()
+        store.put("gpu_check", GPU_RESULT)
+
+        actual = pickle.loads(pickle.dumps(store.view(["gpu_check"])))
+
+        self.assertEqual({"gpu_check": GPU_RESULT}, actual)
+        store.close()
+
+    def test_close_removes_file(self):
+        path = self.store.path
+
+        self.store.close()
+
+        self.assertFalse(os.path.exists(path))
+        self.assertIsInstance(self.store.view(["gpu_check"]), StoredResults)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,14 +16,15 @@ from hashlib import sha384
 from urllib import request
 from urllib.error import URLError
 from pathlib import Path
-from itertools import filterfalse
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 
-from modules.check import BaseCheck
+from modules import bundle
+from modules.check import BaseCheck, CheckRegistry
 from modules.files_helper import get_json_content_from_file
 from modules.printing.printer import print_ex
 
-DEFAULT_DATABASES_FOLDER = Path(__file__).parent.parent.resolve() / "databases"
+# Databases are extracted if the utility is run from a zipapp bundle
+DEFAULT_DATABASES_FOLDER = bundle.get_filesystem_path(Path(__file__).parent.parent.resolve() / "databases")
 DOWNLOADED_DATABASES_FOLDER = Path.home() / "intel" / "diagnostics" / "databases"
 
 
@@ -56,16 +57,11 @@ def _download_metadata(available_resource: str) -> Optional[Dict]:
     return content
 
 
-def _is_db_compatible_with_checks(db_info: Dict, checks: List[BaseCheck]) -> bool:
+def _is_db_compatible_with_checks(db_info: Dict, checks: CheckRegistry) -> bool:
     is_db_compatible_with_checks = True
-    check_compatibility = list(filterfalse(
-        lambda x: not list(set(db_info["compatibility"].keys() & set([x.get_metadata().name]))),
-        checks
-    ))
-
-    for check in check_compatibility:
-        check_name, check_version = check.get_metadata().name, check.get_metadata().version
-        if check_version not in db_info["compatibility"][check_name]:
+    for check_name, compatible_versions in db_info["compatibility"].items():
+        check = checks.get(check_name)
+        if check is not None and check.get_metadata().version not in compatible_versions:
             is_db_compatible_with_checks = False
             break
 
@@ -73,7 +69,7 @@ def _is_db_compatible_with_checks(db_info: Dict, checks: List[BaseCheck]) -> boo
 
 
 def _check_updates(
-        default_metadata: Dict, downloaded_metadata: Dict, all_checks: List[BaseCheck]) -> Dict:
+        default_metadata: Dict, downloaded_metadata: Dict, all_checks: CheckRegistry) -> Dict:
     result: Dict = {}
     for db_type, db_list in default_metadata["databases"].items():
         if db_type not in downloaded_metadata["databases"]:
@@ -100,7 +96,10 @@ def _get_metadata_of_all_installed_databases() -> Dict:
     return result
 
 
-def are_database_updates_available(all_checks: List[BaseCheck]) -> Tuple[Optional[str], Dict, Dict]:
+def are_database_updates_available(
+        all_checks: Union[CheckRegistry, List[BaseCheck]]) -> Tuple[Optional[str], Dict, Dict]:
+    if not isinstance(all_checks, CheckRegistry):
+        all_checks = CheckRegistry(all_checks)
     DOWNLOADED_DATABASES_FOLDER.mkdir(parents=True, exist_ok=True)
 
     default_metadata_content = _get_metadata_of_all_installed_databases()
@@ -124,7 +123,7 @@ def are_database_updates_available(all_checks: List[BaseCheck]) -> Tuple[Optiona
     return available_resource, downloaded_metadata_content, newer_databases
 
 
-def update_databases(loaded_checks: List[BaseCheck]):
+def update_databases(loaded_checks: Union[CheckRegistry, List[BaseCheck]]):
     resource, metadata, databases = are_database_updates_available(loaded_checks)
     if resource is None:
         return
@@ -15,9 +15,10 @@ import platform
 
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, Optional, Set, TextIO, Tuple
 
-from modules.check import BaseCheck
+from modules import bundle
+from modules.check import BaseCheck, CheckSummary, ERROR_CODE_TO_STATUS
 
 
 def is_file_exist(path: Path) -> None:
@@ -69,7 +70,18 @@ def get_checks_to_run_from_config_data(config_data: Dict) -> Set[str]:
 def get_files_list_from_folder(path_to_folder: Path) -> List[Path]:
     if path_to_folder.exists():
         return list(path_to_folder.iterdir())
-    return []
+    return bundle.list_folder(path_to_folder)
+
+
+def get_resource_usage(summary: CheckSummary) -> Optional[Dict]:
+    if summary.duration is None:
+        return None
+    return {
+        "WallTime": summary.duration,
+        "UserTime": summary.user_time,
+        "SystemTime": summary.system_time,
+        "MaxRSS": summary.max_rss
+    }
 
 
 def save_json_output_file(checks: List[BaseCheck], file: Path, print_json: bool) -> None:
@@ -78,18 +90,38 @@ def save_json_output_file(checks: List[BaseCheck], file: Path, print_json: bool)
     # Save into json file
     json_output = {}
     for check in checks:
-        try:
-            if check.get_summary() is None:
-                continue
-            json_output[check.get_metadata().name] = json.loads(check.get_summary().result)
-        except ValueError:  # includes simplejson.decoder.JSONDecodeError
-            print("Decoding JSON has failed\n\n")
+        summary = check.get_summary()
+        if summary is None:
             continue
+        # The result tree is shared with the summary, so it is copied before adding new keys
+        json_output[check.get_metadata().name] = dict(summary.result_tree)
+        resource_usage = get_resource_usage(summary)
+        if resource_usage is not None:
+            json_output[check.get_metadata().name]["ResourceUsage"] = resource_usage
     if file:
         with open(file, 'w') as outfile:
             json.dump(json_output, outfile, indent=4)
     if print_json:
-        print(json_output)
+        print(json.dumps(json_output, indent=4))
+
+
+def write_json_stream_record(check: BaseCheck, stream: TextIO) -> None:
+    """Write the result of the completed check as one line of JSON and flush it to the stream."""
+    metadata = check.get_metadata()
+    summary = check.get_summary()
+    record = {
+        "name": metadata.name,
+        "version": metadata.version,
+        "status": ERROR_CODE_TO_STATUS.get(summary.error_code, "ERROR") if summary.skip_reason is None
+        else f"SKIPPED({summary.skip_reason})",
+        "duration": summary.duration,
+        "user_time": summary.user_time,
+        "system_time": summary.system_time,
+        "max_rss": summary.max_rss,
+        "result": summary.result_tree
+    }
+    stream.write(json.dumps(record) + "\n")
+    stream.flush()
 
 
 def _args_string(args) -> str:
@@ -15,6 +15,20 @@ import argparse
 from pathlib import Path
 
 
+def _positive_int(value: str) -> int:
+    result = int(value)
+    if result < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer.")
+    return result
+
+
+def _positive_float(value: str) -> float:
+    result = float(value)
+    if result <= 0:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive number.")
+    return result
+
+
 def create_parser(version: str):
     parser = argparse.ArgumentParser(
         formatter_class=argparse.RawTextHelpFormatter,
@@ -62,6 +76,7 @@ def create_parser(version: str):
     group_check_run = parser.add_mutually_exclusive_group()
     group_output_format = parser.add_mutually_exclusive_group()
     group_update_format = parser.add_mutually_exclusive_group()
+    group_cache = parser.add_mutually_exclusive_group()
     group_check_run.add_argument(
         "--select",
         nargs="+",
@@ -110,6 +125,49 @@ def create_parser(version: str):
              "using the environment variable DIAGUTIL_PATH. Paths from this environment are an additional\n"
              "way to load checks."
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        metavar="N",
+        default=1,
+        help="Run up to N independent checks at the same time.\n"
+             "Checks that depend on results of other checks are started\n"
+             "as soon as their dependencies are completed."
+    )
+    parser.add_argument(
+        "--worker_pool",
+        action="store_true",
+        help="Reuse a pool of worker processes to run checks instead of a new process per check.\n"
+             "Checks share the state of the worker process, so use it only with checks that\n"
+             "do not change the global state of the process."
+    )
+    parser.add_argument(
+        "--budget",
+        type=_positive_float,
+        metavar="SECONDS",
+        default=None,
+        help="Limit the total run time of checks to SECONDS.\n"
+             "Checks with higher merit and their dependencies are run first. Checks that cannot\n"
+             "finish in the remaining time according to their timeout or previous durations\n"
+             "are skipped and reported as SKIPPED(budget)."
+    )
+    parser.add_argument(
+        "--fail_fast",
+        action="store_true",
+        help="Stop starting new checks after the first check with the FAIL or ERROR status.\n"
+             "Checks that were not started are reported as SKIPPED(fail_fast)."
+    )
+    group_cache.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Do not use cached results and metadata of checks and do not save them to the cache."
+    )
+    group_cache.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Run all checks without using cached results and metadata of checks\n"
+             "and save new ones to the cache."
+    )
     parser.add_argument(
         "--force",
         action="store_true",
@@ -137,8 +195,17 @@ def create_parser(version: str):
         action="help",
         help="Show this help message and exit.",
         default=argparse.SUPPRESS)
-    parser.add_argument(
+    group_json_format = parser.add_mutually_exclusive_group()
+    group_json_format.add_argument(
         "-j", "--json",
         action="store_true",
         help="Print json onto STDOUT.")
+    group_json_format.add_argument(
+        "--ndjson",
+        nargs="?",
+        const="-",
+        metavar="PATH_TO_NDJSON",
+        help="Write the result of each check as a separate line of JSON as soon as the check\n"
+             "is completed. Each line contains the name, version, status, duration and result\n"
+             "of the check. Results are written onto STDOUT if the path is not specified.")
     return parser
@@ -9,6 +9,27 @@
 #
 # *******************************************************************************/
 
-from .check_printer import print_summary
-from .check_table_printer import print_metadata
-from .epilog_printer import print_epilog
+# Printers are imported on the first access to their names
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .check_printer import print_summary  # noqa: F401
+    from .check_table_printer import print_metadata  # noqa: F401
+    from .epilog_printer import print_epilog  # noqa: F401
+
+_LAZY_ATTRIBUTES = {
+    "print_summary": ".check_printer",
+    "print_metadata": ".check_table_printer",
+    "print_epilog": ".epilog_printer",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -10,7 +10,6 @@
 # *******************************************************************************/
 
 import shutil
-import json
 import logging
 import itertools
 
@@ -20,7 +19,7 @@ from typing import Dict, List, Optional
 
 from modules.printing.printer_helper import Colors
 from modules.printing.printer import print_ex
-from modules.check.check import BaseCheck
+from modules.check.check import BaseCheck, CheckSummary
 
 
 PREFIX_KEY_IN = '\u251C' + '\u2500'
@@ -326,24 +325,37 @@ class CheckSummaryPrinter:
                         Colors.Red, depth, out+[current_out])
 
 
-def _verbosity_processing(summary: Dict, required_verbosity: int, parent_verbosity: Optional[int] = None):
-    del_keys = []
+def _verbosity_processing(
+        summary: Dict, required_verbosity: int, parent_verbosity: Optional[int] = None) -> Dict:
+    """Return a copy of the summary without nodes above the required verbosity, the summary is not changed."""
+    processed_summary = {}
     for key, data in summary.items():
         result_verbosity = 0 if 'Verbosity' not in data or data['Verbosity'] == '' \
             else data['Verbosity']
-        if required_verbosity < 3:
-            if "Command" in data:
-                del data["Command"]
         if parent_verbosity is not None and result_verbosity < parent_verbosity:
             result_verbosity = parent_verbosity
             logging.warning(
                 "The verbosity level of the subtree is less than the verbosity level of the higher node.")
-        if isinstance(data['CheckResult'], dict) and result_verbosity <= required_verbosity:
-            _verbosity_processing(data['CheckResult'], required_verbosity, parent_verbosity=result_verbosity)
         if result_verbosity > required_verbosity:
-            del_keys.append(key)
-    for key in del_keys:
-        del summary[key]
+            continue
+        processed_data = dict(data)
+        if required_verbosity < 3:
+            processed_data.pop("Command", None)
+        if isinstance(data['CheckResult'], dict):
+            processed_data['CheckResult'] = _verbosity_processing(
+                data['CheckResult'], required_verbosity, parent_verbosity=result_verbosity)
+        processed_summary[key] = processed_data
+    return processed_summary
+
+
+def _format_resource_usage(summary: CheckSummary) -> str:
+    def format_time(value: Optional[float]) -> str:
+        return f"{value:.2f} s" if value is not None else "n/a"
+
+    max_rss = f"{summary.max_rss} KB" if summary.max_rss is not None else "n/a"
+    return f"Resource usage: wall time {format_time(summary.duration)}, " \
+           f"user time {format_time(summary.user_time)}, " \
+           f"system time {format_time(summary.system_time)}, max RSS {max_rss}"
 
 
 def print_full_summary(
@@ -358,16 +370,19 @@ def print_full_summary(
         print_ex("=" * max(CONSOLE_MIN, shutil.get_terminal_size().columns), output_file)
         print_ex(f"Check name: {metadata.name}", output_file)
         print_ex(f"Description: {metadata.descr}", output_file)
+        if summary.duration is not None:
+            print_ex(_format_resource_usage(summary), output_file)
         print_ex("=" * max(CONSOLE_MIN, shutil.get_terminal_size().columns), output_file)
         print_ex("", output_file)
 
         try:
-            summary_result = json.loads(summary.result)
+            summary_result = dict(summary.result_tree)
             examine_summary = examine_data[metadata.name]['CheckResult'] if examine_data is not None \
                 else None
             if len(summary_result) == 0:
                 raise ValueError
-            _verbosity_processing(summary_result['CheckResult'], required_verbosity)
+            summary_result['CheckResult'] = _verbosity_processing(
+                summary_result['CheckResult'], required_verbosity)
             check_printer = CheckSummaryPrinter(summary_result, output_file)
             check_printer.print_summary_tree(summary_result['CheckResult'], examine_summary=examine_summary)
 
@@ -393,6 +408,7 @@ def print_short_summary(
     checks_fail = 0
     checks_error = 0
     checks_warning = 0
+    checks_skipped = 0
     for check in checks:
         metadata = check.get_metadata()
         summary = check.get_summary()
@@ -404,7 +420,11 @@ def print_short_summary(
         result_status = ""
         result_color = ""
 
-        if summary.error_code == 0:
+        if summary.skip_reason is not None:
+            checks_skipped += 1
+            result_status = f"SKIPPED({summary.skip_reason})"
+            result_color = Colors.Yellow
+        elif summary.error_code == 0:
             checks_pass += 1
             result_status = "PASS"
             result_color = Colors.Green
@@ -428,8 +448,9 @@ def print_short_summary(
         print_ex(f"{result_status}", output_file, color=result_color)
 
         try:
-            summary_result = json.loads(summary.result)
-            result_messages = _get_status_message(summary_result["CheckResult"], result_status)
+            summary_result = summary.result_tree
+            message_status = "INFO" if summary.skip_reason is not None else result_status
+            result_messages = _get_status_message(summary_result["CheckResult"], message_status)
             if len(result_messages) != 0:
                 for message in result_messages:
                     print_ex(message, output_file, color=result_color)
@@ -450,7 +471,12 @@ def print_short_summary(
     print_ex(f"{checks_warning}", output_file, end=" ")
     print_ex(f"WARNING{plural_suffix_war}", output_file, color=Colors.Yellow, end=", ")
     print_ex(f"{checks_error}", output_file, end=" ")
-    print_ex(f"ERROR{plural_suffix_err}", output_file, color=Colors.Red)
+    if checks_skipped == 0:
+        print_ex(f"ERROR{plural_suffix_err}", output_file, color=Colors.Red)
+    else:
+        print_ex(f"ERROR{plural_suffix_err}", output_file, color=Colors.Red, end=", ")
+        print_ex(f"{checks_skipped}", output_file, end=" ")
+        print_ex("SKIPPED", output_file, color=Colors.Yellow)
 
 
 def print_summary(
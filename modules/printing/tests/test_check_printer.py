@@ -21,7 +21,7 @@ from json import dumps  # noqa: E402
 from copy import deepcopy  # noqa: E402
 from io import StringIO  # noqa: E402
 from os import terminal_size  # noqa: E402
-from unittest.mock import patch  # noqa: E402
+from unittest.mock import PropertyMock, patch  # noqa: E402
 
 from modules.check.check import BaseCheck, CheckMetadataPy, \
     CheckSummary  # noqa: E402
@@ -656,8 +656,7 @@ class TestVerbosityProcessing(unittest.TestCase):
 
     def test__verbosity_processing_no_delete_positive(self):
         expected_processed_summary = self.summary
-        real_processed_summary = deepcopy(self.summary)
-        _verbosity_processing(real_processed_summary, 5)
+        real_processed_summary = _verbosity_processing(self.summary, 5)
         self.assertEqual(expected_processed_summary, real_processed_summary)
 
     def test__verbosity_processing_positive(self):
@@ -686,9 +685,10 @@ class TestVerbosityProcessing(unittest.TestCase):
                 }
             }
         }
-        real_processed_summary = deepcopy(self.summary)
-        _verbosity_processing(real_processed_summary, 2)
+        original_summary = deepcopy(self.summary)
+        real_processed_summary = _verbosity_processing(self.summary, 2)
         self.assertEqual(expected_processed_summary, real_processed_summary)
+        self.assertEqual(original_summary, self.summary)
 
 
 class TestStatusMessage(unittest.TestCase):
@@ -771,6 +771,23 @@ class TestPrintFullSummary(BasePrintSummary):
             print_full_summary(self.check_list, 5, None)
             self.assertEqual(stdout.getvalue(), expected_stdout)
 
+    @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
+    @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
+    def test_print_full_summary_resource_usage_positive(
+            self,
+            mock_get_terminal_size,
+            mocked_print_ex):
+        summary = self.check_list[0].get_summary()
+        summary.duration = 1.5
+        summary.user_time = 0.5
+        summary.system_time = None
+        summary.max_rss = 1024
+        expected_line = "Resource usage: wall time 1.50 s, user time 0.50 s, system time n/a, " \
+                        "max RSS 1024 KB\n"
+        with patch('sys.stdout', new=StringIO()) as stdout:
+            print_full_summary(self.check_list, 5, None)
+            self.assertIn(expected_line, stdout.getvalue())
+
     @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
     @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
     def test_print_full_summary_none_positive(
@@ -784,7 +801,7 @@ class TestPrintFullSummary(BasePrintSummary):
 
     @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
     @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
-    @patch("json.loads", return_value={})
+    @patch("modules.check.check.CheckSummary.result_tree", new_callable=PropertyMock, return_value={})
     def test_print_full_summary_empty_summary_positive(
             self, mock_loads,
             mock_get_terminal_size,
@@ -802,7 +819,7 @@ class TestPrintFullSummary(BasePrintSummary):
 
     @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
     @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
-    @patch("json.loads", return_value={"a": 1})
+    @patch("modules.check.check.CheckSummary.result_tree", new_callable=PropertyMock, return_value={"a": 1})
     def test_print_full_summary_incorrect_summary_positive(
             self,
             mock_loads,
@@ -856,6 +873,35 @@ class TestPrintShortSummary(BasePrintSummary):
             print_short_summary(self.check_list, None)
             self.assertEqual(stdout.getvalue(), expected_stdout)
 
+    @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
+    @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
+    def test_print_short_summary_skipped_positive(
+            self,
+            mock_get_terminal_size,
+            mocked_print_ex):
+        summary = CheckSummary(result=dumps({
+            "CheckResult": {
+                "name_of_check": {
+                    "CheckResult": "SKIPPED(budget)",
+                    "Message": "Skipped.",
+                    "CheckStatus": "INFO"
+                }
+            }
+        }))
+        summary.skip_reason = "budget"
+        self.check_list[0].set_summary(summary)
+        expected_stdout = "============================================================\n" + \
+                          "Check name: name_of_check\n" + \
+                          "Description: description\n" + \
+                          f"Result status: {Colors.Yellow}SKIPPED(budget){Colors.Default}\n" + \
+                          f"{Colors.Yellow}Skipped.{Colors.Default}\n" + \
+                          "============================================================\n" + \
+                          "\n" + \
+                          f"1 CHECK: 0 {Colors.Green}PASS{Colors.Default}, 0 {Colors.Red}FAIL{Colors.Default}, 0 {Colors.Yellow}WARNINGS{Colors.Default}, 0 {Colors.Red}ERRORS{Colors.Default}, 1 {Colors.Yellow}SKIPPED{Colors.Default}\n"  # noqa: E501
+        with patch('sys.stdout', new=StringIO()) as stdout:
+            print_short_summary(self.check_list, None)
+            self.assertEqual(stdout.getvalue(), expected_stdout)
+
     @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
     @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
     def test_print_short_summary_none_positive(
@@ -869,7 +915,7 @@ class TestPrintShortSummary(BasePrintSummary):
 
     @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
     @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
-    @patch("json.loads", return_value={})
+    @patch("modules.check.check.CheckSummary.result_tree", new_callable=PropertyMock, return_value={})
     def test_print_short_summary_empty_summary_positive(
             self,
             mock_loads,
@@ -888,7 +934,7 @@ class TestPrintShortSummary(BasePrintSummary):
 
     @patch("modules.printing.check_printer.print_ex", side_effect=print_ex_mock)
     @patch("shutil.get_terminal_size", return_value=terminal_size((60, 0)))
-    @patch("json.loads", return_value={"a": 1})
+    @patch("modules.check.check.CheckSummary.result_tree", new_callable=PropertyMock, return_value={"a": 1})
     def test_print_short_summary_incorrect_summary_positive(
             self,
             mock_loads,
@@ -9,10 +9,9 @@
 #
 # *******************************************************************************/
 
-from itertools import filterfalse
-from typing import List, Set
+from typing import List, Set, Union
 
-from modules.check import BaseCheck
+from modules.check import BaseCheck, CheckRegistry
 
 
 def process_select(selection: List[str]) -> Set[str]:
@@ -23,12 +22,7 @@ def process_select(selection: List[str]) -> Set[str]:
     return result
 
 
-def get_selected_checks(checks: List[BaseCheck], selection: List[str]) -> List[BaseCheck]:
-    if "all" in selection:
-        return checks
-    return list(filterfalse(
-        lambda x: not list(
-            set(selection) &
-            (set(x.get_metadata().groups.split(",")) | set([x.get_metadata().name]))),
-        checks
-    ))
+def get_selected_checks(
+        checks: Union[CheckRegistry, List[BaseCheck]], selection: List[str]) -> List[BaseCheck]:
+    registry = checks if isinstance(checks, CheckRegistry) else CheckRegistry(checks)
+    return registry.select(selection)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+# NOTE: workaround to import modules
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../'))
+
+import importlib.util  # noqa: E402
+import py_compile  # noqa: E402
+import subprocess  # noqa: E402
+import tempfile  # noqa: E402
+import unittest  # noqa: E402
+import zipfile  # noqa: E402
+from pathlib import Path  # noqa: E402
+from unittest.mock import patch  # noqa: E402
+
+from modules import bundle  # noqa: E402
+from tools.build_zipapp import build_zipapp  # noqa: E402
+
+
+CHECKER = """
+from pathlib import Path
+
+DATA_FOLDER = Path(__file__).parent / "data"
+
+
+def get_value():
+    return (DATA_FOLDER / "value.txt").read_text()
+"""
+
+
+class TestBundle(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        self.archive_path = self.folder / "diagnostics.pyz"
+        source_path = self.folder / "checker.py"
+        source_path.write_text(CHECKER)
+        py_compile.compile(str(source_path), cfile=str(self.folder / "checker.pyc"),
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        with zipfile.ZipFile(self.archive_path, "w") as archive:
+            archive.write(source_path, "checkers_py/checker.py")
+            archive.write(self.folder / "checker.pyc", "checkers_py/checker.pyc")
+            archive.writestr("checkers_py/data/value.txt", "value")
+            script = zipfile.ZipInfo("checkers_exe/checker.sh")
+            script.external_attr = 0o755 << 16
+            archive.writestr(script, "#!/bin/sh\n")
+        self.bundle = bundle._Bundle(self.archive_path, self.folder / "cache")
+        patcher = patch("modules.bundle._get_bundle", return_value=self.bundle)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.bundle.archive.close()
+        self.temp_dir.cleanup()
+
+    def test_exists(self):
+        self.assertTrue(bundle.exists(self.archive_path / "checkers_py" / "checker.py"))
+        self.assertTrue(bundle.exists(self.archive_path / "checkers_py" / "data"))
+        self.assertFalse(bundle.exists(self.archive_path / "checkers_py" / "missing.py"))
+
+    def test_list_folder(self):
+        expected = [
+            self.archive_path / "checkers_py" / "checker.py",
+            self.archive_path / "checkers_py" / "checker.pyc",
+            self.archive_path / "checkers_py" / "data"
+        ]
+
+        actual = bundle.list_folder(self.archive_path / "modules" / ".." / "checkers_py")
+
+        self.assertEqual(expected, actual)
+
+    def test_read_bytes(self):
+        actual = bundle.read_bytes(self.archive_path / "checkers_py" / "data" / "value.txt")
+
+        self.assertEqual(b"value", actual)
+
+    def test_read_bytes_not_in_bundle(self):
+        self.assertEqual(CHECKER.encode(), bundle.read_bytes(self.folder / "checker.py"))
+
+    def test_is_executable(self):
+        self.assertTrue(bundle.is_executable(self.archive_path / "checkers_exe" / "checker.sh"))
+        self.assertFalse(bundle.is_executable(self.archive_path / "checkers_py" / "checker.py"))
+
+    def test_get_filesystem_path_extracts_file(self):
+        actual = bundle.get_filesystem_path(self.archive_path / "checkers_exe" / "checker.sh")
+
+        self.assertTrue(str(actual).startswith(str(self.folder / "cache")))
+        self.assertEqual("#!/bin/sh\n", actual.read_text())
+        self.assertTrue(os.access(actual, os.X_OK))
+
+    def test_get_filesystem_path_not_in_bundle(self):
+        self.assertEqual(self.folder / "checker.py", bundle.get_filesystem_path(self.folder / "checker.py"))
+
+    def test_get_module_spec(self):
+        spec = bundle.get_module_spec("bundle_test_checker", self.archive_path / "checkers_py" / "checker.py")
+        module = importlib.util.module_from_spec(spec)
+
+        spec.loader.exec_module(module)
+
+        self.assertEqual("value", module.get_value())
+
+    def test_get_module_spec_compiles_source_with_bytecode_of_other_version(self):
+        path = self.archive_path / "checkers_py" / "checker.py"
+        pyc = bundle.read_bytes(path.with_suffix(".pyc"))
+        files = {path: CHECKER.encode(), path.with_suffix(".pyc"): b"\0\0\0\0" + pyc[4:]}
+
+        with patch("modules.bundle.read_bytes", side_effect=lambda file_path: files[file_path]), \
+             patch("modules.bundle.marshal.loads") as mocked_loads:
+            code = bundle._BundleLoader(path).get_code()
+
+        mocked_loads.assert_not_called()
+        self.assertEqual(str(path), code.co_filename)
+
+    def test_extract_resources_reuses_folder_extracted_by_other_process(self):
+        other_bundle = bundle._Bundle(self.archive_path, self.folder / "cache")
+        replace = os.replace
+
+        def extract_by_other_process(source, destination):
+            # The other process extracts the bundle while this process extracts it
+            mocked_replace.side_effect = replace
+            other_bundle.extract_resources()
+            replace(source, destination)
+
+        with patch("modules.bundle.os.replace", side_effect=extract_by_other_process) as mocked_replace:
+            actual = self.bundle.extract_resources()
+        other_bundle.archive.close()
+
+        self.assertEqual("#!/bin/sh\n", (actual / "checkers_exe" / "checker.sh").read_text())
+        self.assertEqual([actual.name], os.listdir(actual.parent))
+
+    def test_extract_resources_replaces_incomplete_folder(self):
+        self.bundle.extract_folder.mkdir(parents=True)
+        (self.bundle.extract_folder / "partial.so").write_text("")
+
+        actual = self.bundle.extract_resources()
+
+        self.assertFalse((actual / "partial.so").exists())
+        self.assertTrue((actual / ".extracted").exists())
+        self.assertEqual([actual.name], os.listdir(actual.parent))
+
+
+class TestBuildZipapp(unittest.TestCase):
+
+    def test_build_zipapp_version(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / "diagnostics.pyz"
+
+            build_zipapp(Path(__file__).resolve().parent.parent.parent, output)
+            process = subprocess.run([sys.executable, str(output), "--version"], stdout=subprocess.PIPE,
+                                     encoding="utf-8", check=True)
+
+            self.assertIn("Diagnostics Utility for oneAPI", process.stdout)
+            with zipfile.ZipFile(output) as archive:
+                self.assertIn("modules/check/check_loader.pyc", archive.namelist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,10 +16,13 @@ from pathlib import Path
 import sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../'))
 
+import io  # noqa: E402
+import json  # noqa: E402
 import unittest  # noqa: E402
 from unittest.mock import Mock, MagicMock, call, patch, mock_open  # noqa: E402
 
 from modules import files_helper  # noqa: E402
+from modules.check.check import CheckSummary  # noqa: E402
 
 
 class TestIsFileExist(unittest.TestCase):
@@ -185,6 +188,7 @@ class TestSaveJsonOutputFile(unittest.TestCase):
         mock_check_c_1_metadata.name = self.mock_check_c_1_name
         self.mock_check_c_1 = MagicMock()
         self.mock_check_c_1.get_metadata.return_value = mock_check_c_1_metadata
+        self.mock_check_c_1.get_summary.return_value.duration = None
 
         self.mock_check_c_2_name = "mocked_check_c_2"
         self.mock_check_c_2_result = {
@@ -199,11 +203,11 @@ class TestSaveJsonOutputFile(unittest.TestCase):
         mock_check_c_2_metadata.name = self.mock_check_c_2_name
         self.mock_check_c_2 = MagicMock()
         self.mock_check_c_2.get_metadata.return_value = mock_check_c_2_metadata
+        self.mock_check_c_2.get_summary.return_value.duration = None
 
     @patch("builtins.open", create=True)
-    @patch("json.loads")
     @patch("json.dump")
-    def test_save_json_output_file_positive(self, mocked_dump, mocked_loads, mocked_open):
+    def test_save_json_output_file_positive(self, mocked_dump, mocked_open):
         expected_output = {
             self.mock_check_c_1_name: self.mock_check_c_1_result,
             self.mock_check_c_2_name: self.mock_check_c_2_result
@@ -211,7 +215,8 @@ class TestSaveJsonOutputFile(unittest.TestCase):
 
         expected_file = MagicMock()
 
-        mocked_loads.side_effect = [self.mock_check_c_1_result, self.mock_check_c_2_result]
+        self.mock_check_c_1.get_summary.return_value.result_tree = self.mock_check_c_1_result
+        self.mock_check_c_2.get_summary.return_value.result_tree = self.mock_check_c_2_result
         mocked_open.return_value.__enter__.return_value = expected_file
 
         files_helper.save_json_output_file([self.mock_check_c_1, self.mock_check_c_2], MagicMock(), False)
@@ -219,24 +224,104 @@ class TestSaveJsonOutputFile(unittest.TestCase):
         mocked_dump.assert_called_once_with(expected_output, expected_file, indent=4)
 
     @patch("builtins.print")
-    @patch("builtins.open", create=True)
-    @patch("json.loads")
-    @patch("json.dump")
-    def test_save_json_output_file_loads_raise_exception(
-            self, mocked_dump, mocked_loads, mocked_open, mocked_print):
-        expected_output = {
-            self.mock_check_c_1_name: self.mock_check_c_1_result
-        }
+    def test_save_json_output_file_does_not_change_result_tree(self, mocked_print):
+        summary = CheckSummary(result_tree=self.mock_check_c_1_result)
+        summary.duration = 1.5
+        self.mock_check_c_1.get_summary.return_value = summary
 
-        expected_file = MagicMock()
+        files_helper.save_json_output_file([self.mock_check_c_1], None, True)
 
-        mocked_loads.side_effect = [self.mock_check_c_1_result, ValueError()]
-        mocked_open.return_value.__enter__.return_value = expected_file
+        actual = json.loads(mocked_print.call_args.args[0])
+        self.assertIn("ResourceUsage", actual[self.mock_check_c_1_name])
+        self.assertNotIn("ResourceUsage", summary.result_tree)
 
-        files_helper.save_json_output_file([self.mock_check_c_1, self.mock_check_c_2], MagicMock(), False)
+    @patch("builtins.print")
+    def test_save_json_output_file_print_json(self, mocked_print):
+        self.mock_check_c_1.get_summary.return_value.result_tree = self.mock_check_c_1_result
 
-        mocked_dump.assert_called_once_with(expected_output, expected_file, indent=4)
-        mocked_print.assert_called_once()
+        files_helper.save_json_output_file([self.mock_check_c_1], None, True)
+
+        actual = json.loads(mocked_print.call_args.args[0])
+        self.assertEqual({self.mock_check_c_1_name: self.mock_check_c_1_result}, actual)
+
+
+class TestGetResourceUsage(unittest.TestCase):
+
+    def test_get_resource_usage_not_measured(self):
+        summary = MagicMock()
+        summary.duration = None
+
+        self.assertIsNone(files_helper.get_resource_usage(summary))
+
+    def test_get_resource_usage_positive(self):
+        summary = MagicMock()
+        summary.duration = 1.5
+        summary.user_time = 0.5
+        summary.system_time = 0.25
+        summary.max_rss = 1024
+
+        expected = {"WallTime": 1.5, "UserTime": 0.5, "SystemTime": 0.25, "MaxRSS": 1024}
+
+        self.assertEqual(expected, files_helper.get_resource_usage(summary))
+
+
+class TestWriteJsonStreamRecord(unittest.TestCase):
+
+    def test_write_json_stream_record_positive(self):
+        result = {
+            "CheckResult": {
+                "Check 1": {
+                    "CheckStatus": "WARNING",
+                    "CheckResult": "Check 1 Value"
+                }
+            }
+        }
+        mocked_check = MagicMock()
+        mocked_check.get_metadata.return_value.name = "check"
+        mocked_check.get_metadata.return_value.version = 2
+        mocked_check.get_summary.return_value.error_code = 1
+        mocked_check.get_summary.return_value.duration = 0.5
+        mocked_check.get_summary.return_value.user_time = 0.25
+        mocked_check.get_summary.return_value.system_time = 0.125
+        mocked_check.get_summary.return_value.max_rss = 1024
+        mocked_check.get_summary.return_value.skip_reason = None
+        mocked_check.get_summary.return_value.result_tree = result
+        stream = io.StringIO()
+
+        files_helper.write_json_stream_record(mocked_check, stream)
+        files_helper.write_json_stream_record(mocked_check, stream)
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0]), {
+            "name": "check",
+            "version": 2,
+            "status": "WARNING",
+            "duration": 0.5,
+            "user_time": 0.25,
+            "system_time": 0.125,
+            "max_rss": 1024,
+            "result": result
+        })
+
+    def test_write_json_stream_record_skipped(self):
+        mocked_check = MagicMock()
+        mocked_check.get_metadata.return_value.name = "check"
+        mocked_check.get_metadata.return_value.version = 1
+        mocked_check.get_summary.return_value = CheckSummary(result=json.dumps({
+            "CheckResult": {
+                "check": {
+                    "CheckResult": "SKIPPED(budget)",
+                    "CheckStatus": "INFO"
+                }
+            }
+        }))
+        mocked_check.get_summary.return_value.skip_reason = "budget"
+        stream = io.StringIO()
+
+        files_helper.write_json_stream_record(mocked_check, stream)
+
+        self.assertEqual(json.loads(stream.getvalue())["status"], "SKIPPED(budget)")
 
 
 class TestConfigureOutputFiles(unittest.TestCase):
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+# NOTE: workaround to import modules
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../'))
+
+import subprocess  # noqa: E402
+import unittest  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Dict, List  # noqa: E402
+
+
+DIAGNOSTICS_PATH = Path(__file__).resolve().parent.parent.parent / "diagnostics.py"
+
+# Budget of the import time of `diagnostics.py --version` in seconds, the wall clock time depends on
+# the machine and its load, so the test is run only if the environment variable is set
+IMPORT_TIME_BUDGET = 0.075
+IMPORT_TIME_TEST_VARIABLE = "DIAGUTIL_TEST_IMPORT_TIME"
+
+# Modules that are not needed to print the version
+HEAVY_MODULES = [
+    "ctypes",
+    "multiprocessing",
+    "urllib.request",
+    "modules.check.check_loader",
+    "modules.check.check_runner",
+    "modules.db_downloader",
+    "modules.printing.check_printer",
+]
+
+
+def _get_import_times() -> Dict[str, int]:
+    """Return the cumulative import time in microseconds of modules imported by `diagnostics.py --version`."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", str(DIAGNOSTICS_PATH), "--version"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, encoding="utf-8", check=True)
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Modules imported by other modules are indented
+        import_times[name[1:]] = int(cumulative)
+    return import_times
+
+
+def _get_imported_heavy_modules() -> List[str]:
+    """Return the heavy modules that are in `sys.modules` after `import diagnostics` in a new interpreter."""
+    code = f"import sys, diagnostics; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    process = subprocess.run(
+        [sys.executable, "-c", code], cwd=str(DIAGNOSTICS_PATH.parent),
+        stdout=subprocess.PIPE, encoding="utf-8", check=True)
+    return [module for module in process.stdout.strip().split(",") if module]
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_does_not_import_heavy_modules(self):
+        self.assertEqual([], _get_imported_heavy_modules())
+
+    def test_version_does_not_import_heavy_modules(self):
+        import_times = _get_import_times()
+
+        for module in HEAVY_MODULES:
+            self.assertNotIn(module, [name.strip() for name in import_times])
+
+    @unittest.skipUnless(os.environ.get(IMPORT_TIME_TEST_VARIABLE), f"{IMPORT_TIME_TEST_VARIABLE} is not set")
+    def test_version_import_time_is_in_budget(self):
+        # The best of several runs is used to reduce the noise
+        import_time = min(
+            sum(time for name, time in _get_import_times().items() if not name.startswith(" "))
+            for _ in range(3)
+        ) / 1000000
+
+        self.assertLess(import_time, IMPORT_TIME_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
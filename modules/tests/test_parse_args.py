@@ -25,6 +25,34 @@ class TestCreateParser(unittest.TestCase):
     def test_create_parser_does_not_raise_exception(self):
         create_parser("2021.4.0")
 
+    def test_create_parser_jobs_default(self):
+        args = create_parser("2021.4.0").parse_args([])
+
+        self.assertEqual(args.jobs, 1)
+
+    def test_create_parser_worker_pool_is_disabled_by_default(self):
+        args = create_parser("2021.4.0").parse_args([])
+
+        self.assertFalse(args.worker_pool)
+
+    def test_create_parser_jobs_not_positive(self):
+        with self.assertRaises(SystemExit):
+            create_parser("2021.4.0").parse_args(["--jobs", "0"])
+
+    def test_create_parser_budget(self):
+        args = create_parser("2021.4.0").parse_args(["--budget", "2.5"])
+
+        self.assertEqual(args.budget, 2.5)
+
+    def test_create_parser_budget_not_positive(self):
+        with self.assertRaises(SystemExit):
+            create_parser("2021.4.0").parse_args(["--budget", "0"])
+
+    def test_create_parser_fail_fast(self):
+        args = create_parser("2021.4.0").parse_args(["--fail_fast"])
+
+        self.assertTrue(args.fail_fast)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# /*******************************************************************************
+# Copyright Intel Corporation.
+# This software and the related documents are Intel copyrighted materials, and your use of them
+# is governed by the express license under which they were provided to you (License).
+# Unless the License provides otherwise, you may not use, modify, copy, publish, distribute, disclose
+# or transmit this software or the related documents without Intel's prior written permission.
+# This software and the related documents are provided as is, with no express or implied warranties,
+# other than those that are expressly stated in the License.
+#
+# *******************************************************************************/
+
+"""
+Build a single file zipapp bundle of the utility.
+
+The bundle contains the modules, checkers and databases of the installed utility together with
+optimized bytecode compiled in advance, so the utility can be run from a read-only filesystem
+with one file to open: `python3 diagnostics.pyz --select gpu`.
+
+Usage: python3 tools/build_zipapp.py --source <install folder> --output diagnostics.pyz
+"""
+
+import argparse
+import py_compile
+import shutil
+import tempfile
+import zipapp
+
+from pathlib import Path
+
+
+# Files and folders of the installed utility that are put into the bundle
+BUNDLE_CONTENT = [
+    "diagnostics.py", "modules", "checkers_py", "checkers_c", "checkers_exe", "databases", "configs"
+]
+
+_IGNORED_PATTERNS = shutil.ignore_patterns("__pycache__", "*.pyc", "tests", "src", "CMakeLists.txt", "*.md")
+
+_MAIN = """import sys
+
+from diagnostics import main
+
+sys.exit(main())
+"""
+
+
+def _compile(staging_folder: Path) -> None:
+    for source_path in staging_folder.rglob("*.py"):
+        # The bytecode is placed next to the source file, where it is found by zipimport.
+        # Unchecked hash based .pyc files are used without comparing with the source file.
+        py_compile.compile(
+            str(source_path),
+            cfile=str(source_path.with_suffix(".pyc")),
+            dfile=source_path.relative_to(staging_folder).as_posix(),
+            doraise=True,
+            optimize=1,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+
+
+def build_zipapp(source: Path, output: Path, compressed: bool = True) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        staging_folder = Path(temp_dir) / "diagnostics"
+        staging_folder.mkdir()
+        for name in BUNDLE_CONTENT:
+            path = source / name
+            if path.is_dir():
+                shutil.copytree(path, staging_folder / name, ignore=_IGNORED_PATTERNS, symlinks=False)
+            elif path.is_file():
+                shutil.copy2(path, staging_folder / name)
+        if not (staging_folder / "diagnostics.py").exists():
+            raise ValueError(f"{source} does not contain diagnostics.py.")
+        (staging_folder / "__main__.py").write_text(_MAIN, encoding="utf-8")
+        _compile(staging_folder)
+        zipapp.create_archive(
+            staging_folder, output, interpreter="/usr/bin/env python3", compressed=compressed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build a zipapp bundle of the Diagnostics Utility for oneAPI.")
+    parser.add_argument("--source", type=Path, required=True,
+                        help="Folder of the installed utility, e.g. the install folder of the CMake build.")
+    parser.add_argument("--output", type=Path, default=Path("diagnostics.pyz"),
+                        help="Path to the bundle. Default: diagnostics.pyz")
+    parser.add_argument("--no_compression", action="store_true",
+                        help="Store files without compression, it makes start a bit faster.")
+    args = parser.parse_args()
+    build_zipapp(args.source, args.output, not args.no_compression)
+
+
+if __name__ == "__main__":
+    main()